@@ -27,7 +27,7 @@ __all__ = [
     "MACRO_REGIONS", "METRO_CLUSTERS", "EILAT_CODE",
     "classify_route",
     # Private — used by tests:
-    "_same_metro", "_LONG_PAIRS",
+    "_same_metro", "_LONG_PAIRS", "_region_pair_band", "_REGION_PAIR_BANDS",
 ]
 
 
@@ -45,7 +45,7 @@ FACTOR_INSIDE_METRO = 1.0
 FACTOR_OUTSIDE_METRO = 1.2
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RegionClassification:
     """Result of classifying a single geo point."""
 
@@ -61,15 +61,39 @@ class RegionClassification:
 def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Great-circle distance between two points in kilometres."""
     R = 6371.0  # Earth mean radius in km
-    dlat = math.radians(lat2 - lat1)
-    dlon = math.radians(lon2 - lon1)
+    sin_dlat = math.sin(math.radians(lat2 - lat1) / 2)
+    sin_dlon = math.sin(math.radians(lon2 - lon1) / 2)
     a = (
-        math.sin(dlat / 2) ** 2
+        sin_dlat * sin_dlat
         + math.cos(math.radians(lat1))
         * math.cos(math.radians(lat2))
-        * math.sin(dlon / 2) ** 2
+        * sin_dlon * sin_dlon
     )
-    return R * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    # asin(sqrt(a)) == atan2(sqrt(a), sqrt(1 - a)) for a in [0, 1], with
+    # one sqrt fewer; min() guards against a rounding just above 1.
+    return R * 2 * math.asin(math.sqrt(min(a, 1.0)))
+
+
+# Origin terms for distances from the Haifa center, computed once.
+_HAIFA_CENTER_LAT_RAD = math.radians(HAIFA_CENTER_LAT)
+_COS_HAIFA_CENTER_LAT = math.cos(_HAIFA_CENTER_LAT_RAD)
+
+
+def _haversine_from_haifa(lat: float, lon: float) -> float:
+    """:func:`haversine_km` from the Haifa center to ``(lat, lon)``."""
+    lat_rad = math.radians(lat)
+    sin_dlat = math.sin((lat_rad - _HAIFA_CENTER_LAT_RAD) / 2)
+    sin_dlon = math.sin(math.radians(lon - HAIFA_CENTER_LON) / 2)
+    a = (
+        sin_dlat * sin_dlat
+        + _COS_HAIFA_CENTER_LAT * math.cos(lat_rad) * sin_dlon * sin_dlon
+    )
+    return 6371.0 * 2 * math.asin(math.sqrt(min(a, 1.0)))
+
+
+def _center_distances_km(coords: list[tuple[float, float]]) -> list[float]:
+    """Haversine distances from the Haifa center to each ``(lat, lon)``."""
+    return [_haversine_from_haifa(lat, lon) for lat, lon in coords]
 
 
 # ---------------------------------------------------------------------------
@@ -78,7 +102,11 @@ def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
 
 def classify_point(lat: float, lon: float) -> RegionClassification:
     """Classify a single GPS point as inside / outside Haifa metro."""
-    dist = haversine_km(HAIFA_CENTER_LAT, HAIFA_CENTER_LON, lat, lon)
+    return _classify_distance(_haversine_from_haifa(lat, lon))
+
+
+def _classify_distance(dist: float) -> RegionClassification:
+    """Build the classification for a point *dist* km from Haifa center."""
     inside = dist <= HAIFA_METRO_RADIUS_KM
     factor = FACTOR_INSIDE_METRO if inside else FACTOR_OUTSIDE_METRO
     return RegionClassification(
@@ -102,6 +130,10 @@ def classify_geo_points(
     from Haifa to Nazareth should use the outside factor even though one
     end is inside.
 
+    Every point is classified even after the first outside hit: the
+    handler stores the per-point results in ``region_classifications``,
+    so there is no factor-only caller to short-circuit for.
+
     Returns
     -------
     (distance_factor, classifications)
@@ -111,17 +143,23 @@ def classify_geo_points(
     if not geo_points:
         return FACTOR_INSIDE_METRO, {}
 
-    classifications: dict[str, RegionClassification] = {}
-    worst_factor = FACTOR_INSIDE_METRO
-
+    keys: list[str] = []
+    coords: list[tuple[float, float]] = []
     for key, pt in geo_points.items():
         lat = pt.get("lat")
         lon = pt.get("lon")
         if lat is not None and lon is not None:
-            cls = classify_point(lat, lon)
-            classifications[key] = cls
-            if cls.distance_factor > worst_factor:
-                worst_factor = cls.distance_factor
+            keys.append(key)
+            coords.append((lat, lon))
+
+    classifications: dict[str, RegionClassification] = {}
+    worst_factor = FACTOR_INSIDE_METRO
+
+    for key, dist in zip(keys, _center_distances_km(coords)):
+        cls = _classify_distance(dist)
+        classifications[key] = cls
+        if cls.distance_factor > worst_factor:
+            worst_factor = cls.distance_factor
 
     return worst_factor, classifications
 
@@ -141,7 +179,7 @@ class RouteBand(str, Enum):
     EXTREME_DISTANCE = "extreme_distance"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RouteClassification:
     """Result of text-based route classification."""
 
@@ -217,6 +255,38 @@ def _same_metro(region_a: int, region_b: int, code_a: int, code_b: int) -> bool:
     return False
 
 
+def _region_pair_band(region_a: int, region_b: int) -> RouteBand:
+    """Band for two distinct, non-Eilat localities in the given regions.
+
+    Applies steps 5-8 of :func:`classify_route`; city-code and Eilat
+    checks come first and are not region-dependent.
+    """
+    # Same metro cluster (codes are non-Eilat here)
+    if _same_metro(region_a, region_b, 0, 0):
+        return RouteBand.SAME_METRO
+
+    macro_a = MACRO_REGIONS.get(region_a)
+    macro_b = MACRO_REGIONS.get(region_b)
+
+    # Same macro region
+    if macro_a and macro_b and macro_a == macro_b:
+        return RouteBand.SAME_REGION
+
+    # Long inter-region pairs
+    if macro_a and macro_b and frozenset({macro_a, macro_b}) in _LONG_PAIRS:
+        return RouteBand.INTER_REGION_LONG
+
+    # Default: inter-region short
+    return RouteBand.INTER_REGION_SHORT
+
+
+# Every known region pair resolved once; regions outside MACRO_REGIONS
+# belong to no cluster or macro region and fall back to inter_region_short.
+_REGION_PAIR_BANDS: dict[tuple[int, int], RouteBand] = {
+    (a, b): _region_pair_band(a, b) for a in MACRO_REGIONS for b in MACRO_REGIONS
+}
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -280,23 +350,7 @@ def classify_route(addr_from: str, addr_to: str) -> RouteClassification:
     if loc_from.code == EILAT_CODE or loc_to.code == EILAT_CODE:
         return _result(RouteBand.EXTREME_DISTANCE)
 
-    # 4. Same metro cluster
-    if _same_metro(loc_from.region, loc_to.region,
-                   loc_from.code, loc_to.code):
-        return _result(RouteBand.SAME_METRO)
-
-    # 5. Same macro region
-    macro_from = MACRO_REGIONS.get(loc_from.region)
-    macro_to = MACRO_REGIONS.get(loc_to.region)
-
-    if macro_from and macro_to and macro_from == macro_to:
-        return _result(RouteBand.SAME_REGION)
-
-    # 6. Long inter-region pairs
-    if macro_from and macro_to:
-        pair = frozenset({macro_from, macro_to})
-        if pair in _LONG_PAIRS:
-            return _result(RouteBand.INTER_REGION_LONG)
-
-    # 7. Default: inter-region short
-    return _result(RouteBand.INTER_REGION_SHORT)
+    # 4-7. Metro cluster / macro region rules (precomputed per region pair)
+    return _result(_REGION_PAIR_BANDS.get(
+        (loc_from.region, loc_to.region), RouteBand.INTER_REGION_SHORT,
+    ))
@@ -31,6 +31,7 @@ __all__ = [
     "_is_word_boundary",
     "_NAME_ALIASES",
     "_BOUNDARY_CHARS",
+    "_LOOKUP_RANK",
 ]
 
 
@@ -38,7 +39,7 @@ __all__ = [
 # Data model
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Locality:
     """A single Israeli locality from CBS data."""
 
@@ -100,8 +101,6 @@ _RU_ALIASES: dict[str, int] = _load_ru_aliases()
 
 # Characters to strip during normalization
 _STRIP_CHARS_RE = re.compile(r"[\"'`\u2018\u2019\u201c\u201d\u05f3\u05f4().]")
-# Collapse whitespace
-_MULTI_WS_RE = re.compile(r"\s+")
 
 
 def _normalize_name(name: str) -> str:
@@ -125,9 +124,8 @@ def _normalize_name(name: str) -> str:
     t = t.replace("–", " ").replace("—", " ").replace("\u2011", " ").replace("-", " ")
     # Strip quotes, apostrophes, parentheses, periods
     t = _STRIP_CHARS_RE.sub("", t)
-    # Collapse whitespace
-    t = _MULTI_WS_RE.sub(" ", t).strip()
-    return t
+    # Collapse whitespace (str.split() uses the same set as \s)
+    return " ".join(t.split())
 
 
 # ---------------------------------------------------------------------------
@@ -217,6 +215,11 @@ def _build_lookup(
 
 LOCALITY_LOOKUP: dict[str, Locality] = _build_lookup(LOCALITIES, ru_aliases=_RU_ALIASES)
 
+# Scan priority of each lookup key (0 = longest, first inserted) and the
+# longest key length, for find_locality's boundary-candidate lookup.
+_LOOKUP_RANK: dict[str, int] = {key: i for i, key in enumerate(LOCALITY_LOOKUP)}
+_MAX_KEY_LEN: int = max(map(len, LOCALITY_LOOKUP), default=0)
+
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -243,7 +246,7 @@ def _is_word_boundary(text: str, start: int, end: int) -> bool:
 def find_locality(text: str) -> Locality | None:
     """Find the best-matching locality in a text string.
 
-    Scans the normalized lookup for the longest matching substring.
+    Returns the longest lookup key found in the normalized text.
     Requires word-boundary alignment to prevent false positives
     (e.g. "רחוב" matching locality "REHOV").
 
@@ -262,10 +265,29 @@ def find_locality(text: str) -> Locality | None:
     if not normalized:
         return None
 
-    # Longest-first scan: check if lookup key appears in normalized text
-    for key, loc in LOCALITY_LOOKUP.items():
-        idx = normalized.find(key)
-        if idx >= 0 and _is_word_boundary(normalized, idx, idx + len(key)):
-            return loc
-
-    return None
+    # A match must start and end on a word boundary, so only the spans
+    # between boundary positions can be keys.  Look each one up and keep
+    # the one the longest-first scan order would have reached first.
+    n = len(normalized)
+    starts = [0]
+    ends = []
+    for i, ch in enumerate(normalized):
+        if ch in _BOUNDARY_CHARS:
+            ends.append(i)
+            starts.append(i + 1)
+    ends.append(n)
+
+    best_rank = len(_LOOKUP_RANK)
+    best_key = None
+    for start in starts:
+        for end in ends:
+            if end <= start:
+                continue
+            if end - start > _MAX_KEY_LEN:
+                break
+            rank = _LOOKUP_RANK.get(normalized[start:end], best_rank)
+            if rank < best_rank:
+                best_rank = rank
+                best_key = normalized[start:end]
+
+    return LOCALITY_LOOKUP[best_key] if best_key is not None else None
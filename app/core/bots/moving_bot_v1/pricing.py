@@ -25,23 +25,26 @@ All values are in **ILS** and must match mover expectations.
 from __future__ import annotations
 
 import json
-import math
+import sys
 from dataclasses import dataclass
+from math import ceil, floor
 from pathlib import Path
 
 __all__ = [
     # Public API
     "PricingConfig", "HAIFA_METRO_PRICING",
-    "ITEM_CATALOG", "ITEM_ALIAS_LOOKUP",
+    "ITEM_CATALOG", "ITEM_MIDPOINTS", "ITEM_ALIAS_LOOKUP",
     "VOLUME_CATEGORIES", "EXTRAS_ADJUSTMENTS",
     "ROUTING_BANDS", "ROUTING_MINIMUMS",
     "GUARDS", "COMPLEXITY_GUARDS",
-    "VOLUME_FROM_ITEMS_CONFIG", "ITEM_LABELS",
-    "estimate_price",
+    "VOLUME_FROM_ITEMS_CONFIG", "HEAVY_ITEM_KEYS", "ITEM_LABELS",
+    "estimate_breakdown_schema",
+    "compute_complexity_score", "estimate_price",
     # Private — used by tests:
     "_RAW_CONFIG", "_CONFIG_PATH",
     "_load_pricing_config", "_build_alias_lookup",
     "_EXTRAS_TO_ADJUSTMENTS",
+    "_SCORE_MULT", "_SCORE_FLOOR",
 ]
 
 
@@ -82,8 +85,16 @@ HAIFA_METRO_PRICING = PricingConfig()
 # Item catalog — (min_price, max_price) in ILS (from JSON)
 # ---------------------------------------------------------------------------
 
+# Item keys are interned: extract_items() results, ITEM_LABELS and
+# HEAVY_ITEM_KEYS all share these string objects.
 ITEM_CATALOG: dict[str, tuple[int, int]] = {
-    k: (v[0], v[1]) for k, v in _RAW_CONFIG["item_catalog"].items()
+    sys.intern(k): (v[0], v[1]) for k, v in _RAW_CONFIG["item_catalog"].items()
+}
+
+# Midpoint price per item, precomputed so estimate and volume code do a
+# single dict probe per item instead of a membership test plus unpacking.
+ITEM_MIDPOINTS: dict[str, float] = {
+    k: (lo + hi) / 2 for k, (lo, hi) in ITEM_CATALOG.items()
 }
 
 
@@ -114,7 +125,7 @@ def _build_alias_lookup(
                     f"Duplicate item alias {normalized!r}: "
                     f"maps to both {lookup[normalized]!r} and {canonical_key!r}"
                 )
-            lookup[normalized] = canonical_key
+            lookup[normalized] = sys.intern(canonical_key)
     # Sort longest-first so multi-word aliases match before shorter ones
     return dict(sorted(lookup.items(), key=lambda kv: -len(kv[0])))
 
@@ -166,6 +177,15 @@ ROUTING_MINIMUMS: dict[str, int] = dict(
 
 GUARDS: dict[str, object] = dict(_RAW_CONFIG.get("guards", {}))
 
+# Guard thresholds read by every estimate, bound once at import.
+_HF_THRESHOLD = int(GUARDS.get("high_floor_no_elevator_threshold", 99))
+_HF_MULTIPLIER = float(GUARDS.get("high_floor_surcharge_multiplier", 1.0))
+_XL_VOLUME_FLOOR = int(GUARDS.get("xl_volume_floor", 0))
+_NATIONAL_MOVE_MIN = int(GUARDS.get("national_move_minimum", 0))
+_NATIONAL_BANDS = frozenset(
+    ("inter_region_short", "inter_region_long", "extreme_distance"),
+)
+
 
 # ---------------------------------------------------------------------------
 # Complexity guards — G6: multiplier + hard floor for premium moves
@@ -173,6 +193,66 @@ GUARDS: dict[str, object] = dict(_RAW_CONFIG.get("guards", {}))
 
 COMPLEXITY_GUARDS: dict[str, object] = dict(_RAW_CONFIG.get("complexity", {}))
 
+# Score -> (midpoint factor, hard floor) lookup tables.  There are only five
+# triggers, so every reachable score is tabulated once at import instead of
+# re-deriving the multiplier / floor thresholds on every estimate.
+_MAX_COMPLEXITY_SCORE = 5
+_COMPLEX_FACTOR: float = (
+    float(COMPLEXITY_GUARDS.get("complex_multiplier", 1.0))
+    * (1 + float(COMPLEXITY_GUARDS.get("risk_buffer_pct", 0.0)))
+)
+_COMPLEX_SCORE_THRESHOLD = int(COMPLEXITY_GUARDS.get("score_threshold", 2))
+_COMPLEX_FLOOR_SCORE_THRESHOLD = int(
+    COMPLEXITY_GUARDS.get("min_floor_score_threshold", 3),
+)
+# Trigger inputs for compute_complexity_score().
+_COMPLEX_ELIGIBLE_VOLUMES = frozenset(
+    COMPLEXITY_GUARDS.get("eligible_volume_categories", ["large", "xl"]),
+)
+_COMPLEX_EXEMPT_VOLUME = COMPLEXITY_GUARDS.get("exempt_volume", "small")
+_COMPLEX_PICKUP_MIN = int(COMPLEXITY_GUARDS.get("trigger_pickup_count_min", 2))
+_COMPLEX_FLOOR_NO_ELEVATOR_MIN = int(
+    COMPLEXITY_GUARDS.get("trigger_floor_no_elevator_min", 5),
+)
+_SCORE_MULT: tuple[float, ...] = tuple(
+    _COMPLEX_FACTOR if s >= _COMPLEX_SCORE_THRESHOLD else 1.0
+    for s in range(_MAX_COMPLEXITY_SCORE + 1)
+)
+_SCORE_FLOOR: tuple[int, ...] = tuple(
+    int(COMPLEXITY_GUARDS.get("complex_min_floor", 0))
+    if s >= _COMPLEX_SCORE_THRESHOLD and s >= _COMPLEX_FLOOR_SCORE_THRESHOLD
+    else 0
+    for s in range(_MAX_COMPLEXITY_SCORE + 1)
+)
+
+
+# Trigger / guard names are built once and interned so every breakdown
+# shares the same string objects (no per-call "volume_" + category concat).
+_VOLUME_TRIGGERS: dict[str, str] = {
+    v: sys.intern("volume_" + v)
+    for v in (*VOLUME_CATEGORIES, *COMPLEXITY_GUARDS.get("eligible_volume_categories", []))
+}
+_ROUTE_TRIGGERS: dict[str, str] = {
+    b: sys.intern("route_" + b)
+    for b in COMPLEXITY_GUARDS.get("trigger_route_bands", [])
+}
+
+# One bit per complexity trigger; the score is the popcount of the mask.
+# Volume and route names depend on the category / band and are resolved
+# through the tables above.
+_T_VOLUME = 1 << 0
+_T_ASSEMBLY = 1 << 1
+_T_MULTI_PICKUP = 1 << 2
+_T_ROUTE = 1 << 3
+_T_HIGH_FLOOR = 1 << 4
+_TRIGGER_BITS: tuple[tuple[int, str], ...] = (
+    (_T_VOLUME, ""),
+    (_T_ASSEMBLY, "assembly"),
+    (_T_MULTI_PICKUP, "multi_pickup"),
+    (_T_ROUTE, ""),
+    (_T_HIGH_FLOOR, "high_floor_no_elevator"),
+)
+
 
 # ---------------------------------------------------------------------------
 # Volume inference from items — thresholds for auto-detecting volume category
@@ -182,14 +262,125 @@ VOLUME_FROM_ITEMS_CONFIG: dict[str, object] = dict(
     _RAW_CONFIG.get("volume_from_items", {})
 )
 
+# Item keys that count towards the heavy-item thresholds.
+HEAVY_ITEM_KEYS: frozenset[str] = frozenset(
+    map(sys.intern, VOLUME_FROM_ITEMS_CONFIG.get("heavy_keys", ()))
+)
+
 
 # ---------------------------------------------------------------------------
 # Item labels — localized display names for crew messages
 # ---------------------------------------------------------------------------
 
-ITEM_LABELS: dict[str, dict[str, str]] = dict(
-    _RAW_CONFIG.get("item_labels", {})
-)
+ITEM_LABELS: dict[str, dict[str, str]] = {
+    sys.intern(k): v for k, v in _RAW_CONFIG.get("item_labels", {}).items()
+}
+
+
+# ---------------------------------------------------------------------------
+# Estimate breakdown — keys and defaults of ``estimate_price()["breakdown"]``
+# ---------------------------------------------------------------------------
+
+_BREAKDOWN_DEFAULTS: dict = {
+    "base": 0,
+    "floor_surcharge": 0,
+    "pickup_fee": 0,
+    "volume_surcharge": 0,
+    "items_mid": 0.0,
+    "extras_adj": 0,
+    "distance_factor": 1.0,
+    "route_band": None,
+    "route_fee": 0,
+    "route_minimum": 0,
+    "minimum_applied": False,
+    "guards_applied": [],
+    "complexity_score": 0,
+    "complexity_triggers": [],
+    "complexity_applied": False,
+}
+
+
+def estimate_breakdown_schema() -> dict:
+    """Return an empty breakdown dict (all fields at their defaults).
+
+    Lets callers inspect the breakdown keys without running
+    :func:`estimate_price`.
+    """
+    return {
+        k: list(v) if isinstance(v, list) else v
+        for k, v in _BREAKDOWN_DEFAULTS.items()
+    }
+
+
+# ---------------------------------------------------------------------------
+# Complexity score (G6)
+# ---------------------------------------------------------------------------
+
+def compute_complexity_score(
+    *,
+    volume_category: str | None = None,
+    extras: list[str] | None = None,
+    route_band: str | None = None,
+    extra_pickups: int = 0,
+    pickup_floors: list[tuple[int, bool]] | None = None,
+    floor_from: int = 0,
+    has_elevator_from: bool = True,
+    floor_to: int = 0,
+    has_elevator_to: bool = True,
+) -> tuple[int, list[str]]:
+    """Score a move's complexity for the G6 guard.
+
+    Only eligible volumes (``large`` / ``xl`` by default) are scored; each
+    of the five triggers adds one point — volume, assembly, multi-pickup,
+    inter-region route, high floor without elevator.
+
+    Returns ``(score, triggers)``.
+    """
+    mask = 0
+
+    if not (
+        volume_category
+        and volume_category != _COMPLEX_EXEMPT_VOLUME
+        and volume_category in _COMPLEX_ELIGIBLE_VOLUMES
+    ):
+        return 0, []
+
+    # Trigger 1: volume category
+    mask |= _T_VOLUME
+
+    # Trigger 2: assembly in extras
+    if extras and "assembly" in extras:
+        mask |= _T_ASSEMBLY
+
+    # Trigger 3: multi-pickup
+    if extra_pickups + 1 >= _COMPLEX_PICKUP_MIN:
+        mask |= _T_MULTI_PICKUP
+
+    # Trigger 4: inter-region route band
+    if route_band and route_band in _ROUTE_TRIGGERS:
+        mask |= _T_ROUTE
+
+    # Trigger 5: high floor without elevator (crane territory)
+    c_floor_min = _COMPLEX_FLOOR_NO_ELEVATOR_MIN
+    if pickup_floors:
+        for pf, pe in pickup_floors:
+            if not pe and pf >= c_floor_min:
+                mask |= _T_HIGH_FLOOR
+                break
+    elif not has_elevator_from and floor_from >= c_floor_min:
+        mask |= _T_HIGH_FLOOR
+    if not has_elevator_to and floor_to >= c_floor_min:
+        mask |= _T_HIGH_FLOOR
+
+    # Materialise trigger names (in bit order) only for the set bits.
+    complexity_triggers = [
+        _VOLUME_TRIGGERS[volume_category] if bit == _T_VOLUME
+        else _ROUTE_TRIGGERS[route_band] if bit == _T_ROUTE
+        else name
+        for bit, name in _TRIGGER_BITS
+        if mask & bit
+    ]
+    return mask.bit_count(), complexity_triggers
 
 
 # ---------------------------------------------------------------------------
@@ -268,8 +459,8 @@ def estimate_price(
         floor_surcharge += (floor_to - 1) * cfg.no_elevator_per_floor
 
     # Phase 14 guard: high-floor no-elevator multiplier
-    hf_threshold = int(GUARDS.get("high_floor_no_elevator_threshold", 99))
-    hf_multiplier = float(GUARDS.get("high_floor_surcharge_multiplier", 1.0))
+    hf_threshold = _HF_THRESHOLD
+    hf_multiplier = _HF_MULTIPLIER
     has_high_floor = False
     if pickup_floors:
         for p_floor, p_has_elevator in pickup_floors:
@@ -283,7 +474,7 @@ def estimate_price(
         has_high_floor = True
 
     if has_high_floor and hf_multiplier > 1.0:
-        floor_surcharge = math.ceil(floor_surcharge * hf_multiplier)
+        floor_surcharge = ceil(floor_surcharge * hf_multiplier)
 
     # 3. Extra pickups
     pickup_fee = max(0, extra_pickups) * cfg.extra_pickup
@@ -302,9 +493,7 @@ def estimate_price(
                 qty = item.get("qty", 1)
             else:
                 key, qty = item, 1
-            if key in ITEM_CATALOG:
-                lo, hi = ITEM_CATALOG[key]
-                items_mid += ((lo + hi) / 2) * qty
+            items_mid += ITEM_MIDPOINTS.get(key, 0.0) * qty
 
     # 6. Extras adjustments
     extras_adj = 0
@@ -333,72 +522,28 @@ def estimate_price(
     mid = mid * cfg.distance_factor
 
     # G6: Complexity scoring guard ----------------------------------------
-    complexity_score = 0
-    complexity_triggers: list[str] = []
-    complexity_applied = False
-
-    eligible_volumes = COMPLEXITY_GUARDS.get(
-        "eligible_volume_categories", ["large", "xl"],
+    complexity_score, complexity_triggers = compute_complexity_score(
+        volume_category=volume_category,
+        extras=extras,
+        route_band=route_band,
+        extra_pickups=extra_pickups,
+        pickup_floors=pickup_floors,
+        floor_from=floor_from,
+        has_elevator_from=has_elevator_from,
+        floor_to=floor_to,
+        has_elevator_to=has_elevator_to,
     )
-    exempt_vol = COMPLEXITY_GUARDS.get("exempt_volume", "small")
+    complexity_applied = False
 
-    if (
-        volume_category
-        and volume_category != exempt_vol
-        and volume_category in eligible_volumes
-    ):
-        # Trigger 1: volume category
-        complexity_score += 1
-        complexity_triggers.append("volume_" + volume_category)
-
-        # Trigger 2: assembly in extras
-        if extras and "assembly" in extras:
-            complexity_score += 1
-            complexity_triggers.append("assembly")
-
-        # Trigger 3: multi-pickup
-        pickup_min = int(COMPLEXITY_GUARDS.get("trigger_pickup_count_min", 2))
-        if extra_pickups + 1 >= pickup_min:
-            complexity_score += 1
-            complexity_triggers.append("multi_pickup")
-
-        # Trigger 4: inter-region route band
-        trigger_routes = COMPLEXITY_GUARDS.get("trigger_route_bands", [])
-        if route_band and route_band in trigger_routes:
-            complexity_score += 1
-            complexity_triggers.append("route_" + route_band)
-
-        # Trigger 5: high floor without elevator (crane territory)
-        c_floor_min = int(
-            COMPLEXITY_GUARDS.get("trigger_floor_no_elevator_min", 5),
-        )
-        c_high_floor = False
-        if pickup_floors:
-            for pf, pe in pickup_floors:
-                if not pe and pf >= c_floor_min:
-                    c_high_floor = True
-                    break
-        else:
-            if not has_elevator_from and floor_from >= c_floor_min:
-                c_high_floor = True
-        if not has_elevator_to and floor_to >= c_floor_min:
-            c_high_floor = True
-        if c_high_floor:
-            complexity_score += 1
-            complexity_triggers.append("high_floor_no_elevator")
-
-    # Apply complexity multiplier + risk buffer
-    c_threshold = int(COMPLEXITY_GUARDS.get("score_threshold", 2))
-    if complexity_score >= c_threshold:
-        c_multiplier = float(COMPLEXITY_GUARDS.get("complex_multiplier", 1.0))
-        c_risk = float(COMPLEXITY_GUARDS.get("risk_buffer_pct", 0.0))
-        mid = mid * c_multiplier * (1 + c_risk)
+    # Apply complexity multiplier + risk buffer (precomputed per score)
+    if complexity_score >= _COMPLEX_SCORE_THRESHOLD:
+        mid = mid * _SCORE_MULT[complexity_score]
         complexity_applied = True
     # ---------------------------------------------------------------------
 
     # 8. Symmetric margin around midpoint
-    estimate_min = max(0, math.floor(mid * (1 - cfg.estimate_margin)))
-    estimate_max = math.ceil(mid * (1 + cfg.estimate_margin))
+    estimate_min = max(0, floor(mid * (1 - cfg.estimate_margin)))
+    estimate_max = ceil(mid * (1 + cfg.estimate_margin))
 
     # 9. Route minimum (Phase 14)
     minimum_applied = False
@@ -412,7 +557,7 @@ def estimate_price(
     guards_applied: list[str] = []
 
     # Guard A: XL volume floor
-    xl_floor = int(GUARDS.get("xl_volume_floor", 0))
+    xl_floor = _XL_VOLUME_FLOOR
     if volume_category == "xl" and xl_floor > 0 and estimate_min < xl_floor:
         estimate_min = xl_floor
         if estimate_max < xl_floor:
@@ -421,10 +566,8 @@ def estimate_price(
         guards_applied.append("xl_volume_floor")
 
     # Guard B: National move minimum (inter-region moves never below threshold)
-    national_min = int(GUARDS.get("national_move_minimum", 0))
-    if route_band and route_band in (
-        "inter_region_short", "inter_region_long", "extreme_distance",
-    ):
+    national_min = _NATIONAL_MOVE_MIN
+    if route_band in _NATIONAL_BANDS:
         if national_min > 0 and estimate_min < national_min:
             estimate_min = national_min
             minimum_applied = True
@@ -435,17 +578,13 @@ def estimate_price(
 
     # G6: complex_min_floor (only at high complexity score)
     if complexity_applied:
-        c_floor_threshold = int(
-            COMPLEXITY_GUARDS.get("min_floor_score_threshold", 3),
-        )
-        if complexity_score >= c_floor_threshold:
-            c_min_floor = int(COMPLEXITY_GUARDS.get("complex_min_floor", 0))
-            if c_min_floor > 0 and estimate_min < c_min_floor:
-                estimate_min = c_min_floor
-                if estimate_max < c_min_floor:
-                    estimate_max = c_min_floor
-                minimum_applied = True
-                guards_applied.append("complex_min_floor")
+        c_min_floor = _SCORE_FLOOR[complexity_score]
+        if c_min_floor > 0 and estimate_min < c_min_floor:
+            estimate_min = c_min_floor
+            if estimate_max < c_min_floor:
+                estimate_max = c_min_floor
+            minimum_applied = True
+            guards_applied.append("complex_min_floor")
         guards_applied.append("complexity_guard")
 
     return {
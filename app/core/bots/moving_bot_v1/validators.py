@@ -8,8 +8,11 @@ tested independently and reused across handler versions.
 from __future__ import annotations
 
 import re
+import unicodedata
+from collections import deque
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Literal, Optional, overload
 
 __all__ = [
     # Public API
@@ -27,20 +30,25 @@ __all__ = [
     # Private — used by tests / other modules:
     "_parse_natural_date", "_validate_date_range", "_resolve_day_month",
     "_EXPLICIT_QTY_PATTERN", "_ATTR_SUFFIXES", "_BARE_QTY_PATTERN",
-    "_QTY_SANITY_CAP", "_ITEM_SEPARATORS",
+    "_QTY_SANITY_CAP", "_ITEM_CONJUNCTIONS", "_split_fragments",
+    "_extract_items_cached", "_extract_item_pairs", "_get_alias_matcher",
     "_JUNK_INPUTS",
     "_HEBREW_RE", "_CYRILLIC_RE", "_LATIN_RE", "_MIN_LETTERS_FOR_DETECTION",
     "_ELEVATOR_YES_PATTERNS", "_ELEVATOR_NO_PATTERNS",
     "_FLOOR_NUMBER_PATTERN", "_GROUND_PATTERNS",
     "_URL_RE", "_HTML_TAG_RE", "_SCRIPT_URI_RE", "_CONTROL_RE",
+    "_CONTROL_TRANS",
     "_MULTI_SPACE_RE", "_MAX_FIELD_LEN",
     "_RELATIVE_DAYS", "_WEEKDAY_NAMES", "_MONTH_NAMES",
     "_NEXT_PREFIX_RE", "_WEEKDAY_PREP_RE",
     "_RELATIVE_DAYS_SORTED", "_WEEKDAY_NAMES_SORTED", "_MONTH_NAMES_SORTED",
     "_TZ", "_MAX_DAYS_AHEAD",
-    "_LANDING_SIGNATURE", "_LANDING_FIELDS", "_VALID_MOVE_TYPES", "_FIELD_MAX",
-    "_ROOM_PATTERNS", "_ROOM_COUNT_TO_VOLUME",
+    "_LANDING_SIGNATURE", "_LANDING_FIELDS", "_LANDING_FIELD_RE",
+    "_LANDING_FIELD_DISPATCH", "_VALID_MOVE_TYPES", "_FIELD_MAX",
+    "_ROOM_PATTERNS", "_ROOM_PATTERNS_BY_TYPE", "_ROOM_COUNT_TO_VOLUME",
     "_DIMENSION_PATTERN", "_strip_dimensions",
+    "_sanitize_cached",
+    "_AliasMatcher", "_get_item_matcher", "_get_volume_from_items_rules",
 ]
 
 
@@ -67,9 +75,23 @@ _HTML_TAG_RE = re.compile(r"<[^>]{1,200}>")
 _SCRIPT_URI_RE = re.compile(r"(?:javascript|vbscript|data)\s*:", re.IGNORECASE)
 _CONTROL_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
 _MULTI_SPACE_RE = re.compile(r"[ \t]{2,}")
+# Same characters as _CONTROL_RE, as a str.translate() deletion table.
+_CONTROL_TRANS: dict[int, None] = dict.fromkeys(
+    (*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F),
+)
 _MAX_FIELD_LEN = 500
 
 
+def _strip_control(t: str) -> str:
+    """Delete control characters (keeps ``\\t``, ``\\n``, ``\\r``).
+
+    ``isprintable()`` is a cheap C scan that is true for most single-line
+    input, so the translate only runs when something non-printable is
+    present.
+    """
+    return t if t.isprintable() else t.translate(_CONTROL_TRANS)
+
+
 def sanitize_text(s: str, max_length: int = _MAX_FIELD_LEN) -> str:
     """Sanitise user text input.
 
@@ -80,22 +102,38 @@ def sanitize_text(s: str, max_length: int = _MAX_FIELD_LEN) -> str:
     Returns the cleaned string.  Raises :class:`ValueError` with
     ``"rejected"`` when the *entire* input consists of stripped content
     (URLs, HTML, scripts) leaving nothing useful behind.
+
+    Results are memoised per ``(s, max_length)`` — canned messages and
+    short replies ("1", "да", addresses) repeat often.  Rejections are
+    not cached.  ``sanitize_text.cache_clear()`` empties the cache.
     """
+    if not s:
+        return ""
+    return _sanitize_cached(s, max_length)
+
+
+@lru_cache(maxsize=1024)
+def _sanitize_cached(s: str, max_length: int) -> str:
+    """Memoised body of :func:`sanitize_text`."""
     t = norm(s)
     if not t:
         return ""
-    original_non_empty = True
     t = t[:max_length]
     t = _HTML_TAG_RE.sub("", t)
     t = _URL_RE.sub("", t)
+    # Separate pass after URL removal: deleting a URL can splice a split
+    # scheme back together ("javascript http://x :alert(1)").
     t = _SCRIPT_URI_RE.sub("", t)
-    t = _CONTROL_RE.sub("", t)
+    t = _strip_control(t)
     t = _MULTI_SPACE_RE.sub(" ", t).strip()
-    if not t and original_non_empty:
+    if not t:
         raise ValueError("rejected")
     return t
 
 
+sanitize_text.cache_clear = _sanitize_cached.cache_clear  # type: ignore[attr-defined]
+
+
 _JUNK_INPUTS: set[str] = {".", "..", "...", "ок", "ok", "ага", "да", "нет", "?"}
 
 
@@ -172,6 +210,21 @@ def detect_language(text: str) -> tuple[str | None, float]:
 # Choice parsing
 # ---------------------------------------------------------------------------
 
+# Explicit separators between digit choices and a free-text comment
+_CHOICE_SEPARATORS: tuple[re.Pattern, ...] = tuple(
+    re.compile(p, re.IGNORECASE) for p in (
+        r'\s*\+\s*',           # "1 3 + text"
+        r'\s*,\s*(?=[^\d])',   # "1, 3, text"
+        r'\s+и\s+(?=[^\d])',   # "1 и 2 и text"
+        r'\s+and\s+(?=[^\d])', # "1 and 2 and text"
+        r'\s+также\s+',        # "1 2 также text"
+    )
+)
+_CHOICE_SPACING_RE = re.compile(r'[,\s]+')
+_CHOICES_THEN_TEXT_RE = re.compile(r'^([1-4](?:\s*[,\s]\s*[1-4])*)\s+(.+)$')
+_CHOICE_CHARS_RE = re.compile(r'[1-4\s,]+')
+
+
 def parse_choices(s: str) -> set[str]:
     """Extract numeric choice digits (1-4) from *s*."""
     t = lower(s)
@@ -199,16 +252,8 @@ def parse_extras_input(s: str) -> tuple[set[str], Optional[str]]:
         return set(), None
 
     # Try to split by explicit separators
-    separators = [
-        r'\s*\+\s*',           # "1 3 + text"
-        r'\s*,\s*(?=[^\d])',   # "1, 3, text"
-        r'\s+и\s+(?=[^\d])',   # "1 и 2 и text"
-        r'\s+and\s+(?=[^\d])', # "1 and 2 and text"
-        r'\s+также\s+',        # "1 2 также text"
-    ]
-
-    for sep_pattern in separators:
-        match = re.search(sep_pattern, text, re.IGNORECASE)
+    for sep_re in _CHOICE_SEPARATORS:
+        match = sep_re.search(text)
         if match:
             before = text[:match.start()].strip()
             after = text[match.end():].strip()
@@ -217,12 +262,12 @@ def parse_extras_input(s: str) -> tuple[set[str], Optional[str]]:
                 return choices_before, after
 
     # Pure numeric input ("1 3", "1,2,3")
-    clean = re.sub(r'[,\s]+', '', text)
+    clean = _CHOICE_SPACING_RE.sub('', text)
     if clean and all(ch in "1234" for ch in clean):
         return {ch for ch in clean if ch in "1234"}, None
 
     # Numbers followed by text ("1 3 пятый этаж")
-    match = re.match(r'^([1-4](?:\s*[,\s]\s*[1-4])*)\s+(.+)$', text)
+    match = _CHOICES_THEN_TEXT_RE.match(text)
     if match:
         nums_part = match.group(1)
         text_part = match.group(2).strip()
@@ -232,9 +277,9 @@ def parse_extras_input(s: str) -> tuple[set[str], Optional[str]]:
 
     # Fallback: look for any valid digit choices
     all_choices = {ch for ch in text if ch in "1234"}
-    non_numeric = re.sub(r'[1-4\s,]+', '', text).strip()
+    non_numeric = _CHOICE_CHARS_RE.sub('', text).strip()
     if all_choices and len(non_numeric) > 3:
-        if not re.match(r'^[1-4]', text):
+        if text[0] not in "1234":
             return set(), text
 
     if all_choices:
@@ -437,6 +482,20 @@ _RELATIVE_DAYS_SORTED = sorted(_RELATIVE_DAYS.items(), key=lambda kv: -len(kv[0]
 _WEEKDAY_NAMES_SORTED = sorted(_WEEKDAY_NAMES.items(), key=lambda kv: -len(kv[0]))
 _MONTH_NAMES_SORTED = sorted(_MONTH_NAMES.items(), key=lambda kv: -len(kv[0]))
 
+# Per month (longest name first): ("20 февраля", "March 5th", month_num)
+_MONTH_PATTERNS: list[tuple[re.Pattern, re.Pattern, int]] = [
+    (
+        re.compile(rf"(\d{{1,2}})\s+{re.escape(name)}\b"),
+        re.compile(rf"{re.escape(name)}\s+(\d{{1,2}})(?:st|nd|rd|th)?\b"),
+        num,
+    )
+    for name, num in _MONTH_NAMES_SORTED
+]
+
+_DATE_DMY_RE = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})")
+_DATE_DM_RE = re.compile(r"(\d{1,2})\.(\d{1,2})")
+_EXACT_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})")
+
 
 def _parse_natural_date(text: str, *, tz: ZoneInfo = _TZ) -> date | None:
     """Parse a natural language date string.
@@ -486,15 +545,15 @@ def _parse_natural_date(text: str, *, tz: ZoneInfo = _TZ) -> date | None:
 
     # 3. Day + month name: "20 февраля", "March 5", "15 ינואר"
     # Pattern A: DD month_name
-    for month_name, month_num in _MONTH_NAMES_SORTED:
+    for day_month_re, month_day_re, month_num in _MONTH_PATTERNS:
         # "20 февраля"
-        pat_a = re.match(rf"(\d{{1,2}})\s+{re.escape(month_name)}\b", t)
+        pat_a = day_month_re.match(t)
         if pat_a:
             day = int(pat_a.group(1))
             return _resolve_day_month(day, month_num, today)
 
         # "February 20" / "March 5th"
-        pat_b = re.match(rf"{re.escape(month_name)}\s+(\d{{1,2}})(?:st|nd|rd|th)?\b", t)
+        pat_b = month_day_re.match(t)
         if pat_b:
             day = int(pat_b.group(1))
             return _resolve_day_month(day, month_num, today)
@@ -533,11 +592,11 @@ def parse_date(text: str, *, tz: ZoneInfo = _TZ) -> date:
     cleaned = norm(text).replace("/", ".").replace("-", ".")
 
     # Try DD.MM.YYYY first
-    m = re.fullmatch(r"(\d{1,2})\.(\d{1,2})\.(\d{4})", cleaned)
+    m = _DATE_DMY_RE.fullmatch(cleaned)
     has_year = m is not None
     if not m:
         # Try DD.MM (no year)
-        m = re.fullmatch(r"(\d{1,2})\.(\d{1,2})", cleaned)
+        m = _DATE_DM_RE.fullmatch(cleaned)
     if m:
         day, month = int(m.group(1)), int(m.group(2))
         today = _dt.now(tz).date()
@@ -593,7 +652,7 @@ def parse_exact_time(text: str) -> str:
     Raises :class:`ValueError` on invalid input.
     """
     cleaned = norm(text).replace(".", ":").replace("-", ":")
-    m = re.fullmatch(r"(\d{1,2}):(\d{2})", cleaned)
+    m = _EXACT_TIME_RE.fullmatch(cleaned)
     if not m:
         raise ValueError("format")
 
@@ -608,14 +667,33 @@ def parse_exact_time(text: str) -> str:
 # Item extraction from cargo descriptions (Phase 10)
 # ---------------------------------------------------------------------------
 
-# Separator pattern for splitting cargo descriptions into fragments
-_ITEM_SEPARATORS = re.compile(
-    r"[,\n]+|"        # commas, newlines
-    r"\s+и\s+|"       # Russian "и" (and)
-    r"\s+and\s+|"     # English "and"
-    r"\s*\+\s*",      # plus sign
-    re.IGNORECASE,
+# Conjunction / plus separators inside a comma-delimited piece.
+# Applied to already-lowercased text, so no IGNORECASE; whitespace-led
+# alternatives share one ``\s+`` prefix instead of each rescanning it.
+_ITEM_CONJUNCTIONS = re.compile(
+    r"\+\s*|"         # plus sign
+    r"\s+(?:"
+    r"и\s+|"          # Russian "и" (and)
+    r"and\s+|"        # English "and"
+    r"\+\s*)",        # plus sign after whitespace
 )
+_CONJUNCTION_WORDS = frozenset({"и", "and"})
+
+
+def _split_fragments(text: str) -> list[str]:
+    """Split lowercased cargo text into item fragments.
+
+    Commas and newlines are split with ``str.split``; the conjunction
+    regex only runs on pieces that contain ``+`` or a standalone
+    "и"/"and" word, which keeps plain comma lists out of the regex engine.
+    """
+    fragments: list[str] = []
+    for piece in text.replace("\n", ",").split(","):
+        if "+" in piece or not _CONJUNCTION_WORDS.isdisjoint(piece.split()):
+            fragments.extend(_ITEM_CONJUNCTIONS.split(piece))
+        else:
+            fragments.append(piece)
+    return fragments
 
 # ---------------------------------------------------------------------------
 # ---------------------------------------------------------------------------
@@ -689,58 +767,258 @@ _BARE_QTY_PATTERN = re.compile(r"(\d+)")
 _QTY_SANITY_CAP = 200
 
 
+# ---------------------------------------------------------------------------
+# Alias matcher (built once, shared by every extract_items() call)
+# ---------------------------------------------------------------------------
+
+class _AliasMatcher:
+    """Find the highest-priority alias contained in a cargo fragment.
+
+    Priority is the iteration order of the alias lookup (longest-first for
+    ``ITEM_ALIAS_LOOKUP``), so results match a plain ``alias in fragment``
+    scan.  The aliases are compiled into an Aho-Corasick automaton: one
+    left-to-right walk over the fragment sees every alias occurrence, and
+    each state carries the best rank of any alias ending there.  Failure
+    links are resolved into the transition table at build time.  For
+    longest-first lookups a fragment equal to an alias is resolved by dict
+    lookup before the walk.
+    """
+
+    def __init__(self, alias_lookup: dict[str, str]) -> None:
+        self.aliases: tuple[str, ...] = tuple(alias_lookup)
+        self.keys: tuple[str, ...] = tuple(alias_lookup.values())
+        none = len(self.aliases)
+
+        # Trie of all aliases; _best[state] = rank of the alias ending there.
+        goto: list[dict[str, int]] = [{}]
+        best: list[int] = [none]
+        for rank, alias in enumerate(self.aliases):
+            state = 0
+            for ch in alias:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    best.append(none)
+                state = nxt
+            best[state] = min(best[state], rank)
+
+        # Failure links (breadth-first); fold suffix matches into _best.
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                best[nxt] = min(best[nxt], best[fail[nxt]])
+
+        # Precompile failure chasing into the transitions themselves:
+        # _delta[state] holds every non-root move out of *state* (its own
+        # edges plus those inherited from its failure state), and anything
+        # else restarts from the root edges.  The walk is then one or two
+        # dict lookups per character with no failure loop.
+        delta: list[dict[str, int]] = [{} for _ in goto]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            queue.extend(goto[state].values())
+            if fail[state]:
+                delta[state] = {**delta[fail[state]], **goto[state]}
+            else:
+                delta[state] = goto[state]
+
+        # Many states (leaves, and states whose inherited edges coincide)
+        # end up with identical rows; keep one dict per distinct row.
+        rows: dict[frozenset[tuple[str, int]], dict[str, int]] = {}
+        self._delta = [rows.setdefault(frozenset(row.items()), row) for row in delta]
+        self._root = goto[0]
+        self._best = best
+
+        lengths = [len(a) for a in self.aliases]
+        longest_first = all(a >= b for a, b in zip(lengths, lengths[1:]))
+        # A fragment that *is* an alias wins outright when longest-first:
+        # every other alias it contains is shorter, hence lower priority.
+        self._exact: dict[str, str] = dict(alias_lookup) if longest_first else {}
+        # Exact aliases that pass through normalisation, dimension stripping
+        # and fragment splitting unchanged; a whole input equal to one of
+        # these is a single item with qty 1 ("холодильник", "treadmill").
+        self._whole: dict[str, str] = {
+            alias: key for alias, key in self._exact.items()
+            if unicodedata.is_normalized("NFC", alias)
+            and _split_fragments(_strip_dimensions(alias)) == [alias]
+        }
+        # Inflected forms ("кровати", "6 ковров") recur across descriptions;
+        # remember walk results so a repeated fragment is one dict hit.
+        self._walk_cached = lru_cache(maxsize=4096)(self._walk)
+
+    def match(self, fragment: str) -> tuple[str, str] | None:
+        """Return ``(alias, canonical_key)`` for *fragment*, or ``None``."""
+        key = self._exact.get(fragment)
+        if key is not None:
+            return fragment, key
+        return self._walk_cached(fragment)
+
+    def _walk(self, fragment: str) -> tuple[str, str] | None:
+        """Run the automaton over *fragment* and return the best alias hit."""
+        delta, root_get, best_at = self._delta, self._root.get, self._best
+        none = len(self.aliases)
+        best = none
+        state = 0
+        for ch in fragment:
+            # Stored targets are never the root, so ``or`` is a safe fallback
+            state = delta[state].get(ch) or root_get(ch, 0)
+            if best_at[state] < best:
+                best = best_at[state]
+        if best == none:
+            return None
+        return self.aliases[best], self.keys[best]
+
+
+@lru_cache(maxsize=1)
+def _get_item_matcher() -> _AliasMatcher:
+    """Return the ``ITEM_ALIAS_LOOKUP`` matcher (built lazily, once)."""
+    from app.core.bots.moving_bot_v1.pricing import ITEM_ALIAS_LOOKUP
+    return _AliasMatcher(ITEM_ALIAS_LOOKUP)
+
+
+@lru_cache(maxsize=32)
+def _get_alias_matcher(
+    aliases: tuple[tuple[str, str], ...],
+) -> _AliasMatcher:
+    """Return a matcher for a custom alias table, keyed on its items.
+
+    Keying on the ``(alias, key)`` items (in priority order) keeps the
+    cache correct when a caller mutates its lookup dict between calls.
+    """
+    return _AliasMatcher(dict(aliases))
+
+
+@overload
+def extract_items(
+    text: str,
+    alias_lookup: dict[str, str] | None = ...,
+    *,
+    as_dict: Literal[False] = ...,
+) -> list[dict]: ...
+
+
+@overload
+def extract_items(
+    text: str,
+    alias_lookup: dict[str, str] | None = ...,
+    *,
+    as_dict: Literal[True],
+) -> dict[str, int]: ...
+
+
 def extract_items(
     text: str,
     alias_lookup: dict[str, str] | None = None,
-) -> list[dict]:
+    *,
+    as_dict: bool = False,
+) -> list[dict] | dict[str, int]:
     """Extract structured items from a cargo description.
 
     Best-effort extraction — unknown words are silently ignored.
-    Returns a list of ``{"key": canonical_key, "qty": int}`` dicts.
+    Returns a list of ``{"key": canonical_key, "qty": int}`` dicts, or a
+    ``{canonical_key: qty}`` mapping when *as_dict* is true.
 
     Handles:
     - Multilingual aliases (RU/EN/HE) via ``ITEM_ALIAS_LOOKUP``
     - Quantities: ``"5 коробок"``, ``"boxes 3"``, ``"3 קרטונים"``
     - Multi-word aliases: ``"стиральная машина"``, ``"dining table"``
     - Deduplication: same key -> quantities summed
+
+    Results for the default lookup are memoised per *text*, ignoring case
+    and surrounding whitespace; every call still returns fresh dicts, so
+    callers may mutate them freely.  A custom *alias_lookup* reuses its
+    compiled matcher across calls but is not memoised per *text*.
+    ``extract_items.cache_clear()`` empties the cache.
     """
-    if alias_lookup is None:
-        from app.core.bots.moving_bot_v1.pricing import ITEM_ALIAS_LOOKUP
-        alias_lookup = ITEM_ALIAS_LOOKUP
+    if not text:
+        pairs = ()
+    elif alias_lookup is None:
+        # Case and surrounding whitespace never change the result, so key
+        # the cache on the folded text to share entries between variants.
+        pairs = _extract_items_cached(text.strip().lower())
+    elif alias_lookup:
+        pairs = _extract_item_pairs(
+            text, _get_alias_matcher(tuple(alias_lookup.items())),
+        )
+    else:
+        pairs = ()
+    if as_dict:
+        return dict(pairs)
+    return [{"key": k, "qty": v} for k, v in pairs]
+
+
+@lru_cache(maxsize=4096)
+def _extract_items_cached(text: str) -> tuple[tuple[str, int], ...]:
+    """Memoised :func:`extract_items` body for ``ITEM_ALIAS_LOOKUP``."""
+    return _extract_item_pairs(text, _get_item_matcher())
+
 
-    if not text or not alias_lookup:
-        return []
+extract_items.cache_clear = _extract_items_cached.cache_clear  # type: ignore[attr-defined]
 
+
+def _extract_item_pairs(
+    text: str,
+    matcher: _AliasMatcher,
+) -> tuple[tuple[str, int], ...]:
+    """Return ``(canonical_key, qty)`` pairs for *text* in first-seen order."""
+    text = text.lower()
+    key = matcher._whole.get(text)
+    if key is not None:
+        return ((key, 1),)
+    # Aliases are stored composed; decomposed input ("и" + combining breve
+    # from some keyboards) would otherwise miss the automaton.
+    if not unicodedata.is_normalized("NFC", text):
+        text = unicodedata.normalize("NFC", text)
     # Strip composite dimension patterns (e.g. "230x150x66 см") BEFORE
     # splitting, so that "230x" is not mistaken for qty by _EXPLICIT_QTY_PATTERN.
     text = _strip_dimensions(text)
 
     # Split into fragments by separators
-    fragments = _ITEM_SEPARATORS.split(text.strip())
+    fragments = _split_fragments(text)
 
     # Accumulate: canonical_key -> total qty
     found: dict[str, int] = {}
 
     for fragment in fragments:
-        fragment = fragment.strip().lower()
+        fragment = fragment.strip()
         if not fragment:
             continue
 
-        # Try to find a matching alias (longest-first from sorted lookup)
-        matched_key = None
-        for alias, canonical_key in alias_lookup.items():
-            if alias in fragment:
-                matched_key = canonical_key
-                # Remove the alias from fragment to isolate quantity
-                remainder = fragment.replace(alias, "", 1).strip()
-                break
-
-        if matched_key is None:
+        # Find the matching alias (longest-first from sorted lookup)
+        hit = matcher.match(fragment)
+        if hit is None:
             continue  # no match — skip
+        alias, matched_key = hit
+        # Remove the alias from fragment to isolate quantity
+        remainder = fragment.replace(alias, "", 1).strip()
 
-        # Extract quantity from the remainder (text left after removing alias)
+        # Extract quantity from the remainder (text left after removing alias).
+        # Every quantity pattern needs a digit, so one cheap digit scan
+        # gates the heavier marker/attribute searches.
         qty = 1
-        if remainder:
+        if not remainder:
+            # Fragment was just the alias ("диван"): nothing to scan.
+            bare_match = None
+        elif remainder.isdecimal():
+            # Plain count ("2 кресла" -> "2"): no marker or attribute can
+            # apply, so skip the regexes entirely.
+            bare_match = None
+            parsed_qty = int(remainder)
+            if 0 < parsed_qty <= _QTY_SANITY_CAP:
+                qty = parsed_qty
+        else:
+            bare_match = _BARE_QTY_PATTERN.search(remainder)
+        if bare_match:
             # 1) Try explicit markers first (x5, 5шт, qty:5, etc.)
             explicit_match = _EXPLICIT_QTY_PATTERN.search(remainder)
             if explicit_match:
@@ -749,20 +1027,17 @@ def extract_items(
                 parsed_qty = int(raw)
                 if parsed_qty > 0:
                     qty = parsed_qty
-            else:
-                # 2) Check for attribute-like numbers -> suppress qty
-                if not _ATTR_SUFFIXES.search(remainder):
-                    # 3) Bare number fallback with sanity cap
-                    bare_match = _BARE_QTY_PATTERN.search(remainder)
-                    if bare_match:
-                        parsed_qty = int(bare_match.group(1))
-                        if 0 < parsed_qty <= _QTY_SANITY_CAP:
-                            qty = parsed_qty
+            # 2) Check for attribute-like numbers -> suppress qty
+            elif not _ATTR_SUFFIXES.search(remainder):
+                # 3) Bare number fallback with sanity cap
+                parsed_qty = int(bare_match.group(1))
+                if 0 < parsed_qty <= _QTY_SANITY_CAP:
+                    qty = parsed_qty
 
         # Accumulate
         found[matched_key] = found.get(matched_key, 0) + qty
 
-    return [{"key": k, "qty": v} for k, v in found.items()]
+    return tuple(found.items())
 
 
 # ---------------------------------------------------------------------------
@@ -789,6 +1064,13 @@ _ROOM_PATTERNS: list[tuple[re.Pattern, str]] = [
     (re.compile(r"(?:кухн|kitchen|מטבח)", re.IGNORECASE), "kitchen"),
 ]
 
+# The same patterns grouped by room type once, so each detection stage
+# only runs the patterns it needs (original order kept within a type).
+_ROOM_PATTERNS_BY_TYPE: dict[str, tuple[re.Pattern, ...]] = {
+    room_type: tuple(p for p, rt in _ROOM_PATTERNS if rt == room_type)
+    for room_type in dict.fromkeys(rt for _, rt in _ROOM_PATTERNS)
+}
+
 # Volume mapping: room_count -> volume_category
 _ROOM_COUNT_TO_VOLUME: dict[int, str] = {
     1: "small",
@@ -812,15 +1094,20 @@ def detect_volume_from_rooms(text: str) -> str | None:
         return None
 
     t = text.lower()
+    by_type = _ROOM_PATTERNS_BY_TYPE
 
     # 1. Studio check (highest priority, immediate)
-    for pattern, room_type in _ROOM_PATTERNS:
-        if room_type == "studio" and pattern.search(t):
+    for pattern in by_type["studio"]:
+        if pattern.search(t):
             return "small"
 
+    # Every counted pattern starts with a number; most cargo texts have
+    # none, so one digit scan stands in for the five count patterns.
+    has_digits = _BARE_QTY_PATTERN.search(t) is not None
+
     # 2. N-room apartment (self-contained count, immediate return)
-    for pattern, room_type in _ROOM_PATTERNS:
-        if room_type == "apartment_rooms":
+    if has_digits:
+        for pattern in by_type["apartment_rooms"]:
             m = pattern.search(t)
             if m:
                 count = int(m.group(1))
@@ -830,17 +1117,17 @@ def detect_volume_from_rooms(text: str) -> str | None:
     major_room_count = 0
     found_any = False
 
-    for pattern, room_type in _ROOM_PATTERNS:
-        if room_type in ("bedroom", "room"):
-            m = pattern.search(t)
-            if m:
-                count = int(m.group(1))
-                major_room_count += count
-                found_any = True
-        elif room_type == "living":
-            if pattern.search(t):
-                major_room_count += 1
-                found_any = True
+    count_patterns = (*by_type["bedroom"], *by_type["room"]) if has_digits else ()
+    for pattern in count_patterns:
+        m = pattern.search(t)
+        if m:
+            count = int(m.group(1))
+            major_room_count += count
+            found_any = True
+    for pattern in by_type["living"]:
+        if pattern.search(t):
+            major_room_count += 1
+            found_any = True
 
     if not found_any or major_room_count <= 0:
         return None
@@ -852,6 +1139,31 @@ def detect_volume_from_rooms(text: str) -> str | None:
 # Volume detection from extracted items
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=1)
+def _get_volume_from_items_rules() -> tuple[
+    dict[str, float], frozenset[str], tuple[float, int, float, int, float],
+] | None:
+    """Return ``(mid_by_key, heavy_keys, thresholds)`` built once from config.
+
+    ``thresholds`` is ``(xl_mid, xl_heavy, large_mid, large_heavy,
+    medium_mid)``.  Returns ``None`` when the config section is absent.
+    """
+    from app.core.bots.moving_bot_v1.pricing import (
+        HEAVY_ITEM_KEYS, ITEM_MIDPOINTS, VOLUME_FROM_ITEMS_CONFIG,
+    )
+    if not VOLUME_FROM_ITEMS_CONFIG:
+        return None
+    cfg = VOLUME_FROM_ITEMS_CONFIG
+    thresholds = (
+        float(cfg.get("xl_items_mid", 1500)),
+        int(cfg.get("xl_heavy_count", 4)),
+        float(cfg.get("large_items_mid", 700)),
+        int(cfg.get("large_heavy_count", 2)),
+        float(cfg.get("medium_items_mid", 300)),
+    )
+    return ITEM_MIDPOINTS, HEAVY_ITEM_KEYS, thresholds
+
+
 def detect_volume_from_items(items: list[dict] | None) -> str | None:
     """Infer volume_category from extracted cargo items.
 
@@ -863,39 +1175,28 @@ def detect_volume_from_items(items: list[dict] | None) -> str | None:
     if not items:
         return None
 
-    from app.core.bots.moving_bot_v1.pricing import (
-        ITEM_CATALOG, VOLUME_FROM_ITEMS_CONFIG,
-    )
-    if not VOLUME_FROM_ITEMS_CONFIG:
+    rules = _get_volume_from_items_rules()
+    if rules is None:
         return None
-
-    heavy_keys = set(VOLUME_FROM_ITEMS_CONFIG.get("heavy_keys", []))
+    mid_by_key, heavy_keys, (
+        xl_mid, xl_heavy, large_mid, large_heavy, medium_mid,
+    ) = rules
 
     items_mid = 0.0
     heavy_count = 0
     for item in items:
         key = item.get("key", "")
         qty = item.get("qty", 1)
-        if key in ITEM_CATALOG:
-            lo, hi = ITEM_CATALOG[key]
-            items_mid += ((lo + hi) / 2) * qty
+        items_mid += mid_by_key.get(key, 0.0) * qty
         if key in heavy_keys:
             heavy_count += qty
 
-    xl_mid = float(VOLUME_FROM_ITEMS_CONFIG.get("xl_items_mid", 1500))
-    xl_heavy = int(VOLUME_FROM_ITEMS_CONFIG.get("xl_heavy_count", 4))
     if items_mid >= xl_mid or heavy_count >= xl_heavy:
         return "xl"
-
-    large_mid = float(VOLUME_FROM_ITEMS_CONFIG.get("large_items_mid", 700))
-    large_heavy = int(VOLUME_FROM_ITEMS_CONFIG.get("large_heavy_count", 2))
     if items_mid >= large_mid or heavy_count >= large_heavy:
         return "large"
-
-    medium_mid = float(VOLUME_FROM_ITEMS_CONFIG.get("medium_items_mid", 300))
     if items_mid >= medium_mid:
         return "medium"
-
     return None
 
 
@@ -950,12 +1251,12 @@ _LANDING_FIELDS: dict[str, str] = {
     "детали:": "details",
 }
 
-_VALID_MOVE_TYPES: set[str] = {
+_VALID_MOVE_TYPES: frozenset[str] = frozenset({
     "квартира",
     "офис",
     "только машина + водитель",
     "подъёмник / window lift",
-}
+})
 
 # Per-field max lengths for sanitisation
 _FIELD_MAX: dict[str, int] = {
@@ -966,6 +1267,36 @@ _FIELD_MAX: dict[str, int] = {
     "details": 500,
 }
 
+# Field prefix -> (LandingPrefill attribute, max length), one lookup per line
+_LANDING_FIELD_DISPATCH: dict[str, tuple[str, int]] = {
+    prefix: (attr, _FIELD_MAX.get(attr, 200))
+    for prefix, attr in _LANDING_FIELDS.items()
+}
+
+# One "Key: value" field line; the key is one of the _LANDING_FIELDS
+# prefixes (matched case-insensitively), the value excludes the
+# surrounding horizontal whitespace.
+_LANDING_FIELD_RE = re.compile(
+    r"^[^\S\n]*("
+    + "|".join(re.escape(prefix) for prefix in _LANDING_FIELDS)
+    + r")[^\S\n]*(.*?)[^\S\n]*$",
+    re.MULTILINE | re.IGNORECASE,
+)
+
+
+def _validate_landing_field(raw_value: str, max_len: int) -> str | None:
+    """Sanitise one landing field value; ``None`` means discard the line.
+
+    Each value is sanitised individually with its own length cap; a value
+    that was entirely payload (URL, HTML, script) is discarded.
+    """
+    if not raw_value:
+        return None
+    try:
+        return sanitize_text(raw_value, max_length=max_len) or None
+    except ValueError:
+        return None
+
 
 def parse_landing_prefill(text: str) -> LandingPrefill | None:
     """Detect and parse a landing page pre-fill message.
@@ -986,39 +1317,24 @@ def parse_landing_prefill(text: str) -> LandingPrefill | None:
     if not cleaned:
         return None
 
-    lines = cleaned.split("\n")
-    first_line = lines[0].strip().lower()
+    first_line = cleaned.partition("\n")[0].strip().lower()
 
     # Must start with the exact landing greeting
     if not first_line.startswith(_LANDING_SIGNATURE):
         return None
 
-    result = LandingPrefill()
-
-    for line in lines[1:]:
-        stripped = line.strip()
-        if not stripped:
-            continue
-        stripped_lower = stripped.lower()
-
-        for prefix, attr in _LANDING_FIELDS.items():
-            if stripped_lower.startswith(prefix):
-                raw_value = stripped[len(prefix):].strip()
-                if not raw_value:
-                    break
-                # Sanitise each field value individually
-                try:
-                    safe_value = sanitize_text(raw_value, max_length=_FIELD_MAX.get(attr, 200))
-                except ValueError:
-                    # Entire field was a payload — discard
-                    break
-                if not safe_value:
-                    break
-                setattr(result, attr, safe_value)
-                break
-
-    # Validate move_type against allowlist
-    if result.move_type and result.move_type.lower() not in _VALID_MOVE_TYPES:
-        result.move_type = None
-
-    return result
+    # The greeting line cannot match a field prefix, so the whole message
+    # is scanned in one pass; a repeated field keeps its last value.
+    fields: dict[str, str] = {}
+    for prefix, raw_value in _LANDING_FIELD_RE.findall(cleaned):
+        attr, max_len = _LANDING_FIELD_DISPATCH[prefix.lower()]
+        safe_value = _validate_landing_field(raw_value, max_len)
+        if safe_value:
+            fields[attr] = safe_value
+
+    # Validate move_type (last value wins) against allowlist
+    move_type = fields.get("move_type")
+    if move_type and move_type.lower() not in _VALID_MOVE_TYPES:
+        del fields["move_type"]
+
+    return LandingPrefill(**fields)
@@ -10,6 +10,7 @@ This module must NOT import bot handler modules.
 """
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 
@@ -146,21 +147,8 @@ def format_crew_message(lead_id: str, payload: dict[str, Any]) -> str:
         floors_str = f"{_floor_label(f_from, elev_from)} → {_floor_label(f_to, elev_to)}"
 
     # --- Items summary (from extract_items) ---
-    from app.core.bots.moving_bot_pricing import ITEM_LABELS
-
     cargo_items = custom.get("cargo_items") or []
-    items_str = ""
-    if cargo_items:
-        item_parts = []
-        for item in cargo_items:
-            key = item.get("key", "")
-            qty = item.get("qty", 1)
-            label = ITEM_LABELS.get(key, {}).get(lang) or key.replace("_", " ").capitalize()
-            if qty > 1:
-                item_parts.append(f"{label} ×{qty}")
-            else:
-                item_parts.append(label)
-        items_str = ", ".join(item_parts)
+    items_str = _format_items(cargo_items, lang) if cargo_items else ""
 
     # --- Estimate ---
     estimate_suppressed = custom.get("estimate_suppressed", False)
@@ -187,8 +175,7 @@ def format_crew_message(lead_id: str, payload: dict[str, Any]) -> str:
 
     if items_str:
         lines.append(f"{_L['items']}: {items_str}")
-    _no_extras = {"нет", "none", "אין", ""}
-    if extras_str and extras_str not in _no_extras:
+    if extras_str and extras_str not in _NO_EXTRAS:
         lines.append(f"{_L['services']}: {extras_str}")
     if estimate_str:
         lines.append(f"{_L['estimate']}: {estimate_str}")
@@ -202,24 +189,7 @@ def format_crew_message(lead_id: str, payload: dict[str, Any]) -> str:
 
 def _format_time_window(time_window: str | None, lang: str = "ru") -> str:
     """Format time window to human-readable localized string."""
-    _TW: dict[str, dict[str, str]] = {
-        "ru": {
-            "morning": "утро (08:00–12:00)", "afternoon": "день (12:00–17:00)",
-            "evening": "вечер (17:00–21:00)", "flexible": "гибко",
-            "exact": "точное время", "none": "не указано",
-        },
-        "en": {
-            "morning": "morning (08:00–12:00)", "afternoon": "afternoon (12:00–17:00)",
-            "evening": "evening (17:00–21:00)", "flexible": "flexible",
-            "exact": "exact time", "none": "not specified",
-        },
-        "he": {
-            "morning": "בוקר (08:00–12:00)", "afternoon": "צהריים (12:00–17:00)",
-            "evening": "ערב (17:00–21:00)", "flexible": "גמיש",
-            "exact": "שעה מדויקת", "none": "לא צוין",
-        },
-    }
-    labels = _TW.get(lang, _TW["ru"])
+    labels = _TIME_WINDOW_LABELS.get(lang, _TIME_WINDOW_LABELS["ru"])
     if time_window and time_window.startswith("exact:"):
         return f"{labels['exact']}: {time_window[6:]}"
     return labels.get(time_window, time_window or labels["none"])
@@ -227,27 +197,37 @@ def _format_time_window(time_window: str | None, lang: str = "ru") -> str:
 
 def _format_extras(extras: list | None, lang: str = "ru") -> str:
     """Format extras list to human-readable localized string."""
-    _EX: dict[str, dict[str, str]] = {
-        "ru": {
-            "loaders": "грузчики", "assembly": "сборка/разборка",
-            "packing": "упаковка", "none": "нет", "empty": "нет",
-        },
-        "en": {
-            "loaders": "movers", "assembly": "assembly/disassembly",
-            "packing": "packing", "none": "none", "empty": "none",
-        },
-        "he": {
-            "loaders": "סבלים", "assembly": "הרכבה/פירוק",
-            "packing": "אריזה", "none": "אין", "empty": "אין",
-        },
-    }
-    labels = _EX.get(lang, _EX["ru"])
+    labels = _EXTRAS_LABELS.get(lang, _EXTRAS_LABELS["ru"])
     if not extras:
         return labels["empty"]
     names = [labels.get(e, e) for e in extras if e != "none"]
     return ", ".join(names) if names else labels["empty"]
 
 
+@lru_cache(maxsize=8)
+def _item_labels(lang: str) -> dict[str, str]:
+    """Return ``{item_key: label}`` for *lang*, flattened once from ITEM_LABELS."""
+    from app.core.bots.moving_bot_pricing import ITEM_LABELS
+
+    return {
+        key: labels[lang]
+        for key, labels in ITEM_LABELS.items()
+        if labels.get(lang)
+    }
+
+
+def _format_items(cargo_items: list[dict], lang: str = "ru") -> str:
+    """Format extracted cargo items as ``"Label ×qty, Label"``."""
+    labels = _item_labels(lang)
+    parts = []
+    for item in cargo_items:
+        key = item.get("key", "")
+        qty = item.get("qty", 1)
+        label = labels.get(key) or key.replace("_", " ").capitalize()
+        parts.append(f"{label} ×{qty}" if qty > 1 else label)
+    return ", ".join(parts)
+
+
 # ---------------------------------------------------------------------------
 # Localized labels
 # ---------------------------------------------------------------------------
@@ -320,3 +300,39 @@ _CREW_VOLUME_LABELS: dict[str, dict[str, str]] = {
         "xl": "גדול מאוד (10+ מ\"ק)",
     },
 }
+
+_TIME_WINDOW_LABELS: dict[str, dict[str, str]] = {
+    "ru": {
+        "morning": "утро (08:00–12:00)", "afternoon": "день (12:00–17:00)",
+        "evening": "вечер (17:00–21:00)", "flexible": "гибко",
+        "exact": "точное время", "none": "не указано",
+    },
+    "en": {
+        "morning": "morning (08:00–12:00)", "afternoon": "afternoon (12:00–17:00)",
+        "evening": "evening (17:00–21:00)", "flexible": "flexible",
+        "exact": "exact time", "none": "not specified",
+    },
+    "he": {
+        "morning": "בוקר (08:00–12:00)", "afternoon": "צהריים (12:00–17:00)",
+        "evening": "ערב (17:00–21:00)", "flexible": "גמיש",
+        "exact": "שעה מדויקת", "none": "לא צוין",
+    },
+}
+
+_EXTRAS_LABELS: dict[str, dict[str, str]] = {
+    "ru": {
+        "loaders": "грузчики", "assembly": "сборка/разборка",
+        "packing": "упаковка", "none": "нет", "empty": "нет",
+    },
+    "en": {
+        "loaders": "movers", "assembly": "assembly/disassembly",
+        "packing": "packing", "none": "none", "empty": "none",
+    },
+    "he": {
+        "loaders": "סבלים", "assembly": "הרכבה/פירוק",
+        "packing": "אריזה", "none": "אין", "empty": "אין",
+    },
+}
+
+# Extras strings that mean "no services" — omitted from the message.
+_NO_EXTRAS = frozenset({"нет", "none", "אין", ""})
@@ -24,7 +24,7 @@ class Step(str, Enum):
 # UNIVERSAL LEAD DATA (flexible storage for any bot type)
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class LeadData:
     """
     Universal lead data container that works for any bot type.
@@ -32,6 +32,10 @@ class LeadData:
 
     For backward compatibility, we keep moving bot specific fields as defaults.
     New bots can use the 'custom' dict for their specific data.
+
+    Slotted: fixed fields need no per-instance ``__dict__``.  ``custom``
+    stays a plain dict because its keys are bot-defined and it is
+    serialised into the session JSON as-is.
     """
     # Common fields (used by moving bot, can be reused by others)
     cargo_description: Optional[str] = None
@@ -61,11 +65,12 @@ class LeadData:
 # UNIVERSAL SESSION STATE
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SessionState:
     """
     Universal session state that works for any bot type.
     The step field now accepts any string value, allowing bot-specific steps.
+    Slotted, like :class:`LeadData`.
     """
     tenant_id: str
     chat_id: str
@@ -82,7 +87,7 @@ class SessionState:
     updated_at: Optional[datetime] = field(default=None, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaItem:
     """Media attachment in a message.
 
@@ -97,7 +102,7 @@ class MediaItem:
     provider_media_id: Optional[str] = None  # Meta Cloud API media ID
 
 
-@dataclass
+@dataclass(slots=True)
 class LocationData:
     """GPS coordinates shared by the user (Phase 5).
 
@@ -110,7 +115,7 @@ class LocationData:
     address: Optional[str] = None    # Street address (Meta)
 
 
-@dataclass
+@dataclass(slots=True)
 class InboundMessage:
     """
     Normalized inbound message from any provider.
@@ -21,6 +21,7 @@ import logging
 import uuid
 from dataclasses import asdict
 from datetime import date, timedelta, datetime as _dt
+from functools import lru_cache
 from typing import Tuple, Optional
 
 logger = logging.getLogger(__name__)
@@ -99,7 +100,8 @@ def _get_pickup_count(state) -> int:
 
 def _compute_estimate(state) -> dict:
     """Build a price estimate from the collected session data."""
-    pickups = state.data.custom.get("pickups", [])
+    custom = state.data.custom
+    pickups = custom.get("pickups", [])
     pickup_count = _get_pickup_count(state)
 
     # Build pickup floors list from all pickups
@@ -119,11 +121,11 @@ def _compute_estimate(state) -> dict:
     extras_for_pricing = list(state.data.extras) if state.data.extras else []
 
     # Phase 8: Regional classification — determine distance_factor from geo
-    geo_points = state.data.custom.get("geo_points")
+    geo_points = custom.get("geo_points")
     distance_factor, region_info = classify_geo_points(geo_points)
 
     if region_info:
-        state.data.custom["region_classifications"] = {
+        custom["region_classifications"] = {
             k: {
                 "inside_metro": v.inside_metro,
                 "distance_km": v.distance_km,
@@ -135,10 +137,10 @@ def _compute_estimate(state) -> dict:
     pricing_cfg = PricingConfig(distance_factor=distance_factor) if distance_factor != 1.0 else None
 
     # Phase 9: volume category
-    volume_category = state.data.custom.get("volume_category")
+    volume_category = custom.get("volume_category")
 
     # Phase 10: extracted cargo items
-    cargo_items = state.data.custom.get("cargo_items") or None
+    cargo_items = custom.get("cargo_items") or None
 
     # Phase 14: text-based route band classification
     route_band = None
@@ -147,7 +149,7 @@ def _compute_estimate(state) -> dict:
     if addr_from_text and addr_to_text:
         route_cls = classify_route(addr_from_text, addr_to_text)
         route_band = route_cls.band.value
-        state.data.custom["route_classification"] = {
+        custom["route_classification"] = {
             "band": route_band,
             "from_locality": route_cls.from_locality,
             "to_locality": route_cls.to_locality,
@@ -175,31 +177,44 @@ def _pickup_question(key: str, n: int, lang: str) -> str:
     return get_text(key, lang).replace("{n}", str(n))
 
 
+@lru_cache(maxsize=16)
+def _welcome_template(lang: str, has_phone: bool) -> str:
+    """Render the welcome block once per ``(lang, has_phone)`` combination.
+
+    The contact line keeps its ``{phone}`` placeholder; the caller fills
+    in the tenant's number.
+    """
+    parts = [get_text("welcome", lang)]
+    if has_phone:
+        parts.append(get_text("welcome_contact", lang))
+    parts.append(get_text("hint_can_reset", lang))
+    parts.append("")  # blank line before cargo question
+    parts.append(get_text("q_cargo", lang))
+    return "\n".join(parts)
+
+
 def _build_welcome_block(lang: str, tenant_id: str) -> str:
     """Build the full welcome message: welcome + optional contact + hint + cargo question.
 
     Resolves operator phone per-tenant via ``get_operator_config()``.
     If no phone is configured, the contact line is omitted.
     """
-    parts = [get_text("welcome", lang)]
-
     op_cfg = get_operator_config(tenant_id)
     phone = op_cfg.get("operator_whatsapp")
     if phone:
-        parts.append(get_text("welcome_contact", lang).format(phone=phone))
+        return _welcome_template(lang, True).replace("{phone}", phone)
+    return _welcome_template(lang, False)
 
-    parts.append(get_text("hint_can_reset", lang))
-    parts.append("")  # blank line before cargo question
-    parts.append(get_text("q_cargo", lang))
 
-    return "\n".join(parts)
+@lru_cache(maxsize=16)
+def _photo_menu_template(lang: str, from_rooms: bool) -> str:
+    """Resolve the photo menu question once per ``(lang, from_rooms)``."""
+    return get_text("q_photo_menu_rooms" if from_rooms else "q_photo_menu", lang)
 
 
 def _photo_menu_text(state: SessionState, lang: str) -> str:
     """Return photo menu question — stronger wording for room-based moves."""
-    if state.data.custom.get("volume_from_rooms"):
-        return get_text("q_photo_menu_rooms", lang)
-    return get_text("q_photo_menu", lang)
+    return _photo_menu_template(lang, bool(state.data.custom.get("volume_from_rooms")))
 
 
 class MovingBotHandler:
@@ -604,22 +619,23 @@ class MovingBotHandler:
         lang: str,
     ) -> Tuple[SessionState, str, bool]:
         """Compute the price estimate, store it, and show the summary."""
+        custom = state.data.custom
         est = _compute_estimate(state)
 
         # Parsing quality check: if user wrote a lot but we extracted
         # nothing/very little, the estimate is unreliable — suppress it.
-        cargo_raw = state.data.custom.get("cargo_raw", "")
-        cargo_items = state.data.custom.get("cargo_items") or []
+        cargo_raw = custom.get("cargo_raw", "")
+        cargo_items = custom.get("cargo_items") or []
         estimate_suppressed = (
             len(cargo_raw) > 30
             and len(cargo_items) == 0
-            and not state.data.custom.get("volume_category")
+            and not custom.get("volume_category")
         )
 
         if estimate_suppressed:
-            state.data.custom["estimate_suppressed"] = True
+            custom["estimate_suppressed"] = True
             # Still store breakdown for operator debugging, but no price for user
-            state.data.custom["estimate_breakdown"] = est["breakdown"]
+            custom["estimate_breakdown"] = est["breakdown"]
 
             # Phase 15: structured observability log
             breakdown = est["breakdown"]
@@ -630,7 +646,7 @@ class MovingBotHandler:
                 "cargo_raw_len": len(cargo_raw),
                 "items_count": 0,
                 "volume_category": None,
-                "source": state.data.custom.get("source", "chat"),
+                "source": custom.get("source", "chat"),
             }
             logger.info("estimate_suppressed", extra=log_data)
 
@@ -638,10 +654,10 @@ class MovingBotHandler:
             return state, get_text("estimate_no_price", lang), False
 
         # Normal path — store estimate and show to user
-        state.data.custom["estimate_min"] = est["estimate_min"]
-        state.data.custom["estimate_max"] = est["estimate_max"]
-        state.data.custom["estimate_currency"] = est["currency"]
-        state.data.custom["estimate_breakdown"] = est["breakdown"]
+        custom["estimate_min"] = est["estimate_min"]
+        custom["estimate_max"] = est["estimate_max"]
+        custom["estimate_currency"] = est["currency"]
+        custom["estimate_breakdown"] = est["breakdown"]
 
         # Phase 15: structured observability log
         breakdown = est["breakdown"]
@@ -651,7 +667,7 @@ class MovingBotHandler:
             "tenant_id": state.tenant_id,
             "estimate_min": est["estimate_min"],
             "estimate_max": est["estimate_max"],
-            "volume_category": state.data.custom.get("volume_category"),
+            "volume_category": custom.get("volume_category"),
             "route_band": breakdown.get("route_band"),
             "route_fee": breakdown.get("route_fee", 0),
             "route_minimum": breakdown.get("route_minimum", 0),
@@ -661,8 +677,8 @@ class MovingBotHandler:
             "volume_surcharge": breakdown.get("volume_surcharge", 0),
             "extras_adjustment": breakdown.get("extras_adjustment", 0),
             "items_count": len(cargo_items),
-            "pickup_count": state.data.custom.get("pickup_count", 1),
-            "source": state.data.custom.get("source", "chat"),
+            "pickup_count": custom.get("pickup_count", 1),
+            "source": custom.get("source", "chat"),
             "complexity_score": breakdown.get("complexity_score", 0),
             "complexity_triggers": breakdown.get("complexity_triggers", []),
             "complexity_applied": breakdown.get("complexity_applied", False),
@@ -672,7 +688,7 @@ class MovingBotHandler:
         # Global display toggle: operator still sees estimate_min/max,
         # but user and crew get the no-price message.
         if not _app_settings.estimate_display_enabled:
-            state.data.custom["estimate_display_disabled"] = True
+            custom["estimate_display_disabled"] = True
             state.step = "estimate"
             return state, get_text("estimate_no_price", lang), False
 
@@ -696,27 +712,28 @@ class MovingBotHandler:
         operator-visible hints but the structured steps still run
         (landing data is approximate — city names, not full addresses).
         """
-        state.data.custom["source"] = "landing_prefill"
+        custom = state.data.custom
+        custom["source"] = "landing_prefill"
 
         # 1. Fill cargo from details or move_type
         if prefill.details:
             state.data.cargo_description = prefill.details
-            state.data.custom["cargo_raw"] = prefill.details
-            state.data.custom["cargo_items"] = extract_items(prefill.details)
+            custom["cargo_raw"] = prefill.details
+            custom["cargo_items"] = extract_items(prefill.details)
             room_vol = detect_volume_from_rooms(prefill.details)
             if room_vol:
-                state.data.custom["volume_category"] = room_vol
-                state.data.custom["volume_from_rooms"] = True
+                custom["volume_category"] = room_vol
+                custom["volume_from_rooms"] = True
             else:
                 inferred_vol = detect_volume_from_items(
-                    state.data.custom.get("cargo_items") or []
+                    custom.get("cargo_items") or []
                 )
                 if inferred_vol:
-                    state.data.custom["volume_category"] = inferred_vol
-                    state.data.custom["volume_from_items"] = True
+                    custom["volume_category"] = inferred_vol
+                    custom["volume_from_items"] = True
         elif prefill.move_type:
             state.data.cargo_description = prefill.move_type
-            state.data.custom["cargo_raw"] = prefill.move_type
+            custom["cargo_raw"] = prefill.move_type
 
         # 2. Store addresses and date as operator context
         if prefill.addr_from:
@@ -724,21 +741,21 @@ class MovingBotHandler:
         if prefill.addr_to:
             state.data.addr_to = prefill.addr_to
         if prefill.date_text:
-            state.data.custom["landing_date_hint"] = prefill.date_text
+            custom["landing_date_hint"] = prefill.date_text
             # Phase 15: attempt structured date parsing
             try:
                 parsed_date = parse_date(prefill.date_text)
-                state.data.custom["move_date"] = parsed_date.isoformat()
-                state.data.custom["landing_date_parsed"] = True
+                custom["move_date"] = parsed_date.isoformat()
+                custom["landing_date_parsed"] = True
             except ValueError:
-                state.data.custom["landing_date_parsed"] = False
+                custom["landing_date_parsed"] = False
         if prefill.move_type:
-            state.data.custom["landing_move_type"] = prefill.move_type
+            custom["landing_move_type"] = prefill.move_type
 
         # Phase 15: attempt route classification from addresses
         if prefill.addr_from and prefill.addr_to:
             route_cls = classify_route(prefill.addr_from, prefill.addr_to)
-            state.data.custom["route_classification"] = {
+            custom["route_classification"] = {
                 "band": route_cls.band.value,
                 "from_locality": route_cls.from_locality,
                 "to_locality": route_cls.to_locality,
@@ -756,8 +773,8 @@ class MovingBotHandler:
             return state, f"{ack}\n\n{get_text('q_cargo', lang)}", False
 
         # Cargo filled — skip volume when we have enough info
-        has_volume = bool(state.data.custom.get("volume_category"))
-        has_items = bool(state.data.custom.get("cargo_items"))
+        has_volume = bool(custom.get("volume_category"))
+        has_items = bool(custom.get("cargo_items"))
         if not has_volume and not has_items:
             # No rooms, no items → ask volume explicitly
             state.step = "volume"
@@ -775,8 +792,8 @@ class MovingBotHandler:
             return state, f"{ack}\n\n{q}", False
 
         # No landing addresses → normal flow: pickup count
-        state.data.custom["pickup_count"] = 1
-        state.data.custom["pickups"] = []
+        custom["pickup_count"] = 1
+        custom["pickups"] = []
         state.step = "pickup_count"
         return state, f"{ack}\n\n{get_text('q_pickup_count', lang)}", False
 
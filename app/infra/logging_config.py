@@ -161,9 +161,9 @@ class LogContext:
 def mask_coordinates(lat: float, lon: float) -> str:
     """Mask GPS coordinates for logging to prevent location spoofing.
 
-    Example: ``mask_coordinates(32.794, 34.989)`` → ``"32.7**, 34.9**"``
+    Example: ``mask_coordinates(32.794, 34.989)`` → ``"32.8**, 35.0**"``
 
-    Shows only the first decimal digit (roughly ±10 km precision),
+    Rounds to one decimal place (roughly ±10 km precision),
     which is enough for debugging without exposing exact user location.
     """
     return f"{lat:.1f}**, {lon:.1f}**"
\ No newline at end of file
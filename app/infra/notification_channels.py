@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import abc
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 import aiohttp
 
@@ -519,6 +520,32 @@ _CHANNELS: dict[str, type[NotificationChannel]] = {
 }
 
 
+@lru_cache(maxsize=256)
+def _build_channel(
+    channel_name: str,
+    operator_whatsapp: str | None,
+    provider: str,
+    twilio_content_sid: str | None,
+) -> NotificationChannel:
+    """Construct a channel for a resolved operator config.
+
+    Channels hold only their destination config, so one instance per
+    distinct config is shared across notifications.  Keyed on the resolved
+    values (not tenant_id) so tenant reloads and settings changes are
+    picked up without explicit invalidation.
+    """
+    channel_class = _CHANNELS[channel_name]
+
+    # Pass per-tenant config to channels that support it
+    if channel_class is WhatsAppChannel:
+        return channel_class(
+            operator_whatsapp=operator_whatsapp,
+            provider=provider,
+            twilio_content_sid=twilio_content_sid,
+        )
+    return channel_class()
+
+
 def get_notification_channel(*, tenant_id: str | None = None) -> NotificationChannel:
     """
     Get the configured notification channel.
@@ -543,17 +570,12 @@ def get_notification_channel(*, tenant_id: str | None = None) -> NotificationCha
         logger.error(f"Unknown notification channel: {channel_name}")
         return DisabledChannel()
 
-    channel_class = _CHANNELS[channel_name]
-
-    # Pass per-tenant config to channels that support it
-    if channel_class is WhatsAppChannel:
-        channel = channel_class(
-            operator_whatsapp=op_cfg.get("operator_whatsapp"),
-            provider=op_cfg.get("operator_whatsapp_provider", "twilio"),
-            twilio_content_sid=op_cfg.get("twilio_content_sid"),
-        )
-    else:
-        channel = channel_class()
+    channel = _build_channel(
+        channel_name,
+        op_cfg.get("operator_whatsapp"),
+        op_cfg.get("operator_whatsapp_provider", "twilio"),
+        op_cfg.get("twilio_content_sid"),
+    )
 
     if not channel.is_configured():
         logger.warning(
@@ -13,6 +13,7 @@ Configure via settings:
 """
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
@@ -177,53 +178,64 @@ async def _send_twilio_template_fallback(message) -> bool:
         return False
 
 
+_PHONE_MASK = "***"
+
+
 def _mask_phone(phone: str) -> str:
     """Mask phone number for logging: +1234567890 -> +123***7890"""
     if not phone:
-        return "***"
+        return _PHONE_MASK
     # Remove whatsapp: prefix if present
-    clean = phone.replace("whatsapp:", "").strip()
+    clean = phone.removeprefix("whatsapp:").strip()
     if len(clean) <= 6:
-        return "***"
-    return f"{clean[:4]}***{clean[-4:]}"
+        return _PHONE_MASK
+    return f"{clean[:4]}{_PHONE_MASK}{clean[-4:]}"
+
+
+_EXTRAS_LABELS: dict[str, str] = {
+    "loaders": "грузчики",
+    "assembly": "сборка/разборка",
+    "packing": "упаковка",
+}
 
 
 def _format_extras(extras: list[str] | None) -> str:
     """Format extras list to Russian labels."""
     if not extras:
         return "нет"
+    return ", ".join([_EXTRAS_LABELS.get(e, e) for e in extras if e != "none"])
+
 
-    labels = {
-        "loaders": "грузчики",
-        "assembly": "сборка/разборка",
-        "packing": "упаковка",
-        "none": "нет",
-    }
-    return ", ".join(labels.get(e, e) for e in extras if e != "none")
+_TIME_WINDOW_LABELS: dict[str, str] = {
+    # Legacy (Phase 1); "today" carries the date, see _format_time_window
+    "tomorrow": "завтра",
+    "soon": "в ближайшие дни",
+    # Phase 2: time slot values
+    "morning": "утро (08:00–12:00)",
+    "afternoon": "день (12:00–16:00)",
+    "evening": "вечер (16:00–20:00)",
+    "flexible": "время не определено",
+}
 
 
 def _format_time_window(time_window: str | None) -> str:
     """Format time window to Russian with date."""
-    today = datetime.now()
-    date_str = today.strftime("%d/%m/%Y")
-
-    labels = {
-        # Legacy (Phase 1)
-        "today": f"сегодня ({date_str})",
-        "tomorrow": "завтра",
-        "soon": "в ближайшие дни",
-        # Phase 2: time slot values
-        "morning": "утро (08:00–12:00)",
-        "afternoon": "день (12:00–16:00)",
-        "evening": "вечер (16:00–20:00)",
-        "flexible": "время не определено",
-    }
+    if not time_window:
+        return "не указано"
+
+    label = _TIME_WINDOW_LABELS.get(time_window)
+    if label is not None:
+        return label
+
+    # The only label that changes from day to day
+    if time_window == "today":
+        return f"сегодня ({datetime.now().strftime('%d/%m/%Y')})"
 
     # Handle "exact:HH:MM" format from Phase 2
-    if time_window and time_window.startswith("exact:"):
+    if time_window.startswith("exact:"):
         return f"точное время: {time_window[6:]}"
 
-    return labels.get(time_window, time_window or "не указано")
+    return time_window
 
 
 def format_lead_message(chat_id: str, payload: dict[str, Any]) -> str:
@@ -272,23 +284,24 @@ def format_lead_message(chat_id: str, payload: dict[str, Any]) -> str:
     # Phase 4: multi-pickup formatting
     pickups = custom.get("pickups", [])
 
+    # Multi-pickup uses "Адреса:" (plural) followed by one line per stop
+    addr_lines = ["Адреса:"]
     if len(pickups) > 1:
         # Multi-pickup: numbered list of pickup locations + delivery
-        addr_lines = []
         for i, p in enumerate(pickups, 1):
             pickup_addr = _t(f"pickup_{i}_addr", p.get("addr")) or "не указано"
             line = f"  Забор {i}: {pickup_addr}"
-            floor_val = _t(f"pickup_{i}_floor", p.get("floor"))
+            raw_floor = p.get("floor")
+            floor_val = _t(f"pickup_{i}_floor", raw_floor)
             if floor_val and floor_val != "—":
                 line += f" (этаж: {floor_val})"
-            elif p.get("floor") and p["floor"] != "—":
-                line += f" (этаж: {p['floor']})"
+            elif raw_floor and raw_floor != "—":
+                line += f" (этаж: {raw_floor})"
             addr_lines.append(line)
         delivery = addr_to or "не указано"
         if floor_to:
             delivery += f" (этаж: {floor_to})"
         addr_lines.append(f"  Доставка: {delivery}")
-        addresses = "\n".join(addr_lines)
     elif addr_from or addr_to:
         pickup = addr_from or "не указано"
         if floor_from:
@@ -296,16 +309,16 @@ def format_lead_message(chat_id: str, payload: dict[str, Any]) -> str:
         delivery = addr_to or "не указано"
         if floor_to:
             delivery += f" (этаж: {floor_to})"
-        addresses = f"{pickup} → {delivery}"
+        addr_lines = [f"Адрес: {pickup} → {delivery}"]
     else:
-        addresses = data.get("addresses", "не указано")
+        addr_lines = [f"Адрес: {data.get('addresses', 'не указано')}"]
     time_window_str = _format_time_window(data.get("time_window"))
     # Phase 2: prepend ISO move_date from custom dict when available
     move_date = custom.get("move_date")
     if move_date:
         time_window_str = f"{move_date}, {time_window_str}"
     extras = _format_extras(data.get("extras"))
-    details = _t("details_free", data.get("details_free")) or data.get("custom", {}).get("notes")
+    details = _t("details_free", data.get("details_free")) or custom.get("notes")
     photo_count = data.get("photo_count", 0)
 
     # Phase 3: pricing estimate
@@ -330,12 +343,6 @@ def format_lead_message(chat_id: str, payload: dict[str, Any]) -> str:
                 else:
                     geo_lines.append(f"  {label}: {map_link}")
 
-    # Multi-pickup uses "Адреса:" (plural) with multi-line block
-    if len(pickups) > 1:
-        addr_label = f"Адреса:\n{addresses}"
-    else:
-        addr_label = f"Адрес: {addresses}"
-
     # Lead number (sequential, from DB migration 010)
     lead_number = custom.get("lead_number")
     lead_header = "📦 Новая заявка"
@@ -348,11 +355,12 @@ def format_lead_message(chat_id: str, payload: dict[str, Any]) -> str:
         "",
         f"Статус: Получена\n",
         f"Что везем: {cargo}\n",
-        addr_label,
+        *addr_lines,
     ]
 
     if geo_lines:
-        lines.append(f"\n📍 Геоточки:\n" + "\n".join(geo_lines))
+        lines.append("\n📍 Геоточки:")
+        lines.extend(geo_lines)
 
     lines += [
         f"\nДата: {time_window_str}\n",
@@ -365,7 +373,7 @@ def format_lead_message(chat_id: str, payload: dict[str, Any]) -> str:
     # Operator debug: estimate breakdown (when enabled)
     estimate_breakdown = custom.get("estimate_breakdown")
     if settings.operator_estimate_debug and estimate_breakdown:
-        vol_cat = data.get("custom", {}).get("volume_category") or "—"
+        vol_cat = custom.get("volume_category") or "—"
         route_b = estimate_breakdown.get("route_band") or "нет"
         complexity_score = estimate_breakdown.get("complexity_score", 0)
         complexity_triggers = estimate_breakdown.get("complexity_triggers", [])
@@ -418,7 +426,7 @@ def format_lead_message(chat_id: str, payload: dict[str, Any]) -> str:
 
     # Original text block: when translation was used in main body,
     # show originals for reference (operator can compare if needed)
-    if _translated and trans_meta.get("status") in ("ok", "unchanged"):
+    if _translated:
         source_lang = trans_meta.get("source_lang", "")
         lang_labels = {"ru": "RU", "en": "EN", "he": "HE"}
         lang_label = lang_labels.get(source_lang, source_lang.upper())
@@ -465,6 +473,18 @@ class _MediaDelivery:
     video_count: int = 0           # Actual video count (from media_assets)
 
 
+# Job retries back off 5s → 10s → 20s, so a failed send is retried well
+# within this window; reuse the media lookup instead of re-querying both repos.
+_MEDIA_CACHE_TTL_S = 60.0
+_MEDIA_CACHE_MAX = 1024
+_media_cache: dict[tuple[str, str], tuple[float, _MediaDelivery]] = {}
+
+
+def _reset_media_cache() -> None:
+    """Clear the per-lead media cache (for testing)."""
+    _media_cache.clear()
+
+
 async def _get_media_for_lead(tenant_id: str, lead_id: str) -> _MediaDelivery:
     """
     Get media for a lead with photo threshold optimization (G4.2).
@@ -475,7 +495,13 @@ async def _get_media_for_lead(tenant_id: str, lead_id: str) -> _MediaDelivery:
     - Videos → always signed links (never inline)
 
     Returns structured delivery with inline URLs and link text lines.
+    Complete lookups are cached per lead for ``_MEDIA_CACHE_TTL_S``.
     """
+    cache_key = (tenant_id, lead_id)
+    cached = _media_cache.get(cache_key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
     from app.infra.pg_photo_repo_async import get_photo_repo
     from app.transport.security import generate_signed_media_url
 
@@ -497,6 +523,9 @@ async def _get_media_for_lead(tenant_id: str, lead_id: str) -> _MediaDelivery:
     def _signed_url(asset_id: str) -> str:
         return generate_signed_media_url(base_url, asset_id)
 
+    # Partial results (a repo lookup failed) are not cached
+    complete = True
+
     # --- Photos (existing photos table) ---
     try:
         photo_repo = get_photo_repo()
@@ -504,6 +533,7 @@ async def _get_media_for_lead(tenant_id: str, lead_id: str) -> _MediaDelivery:
     except Exception as e:
         logger.warning("Failed to get photos for lead %s: %s", lead_id[:8], e)
         photos = []
+        complete = False
 
     photo_urls_all: list[str] = []
     for photo in photos:
@@ -529,6 +559,7 @@ async def _get_media_for_lead(tenant_id: str, lead_id: str) -> _MediaDelivery:
     except Exception as e:
         logger.warning("Failed to get media assets for lead %s: %s", lead_id[:8], e)
         assets = []
+        complete = False
 
     video_count = 0
     for asset in assets:
@@ -540,12 +571,18 @@ async def _get_media_for_lead(tenant_id: str, lead_id: str) -> _MediaDelivery:
         if asset.kind == "video":
             video_count += 1
 
-    return _MediaDelivery(
+    delivery = _MediaDelivery(
         inline_photo_urls=inline_urls,
         link_lines=link_lines,
         photo_count=len(photos),
         video_count=video_count,
     )
+    if complete:
+        if len(_media_cache) >= _MEDIA_CACHE_MAX:
+            # Evict the oldest entry (dicts keep insertion order)
+            _media_cache.pop(next(iter(_media_cache)))
+        _media_cache[cache_key] = (time.monotonic() + _MEDIA_CACHE_TTL_S, delivery)
+    return delivery
 
 
 async def _get_photo_urls_for_lead(tenant_id: str, lead_id: str) -> list[str]:
@@ -647,9 +684,11 @@ async def notify_operator(
     resolved_tenant_id = tenant_id or settings.tenant_id
 
     try:
+        # Unwrap nested/flat payload once; translation mutates it in place
+        data = payload.get("data", payload)
+
         # Translate operator lead payload (if enabled and source != target)
-        _payload_data = payload.get("data", payload)
-        _source_lang = _payload_data.get("custom", {}).get("session_language") or "ru"
+        _source_lang = data.get("custom", {}).get("session_language") or "ru"
         try:
             from app.core.i18n.lead_translator import translate_lead_payload
             await translate_lead_payload(payload, _source_lang)
@@ -658,7 +697,6 @@ async def notify_operator(
 
         # EPIC G4.2: Get media with threshold optimization
         # Always fetch — covers photos, videos, and other media assets
-        data = payload.get("data", payload)
         photo_urls = []
         media_link_lines: list[str] = []
 
@@ -13,6 +13,15 @@ from app.core.handlers.registry import register_handlers
 register_handlers(["moving_bot_v1"])
 
 
+@pytest.fixture(autouse=True)
+def _reset_media_cache():
+    """Start every test with an empty per-lead media cache."""
+    from app.infra.notification_service import _reset_media_cache
+    _reset_media_cache()
+    yield
+    _reset_media_cache()
+
+
 @pytest.fixture
 def sample_twilio_form_data():
     """Sample Twilio webhook form data"""
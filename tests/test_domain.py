@@ -60,6 +60,20 @@ class TestInboundMessage:
         assert msg.has_media()
         assert msg.is_photo()
 
+    def test_message_is_slotted(self):
+        msg = InboundMessage(
+            tenant_id="tenant_01",
+            provider="twilio",
+            chat_id="+12345678900",
+            message_id="SM123",
+            media=[MediaItem(url="https://example.com/photo.jpg")],
+        )
+        assert not hasattr(msg, "__dict__")
+        assert not hasattr(msg.media[0], "__dict__")
+        # Fields stay assignable (job worker fills in resolved media URLs)
+        msg.media[0].url = "https://cdn.example.com/photo.jpg"
+        assert msg.media[0].url == "https://cdn.example.com/photo.jpg"
+
     def test_empty_message(self):
         msg = InboundMessage(
             tenant_id="tenant_01",
@@ -116,3 +130,11 @@ class TestSessionState:
             data=LeadData(cargo_description="Furniture")
         )
         assert state.data.cargo_description == "Furniture"
+
+    def test_session_state_is_slotted(self):
+        state = SessionState(tenant_id="tenant_01", chat_id="+1", lead_id="lead_123")
+        assert not hasattr(state, "__dict__")
+        assert not hasattr(state.data, "__dict__")
+        # custom stays a free-form dict (serialised into session JSON)
+        state.data.custom["cargo_raw"] = "sofa"
+        assert state.data.get("cargo_raw") == "sofa"
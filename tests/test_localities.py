@@ -222,6 +222,18 @@ class TestFindLocality:
         assert loc is not None
         assert loc.code == 70
 
+    def test_longest_key_wins(self):
+        """'tel aviv yafo' beats the shorter 'tel aviv' alias and 'yafo'."""
+        loc = find_locality("Yafo / Tel Aviv - Yafo, Jaffa port")
+        assert loc is not None
+        assert loc.code == 5000
+
+    def test_later_boundary_occurrence_matches(self):
+        """A name embedded in a word earlier in the text doesn't mask it."""
+        loc = find_locality("xhaifa, haifa")
+        assert loc is not None
+        assert loc.code == 4000
+
 
 # ============================================================================
 # RU aliases integration
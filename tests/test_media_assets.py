@@ -596,6 +596,63 @@ class TestPhotoThreshold:
         assert len(delivery.inline_photo_urls) == 5
         assert len(delivery.link_lines) == 0
 
+    @pytest.mark.asyncio
+    async def test_retry_reuses_cached_lookup(self):
+        """A second lookup for the same lead within the TTL skips both repos."""
+        from app.infra.notification_service import _get_media_for_lead
+
+        mock_photos = [SimpleNamespace(id=uuid4(), s3_url="http://cdn/photo.jpg")]
+
+        with patch("app.infra.notification_service.settings") as mock_settings, \
+             patch("app.infra.pg_photo_repo_async.get_photo_repo") as mock_repo, \
+             patch("app.infra.pg_media_asset_repo_async.get_media_asset_repo") as mock_asset_repo:
+
+            mock_settings.max_inline_media_count = 5
+            mock_settings.s3_public_url = "http://cdn"
+            mock_settings.twilio_webhook_url = "http://bot/webhooks/twilio"
+
+            mock_repo_inst = AsyncMock()
+            mock_repo_inst.get_for_lead.return_value = mock_photos
+            mock_repo.return_value = mock_repo_inst
+
+            mock_asset_inst = AsyncMock()
+            mock_asset_inst.get_for_lead.return_value = []
+            mock_asset_repo.return_value = mock_asset_inst
+
+            first = await _get_media_for_lead("t1", "lead-1")
+            second = await _get_media_for_lead("t1", "lead-1")
+            await _get_media_for_lead("t1", "lead-2")
+
+        assert second is first
+        assert mock_repo_inst.get_for_lead.await_count == 2
+        assert mock_asset_inst.get_for_lead.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_lookup_not_cached(self):
+        """A repo error leaves the lead uncached so the retry queries again."""
+        from app.infra.notification_service import _get_media_for_lead
+
+        with patch("app.infra.notification_service.settings") as mock_settings, \
+             patch("app.infra.pg_photo_repo_async.get_photo_repo") as mock_repo, \
+             patch("app.infra.pg_media_asset_repo_async.get_media_asset_repo") as mock_asset_repo:
+
+            mock_settings.max_inline_media_count = 5
+            mock_settings.s3_public_url = "http://cdn"
+            mock_settings.twilio_webhook_url = "http://bot/webhooks/twilio"
+
+            mock_repo_inst = AsyncMock()
+            mock_repo_inst.get_for_lead.side_effect = RuntimeError("db down")
+            mock_repo.return_value = mock_repo_inst
+
+            mock_asset_inst = AsyncMock()
+            mock_asset_inst.get_for_lead.return_value = []
+            mock_asset_repo.return_value = mock_asset_inst
+
+            await _get_media_for_lead("t1", "lead-1")
+            await _get_media_for_lead("t1", "lead-1")
+
+        assert mock_repo_inst.get_for_lead.await_count == 2
+
 
 # ============================================================================
 # TTL Cleanup
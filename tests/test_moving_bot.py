@@ -24,8 +24,9 @@ from app.core.bots.moving_bot_validators import (
 from app.core.bots.moving_bot_pricing import (
     PricingConfig, HAIFA_METRO_PRICING, ITEM_CATALOG, EXTRAS_ADJUSTMENTS, estimate_price,
     ITEM_ALIAS_LOOKUP, _build_alias_lookup, COMPLEXITY_GUARDS,
-    VOLUME_FROM_ITEMS_CONFIG, ITEM_LABELS,
+    VOLUME_FROM_ITEMS_CONFIG, HEAVY_ITEM_KEYS, ITEM_LABELS, ITEM_MIDPOINTS,
 )
+from app.core.dispatch.crew_view import format_crew_message
 from app.core.handlers.moving_bot_handler import MovingBotHandler
 
 
@@ -306,6 +307,11 @@ class TestMovingBotPricing:
             assert low <= high, f"Item {key}: min ({low}) > max ({high})"
             assert low > 0, f"Item {key}: min price must be positive"
 
+    def test_item_midpoints_match_catalog(self):
+        assert ITEM_MIDPOINTS.keys() == ITEM_CATALOG.keys()
+        for key, (low, high) in ITEM_CATALOG.items():
+            assert ITEM_MIDPOINTS[key] == (low + high) / 2
+
     def test_extras_adjustments_has_entries(self):
         assert len(EXTRAS_ADJUSTMENTS) > 0
         assert "narrow_stairs" in EXTRAS_ADJUSTMENTS
@@ -3192,22 +3198,75 @@ class TestExtractItems:
         assert result[0]["qty"] == 1
 
     def test_russian_multiple_items(self):
-        result = extract_items("холодильник, стол, шкаф")
-        keys = {item["key"] for item in result}
+        keys = extract_items("холодильник, стол, шкаф", as_dict=True).keys()
         assert "fridge_single_door" in keys
         assert "dining_table" in keys
         assert "wardrobe_3_doors" in keys  # generic "шкаф" → wardrobe_large
 
+    def test_uppercase_conjunctions_split(self):
+        keys = extract_items("ХОЛОДИЛЬНИК И СТОЛ AND DESK", as_dict=True).keys()
+        assert keys == {"fridge_single_door", "dining_table", "desk"}
+
+    def test_decomposed_input_matches(self):
+        import unicodedata
+        text = unicodedata.normalize("NFD", "большой холодильник")
+        assert text != "большой холодильник"
+        assert extract_items(text) == extract_items("большой холодильник")
+
+    def test_split_fragments(self):
+        from app.core.bots.moving_bot_validators import _split_fragments
+        fragments = _split_fragments("диван, стол и стул+шкаф\nлампа and desk")
+        assert [f.strip() for f in fragments] == [
+            "диван", "стол", "стул", "шкаф", "лампа", "desk",
+        ]
+        # "и" inside a word is not a separator
+        assert _split_fragments("кресло иголка") == ["кресло иголка"]
+
+    def test_keys_share_catalog_strings(self):
+        """Extracted keys are the interned catalog key objects."""
+        key = extract_items("кресло")[0]["key"]
+        catalog_key = next(k for k in ITEM_CATALOG if k == key)
+        assert key is catalog_key
+
+    def test_catalog_tables_share_key_strings(self):
+        """Heavy, label and midpoint tables reuse the catalog key objects."""
+        catalog_keys = {k: k for k in ITEM_CATALOG}
+        for table in (HEAVY_ITEM_KEYS, ITEM_LABELS, ITEM_MIDPOINTS):
+            for key in table:
+                if key in catalog_keys:
+                    assert key is catalog_keys[key], key
+
+    def test_as_dict_mode(self):
+        """as_dict=True returns the key -> qty mapping directly."""
+        assert extract_items("2 кресла, диван", as_dict=True) == {
+            "armchair": 2, "sofa_large_3_seat": 1,
+        }
+        assert extract_items("", as_dict=True) == {}
+
+    def test_results_memoized_but_fresh(self):
+        """Repeated input hits the cache; each call returns new dicts."""
+        from app.core.bots.moving_bot_validators import _extract_items_cached
+        extract_items.cache_clear()
+        first = extract_items("диван, холодильник")
+        first[0]["qty"] = 99
+        second = extract_items("диван, холодильник")
+        assert second[0]["qty"] == 1
+        assert _extract_items_cached.cache_info().hits == 1
+
+    def test_cache_key_folds_case_and_padding(self):
+        from app.core.bots.moving_bot_validators import _extract_items_cached
+        extract_items.cache_clear()
+        assert extract_items("Диван") == extract_items("  диван\n")
+        assert _extract_items_cached.cache_info().currsize == 1
+
     def test_english_items(self):
-        result = extract_items("sofa, fridge, desk")
-        keys = {item["key"] for item in result}
+        keys = extract_items("sofa, fridge, desk", as_dict=True).keys()
         assert "sofa_large_3_seat" in keys
         assert "fridge_single_door" in keys
         assert "desk" in keys
 
     def test_hebrew_items(self):
-        result = extract_items("מקרר, ספה, כיסא")
-        keys = {item["key"] for item in result}
+        keys = extract_items("מקרר, ספה, כיסא", as_dict=True).keys()
         assert "fridge_single_door" in keys
         assert "sofa_large_3_seat" in keys
         assert "chair" in keys
@@ -3219,15 +3278,13 @@ class TestExtractItems:
         assert result[0]["qty"] == 5
 
     def test_quantity_with_comma_separated(self):
-        result = extract_items("диван, 10 коробок, 2 стула")
-        items = {item["key"]: item["qty"] for item in result}
+        items = extract_items("диван, 10 коробок, 2 стула", as_dict=True)
         assert items["sofa_large_3_seat"] == 1
         assert items["box_standard"] == 10
         assert items["chair"] == 2
 
     def test_english_quantity(self):
-        result = extract_items("3 boxes and 2 chairs")
-        items = {item["key"]: item["qty"] for item in result}
+        items = extract_items("3 boxes and 2 chairs", as_dict=True)
         assert items["box_standard"] == 3
         assert items["chair"] == 2
 
@@ -3237,8 +3294,7 @@ class TestExtractItems:
         assert result[0]["key"] == "washing_machine"
 
     def test_multi_word_english(self):
-        result = extract_items("washing machine and dining table")
-        keys = {item["key"] for item in result}
+        keys = extract_items("washing machine and dining table", as_dict=True).keys()
         assert "washing_machine" in keys
         assert "dining_table" in keys
 
@@ -3260,8 +3316,7 @@ class TestExtractItems:
 
     def test_russian_and_separator(self):
         """Russian 'и' separator works."""
-        result = extract_items("диван и холодильник")
-        keys = {item["key"] for item in result}
+        keys = extract_items("диван и холодильник", as_dict=True).keys()
         assert "sofa_large_3_seat" in keys
         assert "fridge_single_door" in keys
 
@@ -3274,8 +3329,7 @@ class TestExtractItems:
 
     def test_mixed_languages(self):
         """Items from different languages in one input."""
-        result = extract_items("fridge, диван, כיסא")
-        keys = {item["key"] for item in result}
+        keys = extract_items("fridge, диван, כיסא", as_dict=True).keys()
         assert "fridge_single_door" in keys
         assert "sofa_large_3_seat" in keys
         assert "chair" in keys
@@ -3287,6 +3341,78 @@ class TestExtractItems:
         assert len(result) == 1
         assert result[0]["key"] == "fridge_single_door"
 
+    def test_custom_alias_matcher_reused_and_tracks_edits(self):
+        """A custom lookup compiles once; editing it yields a fresh matcher."""
+        from app.core.bots.moving_bot_validators import _get_alias_matcher
+        custom_lookup = {"my_item": "fridge_single_door"}
+        _get_alias_matcher.cache_clear()
+        extract_items("my_item", alias_lookup=custom_lookup)
+        extract_items("my_item x2", alias_lookup=custom_lookup)
+        assert _get_alias_matcher.cache_info().misses == 1
+        custom_lookup["other"] = "chair"
+        assert extract_items("other", alias_lookup=custom_lookup, as_dict=True) == {"chair": 1}
+
+    def test_default_matcher_is_shared(self):
+        """The ITEM_ALIAS_LOOKUP matcher is built once and reused."""
+        from app.core.bots.moving_bot_validators import _get_item_matcher
+        assert _get_item_matcher() is _get_item_matcher()
+
+    def test_matcher_agrees_with_linear_scan(self):
+        """Automaton matcher picks the same alias as a longest-first scan."""
+        from app.core.bots.moving_bot_validators import _get_item_matcher
+        matcher = _get_item_matcher()
+        fragments = ["шкаф для обуви", "большой диван угловой", "2 kids bed", "מיטת ילדים"]
+        fragments += [f"2 {alias} старый" for alias in ITEM_ALIAS_LOOKUP]
+        for fragment in fragments:
+            expected = next(
+                ((a, k) for a, k in ITEM_ALIAS_LOOKUP.items() if a in fragment),
+                None,
+            )
+            assert matcher.match(fragment) == expected
+
+    def test_matcher_respects_custom_lookup_order(self):
+        """Non-length-sorted custom lookups keep their own priority order."""
+        from app.core.bots.moving_bot_validators import _AliasMatcher
+        matcher = _AliasMatcher({"bed": "bed_single", "sofa bed": "sofa_3_seat"})
+        assert matcher.match("sofa bed") == ("bed", "bed_single")
+
+    def test_matcher_exact_fragment_lookup(self):
+        """A fragment that is exactly an alias resolves to that alias."""
+        from app.core.bots.moving_bot_validators import _get_item_matcher
+        alias, key = next(iter(ITEM_ALIAS_LOOKUP.items()))
+        assert _get_item_matcher().match(alias) == (alias, key)
+
+    def test_whole_text_alias_shortcut(self):
+        """Every shipped alias takes the whole-input shortcut, with the
+        same result as the general path; separator-bearing aliases don't."""
+        from app.core.bots.moving_bot_validators import (
+            _AliasMatcher, _extract_item_pairs, _get_item_matcher,
+        )
+        matcher = _get_item_matcher()
+        assert matcher._whole.keys() == ITEM_ALIAS_LOOKUP.keys()
+        general = _AliasMatcher(ITEM_ALIAS_LOOKUP)
+        general._whole = {}
+        for alias in ITEM_ALIAS_LOOKUP:
+            assert _extract_item_pairs(alias, matcher) == _extract_item_pairs(alias, general)
+        custom = _AliasMatcher({"стол и стулья": "dining_set", "стол": "dining_table"})
+        assert "стол и стулья" not in custom._whole
+
+    def test_matcher_memoizes_repeated_fragments(self):
+        """A repeated non-exact fragment walks the automaton only once."""
+        from app.core.bots.moving_bot_validators import _AliasMatcher
+        matcher = _AliasMatcher({"ковер": "carpet", "ковров": "carpet"})
+        assert matcher.match("6 ковров") == matcher.match("6 ковров")
+        info = matcher._walk_cached.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_matcher_shares_identical_rows(self):
+        """Leaf states share one transition row; matching is unaffected."""
+        from app.core.bots.moving_bot_validators import _AliasMatcher
+        matcher = _AliasMatcher({"шкаф-купе": "wardrobe", "шкаф": "wardrobe_small", "стол": "table"})
+        assert len({id(row) for row in matcher._delta}) < len(matcher._delta)
+        assert matcher.match("большой шкаф-купе") == ("шкаф-купе", "wardrobe")
+        assert matcher.match("стол и шкаф") == ("шкаф", "wardrobe_small")
+
 
 class TestUnitWordExtraction:
     """Phase 11: шт/штук/шт. unit word parsing in extract_items()."""
@@ -3321,8 +3447,7 @@ class TestUnitWordExtraction:
 
     def test_sht_mixed_items(self):
         """'10 шт коробок, диван' → box qty=10 + sofa qty=1."""
-        result = extract_items("10 шт коробок, диван")
-        items = {item["key"]: item["qty"] for item in result}
+        items = extract_items("10 шт коробок, диван", as_dict=True)
         assert items["box_standard"] == 10
         assert items["sofa_large_3_seat"] == 1
 
@@ -3745,6 +3870,17 @@ class TestComplexityGuards:
         assert COMPLEXITY_GUARDS["complex_multiplier"] == 1.18
         assert COMPLEXITY_GUARDS["complex_min_floor"] == 7500
 
+    def test_score_tables_match_config(self):
+        """Precomputed score -> multiplier/floor tables mirror the JSON config."""
+        from app.core.bots.moving_bot_pricing import _SCORE_MULT, _SCORE_FLOOR
+        factor = COMPLEXITY_GUARDS["complex_multiplier"] * (
+            1 + COMPLEXITY_GUARDS["risk_buffer_pct"]
+        )
+        assert _SCORE_MULT[:2] == (1.0, 1.0)
+        assert all(m == pytest.approx(factor) for m in _SCORE_MULT[2:])
+        assert _SCORE_FLOOR[:3] == (0, 0, 0)
+        assert all(f == 7500 for f in _SCORE_FLOOR[3:])
+
     # -- Exemptions: small / None / medium never trigger complexity ----------
 
     def test_no_complexity_small_volume(self):
@@ -3874,7 +4010,24 @@ class TestComplexityGuards:
         assert "complex_min_floor" in result["breakdown"]["guards_applied"]
 
     def test_score_5_all_triggers(self):
-        """All 5 triggers → score=5, items push estimate above floor."""
+        """All 5 triggers → score=5 (scorer called directly)."""
+        from app.core.bots.moving_bot_pricing import compute_complexity_score
+        score, triggers = compute_complexity_score(
+            volume_category="xl",
+            extras=["assembly"],
+            route_band="inter_region_long",
+            extra_pickups=1,
+            pickup_floors=[(6, False)],
+            floor_to=2, has_elevator_to=True,
+        )
+        assert score == 5
+        assert set(triggers) == {
+            "volume_xl", "assembly", "multi_pickup",
+            "route_inter_region_long", "high_floor_no_elevator",
+        }
+
+    def test_score_5_integrated_estimate(self):
+        """All 5 triggers + many items → estimate above the complex floor."""
         result = estimate_price(
             volume_category="xl",
             extras=["assembly"],
@@ -3916,8 +4069,8 @@ class TestComplexityGuards:
 
     def test_breakdown_includes_complexity_fields(self):
         """Breakdown always includes complexity fields, even when not applied."""
-        result = estimate_price()
-        bd = result["breakdown"]
+        from app.core.bots.moving_bot_pricing import estimate_breakdown_schema
+        bd = estimate_breakdown_schema()
         assert "complexity_score" in bd
         assert "complexity_triggers" in bd
         assert "complexity_applied" in bd
@@ -3925,6 +4078,12 @@ class TestComplexityGuards:
         assert bd["complexity_triggers"] == []
         assert bd["complexity_applied"] is False
 
+    def test_breakdown_schema_matches_estimate(self):
+        """estimate_breakdown_schema() has exactly the keys estimate_price() fills."""
+        from app.core.bots.moving_bot_pricing import estimate_breakdown_schema
+        bd = estimate_price(volume_category="xl", route_band="inter_region_short")["breakdown"]
+        assert estimate_breakdown_schema().keys() == bd.keys()
+
     # -- Items combine with complexity multiplier ----------------------------
 
     def test_complexity_with_items(self):
@@ -3993,6 +4152,13 @@ class TestDetectVolumeFromItems:
         assert "xl_items_mid" in VOLUME_FROM_ITEMS_CONFIG
         assert "large_heavy_count" in VOLUME_FROM_ITEMS_CONFIG
 
+    def test_heavy_keys_frozen_at_import(self, monkeypatch):
+        """HEAVY_ITEM_KEYS is a snapshot; later config edits don't leak in."""
+        assert HEAVY_ITEM_KEYS == frozenset(VOLUME_FROM_ITEMS_CONFIG["heavy_keys"])
+        monkeypatch.setitem(VOLUME_FROM_ITEMS_CONFIG, "heavy_keys", ["box_standard"])
+        assert "box_standard" not in HEAVY_ITEM_KEYS
+        assert "fridge_single_door" in HEAVY_ITEM_KEYS
+
     def test_xl_by_items_mid(self):
         """items_mid >= 1400 → 'xl'."""
         # 4 sofa_large_3_seat (mid=225 each) + 4 wardrobe_3_doors (mid=325 each)
@@ -4051,6 +4217,15 @@ class TestDetectVolumeFromItems:
         assert detect_volume_from_items([]) is None
         assert detect_volume_from_items(None) is None
 
+    def test_rules_built_once(self):
+        """Heavy-key set and thresholds are derived from config once."""
+        from app.core.bots.moving_bot_validators import _get_volume_from_items_rules
+        rules = _get_volume_from_items_rules()
+        assert rules is _get_volume_from_items_rules()
+        mid_by_key, heavy_keys, _ = rules
+        assert mid_by_key is ITEM_MIDPOINTS
+        assert heavy_keys is HEAVY_ITEM_KEYS
+
     def test_item_labels_loaded(self):
         """item_labels config section is loaded for crew localization."""
         assert "sofa_large_3_seat" in ITEM_LABELS
@@ -4058,6 +4233,21 @@ class TestDetectVolumeFromItems:
         assert ITEM_LABELS["box_standard"]["en"] == "Box"
 
 
+def _fast_forward(handler, state, steps):
+    """Force each ``(step, text)`` pair's step and handle its text.
+
+    Returns ``(state, last_reply, done)``; stops early once the flow
+    reports completion.
+    """
+    reply, done = None, False
+    for step, text in steps:
+        state.step = step
+        state, reply, done = handler.handle_text(state, text)
+        if done:
+            break
+    return state, reply, done
+
+
 class TestCargoItemExtraction:
     """Test that item extraction flows from handler into estimate."""
 
@@ -4078,25 +4268,26 @@ class TestCargoItemExtraction:
     def test_items_flow_into_estimate(self):
         """Extracted items affect the pricing estimate."""
         state = self.handler.new_session("t1", "chat1")
-        state.step = "cargo"
-        # Cargo with recognizable items
-        state, _, _ = self.handler.handle_text(state, "Холодильник и 10 коробок")
+        # Cargo with recognizable items, then fast-forward to estimate
+        state, reply, done = _fast_forward(
+            self.handler, state,
+            [("cargo", "Холодильник и 10 коробок"), ("extras", "4")],
+        )
         assert len(state.data.custom["cargo_items"]) >= 1
-        # Fast-forward to estimate
-        state.step = "extras"
-        state, reply, done = self.handler.handle_text(state, "4")
         assert state.step == "estimate"
+        assert reply
+        assert done is False
         # items_mid should be non-zero
         assert state.data.custom["estimate_breakdown"]["items_mid"] > 0
 
     def test_no_items_estimate_suppressed(self):
         """Cargo with no recognizable items and long text -> estimate suppressed."""
         state = self.handler.new_session("t1", "chat1")
-        state.step = "cargo"
-        state, _, _ = self.handler.handle_text(state, "Разные мелкие вещи для переезда")
+        state, _, _ = _fast_forward(
+            self.handler, state,
+            [("cargo", "Разные мелкие вещи для переезда"), ("extras", "4")],
+        )
         assert state.data.custom["cargo_items"] == []
-        state.step = "extras"
-        state, reply, done = self.handler.handle_text(state, "4")
         assert state.step == "estimate"
         # Long raw, no items, no volume → estimate suppressed
         assert state.data.custom.get("estimate_suppressed") is True
@@ -4132,57 +4323,58 @@ def _op_cfg_with_phone(phone):
     }
 
 
+@pytest.fixture
+def op_cfg():
+    """Patch the handler's operator config; tests set ``return_value``."""
+    with patch(_OP_CFG_PATCH) as mock_op_cfg:
+        yield mock_op_cfg
+
+
 class TestWelcomeOperatorPhone:
     """Phase 12: Operator phone number in welcome message."""
 
     def setup_method(self):
         self.handler = MovingBotHandler()
 
-    @patch(_OP_CFG_PATCH)
-    def test_welcome_includes_phone_when_configured(self, mock_op_cfg):
-        mock_op_cfg.return_value = _op_cfg_with_phone("+972501234567")
+    def test_welcome_includes_phone_when_configured(self, op_cfg):
+        op_cfg.return_value = _op_cfg_with_phone("+972501234567")
         state = self.handler.new_session("t1", "chat1")
         state, reply, done = self.handler.handle_text(state, "привет")
         assert "+972501234567" in reply
         assert "оператором" in reply
 
-    @patch(_OP_CFG_PATCH)
-    def test_welcome_no_phone_when_none(self, mock_op_cfg):
-        mock_op_cfg.return_value = _op_cfg_with_phone(None)
+    def test_welcome_no_phone_when_none(self, op_cfg):
+        op_cfg.return_value = _op_cfg_with_phone(None)
         state = self.handler.new_session("t1", "chat1")
         state, reply, done = self.handler.handle_text(state, "привет")
         assert "оператором" not in reply
         assert "Привет" in reply
         assert "перевезти" in reply
 
-    @patch(_OP_CFG_PATCH)
-    def test_welcome_no_phone_when_empty_string(self, mock_op_cfg):
-        mock_op_cfg.return_value = _op_cfg_with_phone("")
+    def test_welcome_no_phone_when_empty_string(self, op_cfg):
+        op_cfg.return_value = _op_cfg_with_phone("")
         state = self.handler.new_session("t1", "chat1")
         state, reply, done = self.handler.handle_text(state, "привет")
         assert "оператором" not in reply
 
-    @patch(_OP_CFG_PATCH)
-    def test_reset_includes_phone(self, mock_op_cfg):
-        mock_op_cfg.return_value = _op_cfg_with_phone("+972509876543")
+    def test_reset_includes_phone(self, op_cfg):
+        op_cfg.return_value = _op_cfg_with_phone("+972509876543")
         state = self.handler.new_session("t1", "chat1")
         state.step = "addr_from"
         state, reply, done = self.handler.handle_text(state, "заново")
         assert "+972509876543" in reply
         assert state.step == "cargo"
 
-    @patch(_OP_CFG_PATCH)
-    def test_estimate_restart_includes_phone(self, mock_op_cfg):
-        mock_op_cfg.return_value = _op_cfg_with_phone("+972501111111")
+    def test_estimate_restart_includes_phone(self, op_cfg):
+        op_cfg.return_value = _op_cfg_with_phone("+972501111111")
         state = self.handler.new_session("t1", "chat1")
         state.step = "estimate"
         state, reply, done = self.handler.handle_text(state, "2")
         assert "+972501111111" in reply
         assert state.step == "cargo"
 
-    @patch(_OP_CFG_PATCH)
-    def test_welcome_phone_english(self, mock_op_cfg):
-        mock_op_cfg.return_value = _op_cfg_with_phone("+972501234567")
+    def test_welcome_phone_english(self, op_cfg):
+        op_cfg.return_value = _op_cfg_with_phone("+972501234567")
         state = self.handler.new_session("t1", "chat1", language="en")
         state, reply, done = self.handler.handle_text(state, "hi")
         assert "+972501234567" in reply
@@ -4196,61 +4388,33 @@ class TestWelcomeOperatorPhone:
 class TestDetectVolumeFromRooms:
     """Phase 12: Room-based volume auto-detection."""
 
-    # --- Russian ---
-    def test_3_bedrooms_and_salon_ru(self):
-        text = "3 спальные комнаты, салон и 30 коробок с вещами"
-        assert detect_volume_from_rooms(text) == "xl"  # 3+1=4
-
-    def test_2_bedrooms_ru(self):
-        assert detect_volume_from_rooms("2 спальни и кухня") == "medium"
-
-    def test_1_bedroom_ru(self):
-        assert detect_volume_from_rooms("1 спальня") == "small"
-
-    def test_studio_ru(self):
-        assert detect_volume_from_rooms("Студия, мебель и коробки") == "small"
-
-    def test_3_room_apartment_ru(self):
-        assert detect_volume_from_rooms("3-комнатная квартира") == "large"
-
-    def test_4_room_apartment_ru(self):
-        assert detect_volume_from_rooms("4 комнатная квартира") == "xl"
-
-    def test_salon_only_ru(self):
-        assert detect_volume_from_rooms("Салон и кухня") == "small"
-
-    def test_gostinaya_ru(self):
-        assert detect_volume_from_rooms("гостиная и 2 спальни") == "large"  # 1+2=3
-
-    # --- English ---
-    def test_3_bedrooms_en(self):
-        assert detect_volume_from_rooms("3 bedrooms and living room") == "xl"
-
-    def test_2_rooms_en(self):
-        assert detect_volume_from_rooms("2 rooms") == "medium"
-
-    def test_studio_en(self):
-        assert detect_volume_from_rooms("Studio apartment, some boxes") == "small"
-
-    # --- Hebrew ---
-    def test_salon_he(self):
-        assert detect_volume_from_rooms("סלון ומטבח") == "small"
-
-    def test_studio_he(self):
-        assert detect_volume_from_rooms("סטודיו עם ריהוט") == "small"
-
-    # --- Edge cases ---
-    def test_no_rooms_returns_none(self):
-        assert detect_volume_from_rooms("Диван, холодильник, 5 коробок") is None
-
-    def test_empty_string(self):
-        assert detect_volume_from_rooms("") is None
-
-    def test_none_input(self):
-        assert detect_volume_from_rooms(None) is None
-
-    def test_kitchen_only_does_not_count(self):
-        assert detect_volume_from_rooms("Кухня и ванная") is None
+    @pytest.mark.parametrize("text,expected", [
+        # --- Russian ---
+        ("3 спальные комнаты, салон и 30 коробок с вещами", "xl"),  # 3+1=4
+        ("2 спальни и кухня", "medium"),
+        ("1 спальня", "small"),
+        ("Студия, мебель и коробки", "small"),
+        ("3-комнатная квартира", "large"),
+        ("4 комнатная квартира", "xl"),
+        ("Салон и кухня", "small"),
+        ("гостиная и 2 спальни", "large"),  # 1+2=3
+        # --- English ---
+        ("3 bedrooms and living room", "xl"),
+        ("2 rooms", "medium"),
+        ("Studio apartment, some boxes", "small"),
+        # --- Hebrew ---
+        ("סלון ומטבח", "small"),
+        ("סטודיו עם ריהוט", "small"),
+        # --- Edge cases ---
+        ("Диван, холодильник, 5 коробок", None),
+        ("", None),
+        (None, None),
+        ("Кухня и ванная", None),  # kitchen/bathroom do not count
+        ("bedroom and rooms", None),  # counted rooms need a number
+        ("спальня и гостиная", "small"),  # only the living room counts
+    ])
+    def test_detect(self, text, expected):
+        assert detect_volume_from_rooms(text) == expected
 
     # --- User's full example ---
     def test_users_full_example(self):
@@ -4273,9 +4437,8 @@ class TestCargoRoomVolumeDetection:
     def setup_method(self):
         self.handler = MovingBotHandler()
 
-    @patch(_OP_CFG_PATCH)
-    def test_cargo_with_rooms_sets_volume_category(self, mock_op_cfg):
-        mock_op_cfg.return_value = _op_cfg_with_phone(None)
+    def test_cargo_with_rooms_sets_volume_category(self, op_cfg):
+        op_cfg.return_value = _op_cfg_with_phone(None)
         state = self.handler.new_session("t1", "chat1")
         state.step = "cargo"
         state, reply, done = self.handler.handle_text(
@@ -4285,10 +4448,9 @@ class TestCargoRoomVolumeDetection:
         assert state.data.custom["volume_category"] == "xl"
         assert state.data.custom["volume_from_rooms"] is True
 
-    @patch(_OP_CFG_PATCH)
-    def test_cargo_with_items_skips_volume(self, mock_op_cfg):
+    def test_cargo_with_items_skips_volume(self, op_cfg):
         """CARGO with heavy items → PICKUP_COUNT + volume inferred from items."""
-        mock_op_cfg.return_value = _op_cfg_with_phone(None)
+        op_cfg.return_value = _op_cfg_with_phone(None)
         state = self.handler.new_session("t1", "chat1")
         state.step = "cargo"
         state, reply, done = self.handler.handle_text(
@@ -4302,9 +4464,8 @@ class TestCargoRoomVolumeDetection:
         # Items ARE extracted
         assert len(state.data.custom.get("cargo_items", [])) > 0
 
-    @patch(_OP_CFG_PATCH)
-    def test_cargo_items_also_extracted_with_rooms(self, mock_op_cfg):
-        mock_op_cfg.return_value = _op_cfg_with_phone(None)
+    def test_cargo_items_also_extracted_with_rooms(self, op_cfg):
+        op_cfg.return_value = _op_cfg_with_phone(None)
         state = self.handler.new_session("t1", "chat1")
         state.step = "cargo"
         state, _, _ = self.handler.handle_text(
@@ -4315,9 +4476,8 @@ class TestCargoRoomVolumeDetection:
         keys = {i["key"] for i in items}
         assert "box_standard" in keys
 
-    @patch(_OP_CFG_PATCH)
-    def test_room_volume_affects_estimate(self, mock_op_cfg):
-        mock_op_cfg.return_value = _op_cfg_with_phone(None)
+    def test_room_volume_affects_estimate(self, op_cfg):
+        op_cfg.return_value = _op_cfg_with_phone(None)
         state = self.handler.new_session("t1", "chat1")
         state.step = "cargo"
         state, _, _ = self.handler.handle_text(
@@ -4463,6 +4623,25 @@ class TestSanitizeText:
         assert "<b>" not in result
         assert "http" not in result
 
+    def test_url_spliced_script_uri_still_stripped(self):
+        # Removing the URL joins "javascript" and ":" — the scheme pass runs after
+        assert sanitize_text("javascript http://evil.com :alert(1)") == "alert(1)"
+        assert sanitize_text("data https://a.b :text/html,<x>") == "text/html,"
+
+    def test_tag_spliced_url_still_stripped(self):
+        result = sanitize_text("see http<b>://evil.com now")
+        assert "evil" not in result
+
+    def test_results_are_cached(self):
+        from app.core.bots.moving_bot_validators import _sanitize_cached
+        sanitize_text.cache_clear()
+        assert sanitize_text("Хайфа <b>10</b>") == sanitize_text("Хайфа <b>10</b>")
+        assert _sanitize_cached.cache_info().hits == 1
+        # Rejections raise every time (exceptions are not cached)
+        for _ in range(2):
+            with pytest.raises(ValueError, match="rejected"):
+                sanitize_text("http://evil.com")
+
     def test_empty_string(self):
         assert sanitize_text("") == ""
 
@@ -4488,11 +4667,17 @@ _FULL_LANDING_MSG = (
 )
 
 
+@pytest.fixture(scope="module")
+def parsed_full_landing():
+    """Parse _FULL_LANDING_MSG once per module; the parser is pure."""
+    return parse_landing_prefill(_FULL_LANDING_MSG)
+
+
 class TestParseLandingPrefill:
     """Tests for parse_landing_prefill() — landing message detection."""
 
-    def test_full_message_parsed(self):
-        result = parse_landing_prefill(_FULL_LANDING_MSG)
+    def test_full_message_parsed(self, parsed_full_landing):
+        result = parsed_full_landing
         assert result is not None
         assert result.move_type == "Квартира"
         assert result.addr_from == "Хайфа, Нешер"
@@ -4501,6 +4686,9 @@ class TestParseLandingPrefill:
         assert "2 комнаты" in result.details
         assert "холодильник" in result.details
 
+    def test_parse_is_deterministic(self, parsed_full_landing):
+        assert parse_landing_prefill(_FULL_LANDING_MSG) == parsed_full_landing
+
     def test_partial_message_missing_fields(self):
         msg = (
             "Здравствуйте! Хочу узнать стоимость переезда.\n"
@@ -4518,6 +4706,18 @@ class TestParseLandingPrefill:
     def test_non_landing_message_returns_none(self):
         assert parse_landing_prefill("Привет, хочу переехать") is None
 
+    @pytest.mark.parametrize("greeting", [
+        "Здравствуйте! Хочу  узнать стоимость переезда.",
+        " " * 250 + "Здравствуйте! Хочу узнать стоимость переезда.",
+        "Здравствуйте! Хочу\x00 узнать стоимость переезда.",
+        "Здравствуйте! Хочу <b>узнать</b> стоимость переезда.",
+    ])
+    def test_signature_matched_after_sanitising(self, greeting):
+        # The signature is checked on sanitised text: extra spaces, leading
+        # whitespace, control characters and tags inside it still match
+        result = parse_landing_prefill(f"{greeting}\nОткуда: Хайфа")
+        assert result == LandingPrefill(addr_from="Хайфа")
+
     def test_empty_string_returns_none(self):
         assert parse_landing_prefill("") is None
 
@@ -4601,18 +4801,35 @@ class TestParseLandingPrefill:
 # ===================================================================
 
 
+@pytest.fixture(scope="module")
+def handler():
+    """One MovingBotHandler for the module — it holds no per-chat state."""
+    return MovingBotHandler()
+
+
+@pytest.fixture(scope="module")
+def sample_items():
+    """Cargo item lists shared by the estimate tests (read-only)."""
+    return {
+        "sofa+fridge": extract_items("диван, холодильник"),
+        "sofa+fridge+5boxes": extract_items("диван, холодильник, 5 коробок"),
+    }
+
+
+@pytest.fixture
+def _no_operator_config(monkeypatch):
+    """Run the handler with an empty operator config (no phone)."""
+    monkeypatch.setattr(_OP_CFG_PATCH, lambda *args, **kwargs: {})
+
+
+@pytest.mark.usefixtures("_no_operator_config")
 class TestHandlerLandingPrefill:
     """Tests for landing pre-fill integration in MovingBotHandler."""
 
-    def setup_method(self):
-        self.handler = MovingBotHandler()
-
-    @patch("app.core.handlers.moving_bot_handler.get_operator_config",
-           return_value={})
-    def test_landing_with_addresses_goes_to_confirm(self, _mock):
+    def test_landing_with_addresses_goes_to_confirm(self, handler):
         """Landing with both addresses → confirm_addresses step."""
-        state = self.handler.new_session("t1", "chat1")
-        state, reply, done = self.handler.handle_text(state, _FULL_LANDING_MSG)
+        state = handler.new_session("t1", "chat1")
+        state, reply, done = handler.handle_text(state, _FULL_LANDING_MSG)
         assert state.step == "confirm_addresses"
         assert state.data.cargo_description is not None
         assert "2 комнаты" in state.data.cargo_description
@@ -4621,82 +4838,68 @@ class TestHandlerLandingPrefill:
         assert "Тель-Авив" in reply
         assert not done
 
-    @patch("app.core.handlers.moving_bot_handler.get_operator_config",
-           return_value={})
-    def test_landing_stores_addresses_and_date(self, _mock):
-        state = self.handler.new_session("t1", "chat1")
-        state, reply, done = self.handler.handle_text(state, _FULL_LANDING_MSG)
+    def test_landing_stores_addresses_and_date(self, handler):
+        state = handler.new_session("t1", "chat1")
+        state, reply, done = handler.handle_text(state, _FULL_LANDING_MSG)
         assert state.data.addr_from == "Хайфа, Нешер"
         assert state.data.addr_to == "Тель-Авив"
         assert state.data.custom.get("landing_date_hint") == "15 марта"
         assert state.data.custom.get("landing_move_type") == "Квартира"
 
-    @patch("app.core.handlers.moving_bot_handler.get_operator_config",
-           return_value={})
-    def test_landing_without_details_asks_volume(self, _mock):
+    def test_landing_without_details_asks_volume(self, handler):
         """Landing with move_type but no details → cargo from move_type, then volume."""
         msg = (
             "Здравствуйте! Хочу узнать стоимость переезда.\n"
             "Тип: Квартира\n"
             "Откуда: Хайфа"
         )
-        state = self.handler.new_session("t1", "chat1")
-        state, reply, done = self.handler.handle_text(state, msg)
+        state = handler.new_session("t1", "chat1")
+        state, reply, done = handler.handle_text(state, msg)
         # move_type used as cargo fallback → volume enforcement (Phase 15)
         assert state.step == "volume"
         assert state.data.cargo_description == "Квартира"
 
-    @patch("app.core.handlers.moving_bot_handler.get_operator_config",
-           return_value={})
-    def test_landing_signature_only_asks_cargo(self, _mock):
+    def test_landing_signature_only_asks_cargo(self, handler):
         """Signature with no fields and no type → cargo step."""
         msg = "Здравствуйте! Хочу узнать стоимость переезда."
-        state = self.handler.new_session("t1", "chat1")
-        state, reply, done = self.handler.handle_text(state, msg)
+        state = handler.new_session("t1", "chat1")
+        state, reply, done = handler.handle_text(state, msg)
         assert state.step == "cargo"
 
-    @patch("app.core.handlers.moving_bot_handler.get_operator_config",
-           return_value={})
-    def test_normal_message_at_welcome_follows_normal_flow(self, _mock):
-        state = self.handler.new_session("t1", "chat1")
-        state, reply, done = self.handler.handle_text(state, "привет")
+    def test_normal_message_at_welcome_follows_normal_flow(self, handler):
+        state = handler.new_session("t1", "chat1")
+        state, reply, done = handler.handle_text(state, "привет")
         assert state.step == "cargo"
         assert state.data.custom.get("source") != "landing_prefill"
 
-    @patch("app.core.handlers.moving_bot_handler.get_operator_config",
-           return_value={})
-    def test_landing_at_non_welcome_step_ignored(self, _mock):
+    def test_landing_at_non_welcome_step_ignored(self, handler):
         """Landing signature at cargo step is not treated as prefill."""
-        state = self.handler.new_session("t1", "chat1")
+        state = handler.new_session("t1", "chat1")
         state.step = "cargo"
-        state, reply, done = self.handler.handle_text(state, _FULL_LANDING_MSG)
+        state, reply, done = handler.handle_text(state, _FULL_LANDING_MSG)
         # Treated as normal cargo text (long enough to pass)
         assert state.step == "pickup_count"
         assert state.data.custom.get("source") != "landing_prefill"
 
-    @patch("app.core.handlers.moving_bot_handler.get_operator_config",
-           return_value={})
-    def test_landing_with_xss_sanitised(self, _mock):
+    def test_landing_with_xss_sanitised(self, handler):
         msg = (
             "Здравствуйте! Хочу узнать стоимость переезда.\n"
             "Детали: <script>document.cookie</script> диван и стол"
         )
-        state = self.handler.new_session("t1", "chat1")
-        state, reply, done = self.handler.handle_text(state, msg)
+        state = handler.new_session("t1", "chat1")
+        state, reply, done = handler.handle_text(state, msg)
         assert "<script>" not in (state.data.cargo_description or "")
         assert "диван" in (state.data.cargo_description or "")
 
-    @patch("app.core.handlers.moving_bot_handler.get_operator_config",
-           return_value={})
-    def test_landing_ack_message_shown(self, _mock):
-        state = self.handler.new_session("t1", "chat1")
-        state, reply, done = self.handler.handle_text(state, _FULL_LANDING_MSG)
+    def test_landing_ack_message_shown(self, handler):
+        state = handler.new_session("t1", "chat1")
+        state, reply, done = handler.handle_text(state, _FULL_LANDING_MSG)
         assert "заявку с сайта" in reply.lower() or "сайта" in reply.lower()
 
-    def test_pure_url_at_cargo_rejected(self):
-        state = self.handler.new_session("t1", "chat1")
+    def test_pure_url_at_cargo_rejected(self, handler):
+        state = handler.new_session("t1", "chat1")
         state.step = "cargo"
-        state, reply, done = self.handler.handle_text(state, "http://evil.com/malware")
+        state, reply, done = handler.handle_text(state, "http://evil.com/malware")
         assert state.step == "cargo"  # stays on same step
         assert "ссылок" in reply.lower() or "ссылок" in reply
 
@@ -4706,39 +4909,31 @@ class TestHandlerLandingPrefill:
 # ===================================================================
 
 
+@pytest.mark.usefixtures("_no_operator_config")
 class TestLandingPrefillNormalization:
     """Tests for structured date/route parsing in landing prefill."""
 
-    def setup_method(self):
-        self.handler = MovingBotHandler()
-
-    @patch("app.core.handlers.moving_bot_handler.get_operator_config",
-           return_value={})
-    def test_landing_date_parsed_structurally(self, _mock):
+    def test_landing_date_parsed_structurally(self, handler):
         """'15 марта' in landing → parsed as ISO date."""
-        state = self.handler.new_session("t1", "chat1")
-        state, reply, done = self.handler.handle_text(state, _FULL_LANDING_MSG)
+        state = handler.new_session("t1", "chat1")
+        state, reply, done = handler.handle_text(state, _FULL_LANDING_MSG)
         assert state.data.custom.get("landing_date_parsed") is True
         move_date = state.data.custom.get("move_date")
         assert move_date is not None
         # Should be Mar 15 (2026 or 2027 depending on timing)
         assert "-03-15" in move_date
 
-    @patch("app.core.handlers.moving_bot_handler.get_operator_config",
-           return_value={})
-    def test_landing_route_classified(self, _mock):
+    def test_landing_route_classified(self, handler):
         """Хайфа→Тель-Авив in landing → route classification stored."""
-        state = self.handler.new_session("t1", "chat1")
-        state, reply, done = self.handler.handle_text(state, _FULL_LANDING_MSG)
+        state = handler.new_session("t1", "chat1")
+        state, reply, done = handler.handle_text(state, _FULL_LANDING_MSG)
         rc = state.data.custom.get("route_classification")
         assert rc is not None
         assert rc["band"] == "inter_region_short"
         assert rc["from_region"] is not None
         assert rc["to_region"] is not None
 
-    @patch("app.core.handlers.moving_bot_handler.get_operator_config",
-           return_value={})
-    def test_landing_unparseable_date_stored_as_hint(self, _mock):
+    def test_landing_unparseable_date_stored_as_hint(self, handler):
         """Non-parseable date text stored as hint, marked as not parsed."""
         msg = (
             "Здравствуйте! Хочу узнать стоимость переезда.\n"
@@ -4746,15 +4941,13 @@ class TestLandingPrefillNormalization:
             "Дата: как можно скорее\n"
             "Детали: 2 комнаты, диван"
         )
-        state = self.handler.new_session("t1", "chat1")
-        state, reply, done = self.handler.handle_text(state, msg)
+        state = handler.new_session("t1", "chat1")
+        state, reply, done = handler.handle_text(state, msg)
         assert state.data.custom.get("landing_date_hint") == "как можно скорее"
         assert state.data.custom.get("landing_date_parsed") is False
         assert "move_date" not in state.data.custom
 
-    @patch("app.core.handlers.moving_bot_handler.get_operator_config",
-           return_value={})
-    def test_landing_no_addr_to_no_route(self, _mock):
+    def test_landing_no_addr_to_no_route(self, handler):
         """Landing without addr_to → no route classification."""
         msg = (
             "Здравствуйте! Хочу узнать стоимость переезда.\n"
@@ -4762,13 +4955,11 @@ class TestLandingPrefillNormalization:
             "Откуда: Хайфа\n"
             "Детали: 2 комнаты"
         )
-        state = self.handler.new_session("t1", "chat1")
-        state, reply, done = self.handler.handle_text(state, msg)
+        state = handler.new_session("t1", "chat1")
+        state, reply, done = handler.handle_text(state, msg)
         assert "route_classification" not in state.data.custom
 
-    @patch("app.core.handlers.moving_bot_handler.get_operator_config",
-           return_value={})
-    def test_landing_same_city_route(self, _mock):
+    def test_landing_same_city_route(self, handler):
         """Landing with both addresses in same city → same_city band."""
         msg = (
             "Здравствуйте! Хочу узнать стоимость переезда.\n"
@@ -4777,8 +4968,8 @@ class TestLandingPrefillNormalization:
             "Куда: Хайфа, центр\n"
             "Детали: 2 комнаты, стол"
         )
-        state = self.handler.new_session("t1", "chat1")
-        state, reply, done = self.handler.handle_text(state, msg)
+        state = handler.new_session("t1", "chat1")
+        state, reply, done = handler.handle_text(state, msg)
         rc = state.data.custom.get("route_classification")
         assert rc is not None
         assert rc["band"] == "same_city"
@@ -4789,34 +4980,28 @@ class TestLandingPrefillNormalization:
 # ===================================================================
 
 
+@pytest.mark.usefixtures("_no_operator_config")
 class TestLandingConfirmAddresses:
     """Landing with addresses → confirm_addresses step."""
 
-    def setup_method(self):
-        self.handler = MovingBotHandler()
-
-    @patch("app.core.handlers.moving_bot_handler.get_operator_config",
-           return_value={})
-    def test_confirm_yes_goes_to_pickup_count(self, _mock):
+    def test_confirm_yes_goes_to_pickup_count(self, handler):
         """User chooses '1' (yes) → pickup_count → normal address flow."""
-        state = self.handler.new_session("t1", "chat1")
-        state, reply, done = self.handler.handle_text(state, _FULL_LANDING_MSG)
+        state = handler.new_session("t1", "chat1")
+        state, reply, done = handler.handle_text(state, _FULL_LANDING_MSG)
         assert state.step == "confirm_addresses"
 
-        state, reply, done = self.handler.handle_text(state, "1")
+        state, reply, done = handler.handle_text(state, "1")
         assert state.step == "pickup_count"
 
-    @patch("app.core.handlers.moving_bot_handler.get_operator_config",
-           return_value={})
-    def test_confirm_no_skips_to_time_slot(self, _mock):
+    def test_confirm_no_skips_to_time_slot(self, handler):
         """User chooses '2' (no) with parsed date → skip addresses AND date → time_slot."""
-        state = self.handler.new_session("t1", "chat1")
-        state, reply, done = self.handler.handle_text(state, _FULL_LANDING_MSG)
+        state = handler.new_session("t1", "chat1")
+        state, reply, done = handler.handle_text(state, _FULL_LANDING_MSG)
         assert state.step == "confirm_addresses"
         # Date '20 февраля' was parsed successfully
         assert state.data.custom.get("landing_date_parsed") is True
 
-        state, reply, done = self.handler.handle_text(state, "2")
+        state, reply, done = handler.handle_text(state, "2")
         assert state.step == "time_slot"
         # Addresses kept from landing
         assert state.data.addr_from == "Хайфа, Нешер"
@@ -4826,9 +5011,7 @@ class TestLandingConfirmAddresses:
         assert len(state.data.custom["pickups"]) == 1
         assert state.data.custom["pickups"][0]["addr"] == "Хайфа, Нешер"
 
-    @patch("app.core.handlers.moving_bot_handler.get_operator_config",
-           return_value={})
-    def test_confirm_no_unparsed_date_goes_to_date(self, _mock):
+    def test_confirm_no_unparsed_date_goes_to_date(self, handler):
         """User chooses '2' (no) with unparseable date → skip addresses → date step."""
         msg = (
             "Здравствуйте! Хочу узнать стоимость переезда.\n"
@@ -4838,96 +5021,86 @@ class TestLandingConfirmAddresses:
             "Дата: как можно скорее\n"
             "Детали: 2 комнаты, диван"
         )
-        state = self.handler.new_session("t1", "chat1")
-        state, reply, done = self.handler.handle_text(state, msg)
+        state = handler.new_session("t1", "chat1")
+        state, reply, done = handler.handle_text(state, msg)
         assert state.step == "confirm_addresses"
         assert state.data.custom.get("landing_date_parsed") is False
 
-        state, reply, done = self.handler.handle_text(state, "2")
+        state, reply, done = handler.handle_text(state, "2")
         assert state.step == "date"
 
-    @patch("app.core.handlers.moving_bot_handler.get_operator_config",
-           return_value={})
-    def test_confirm_invalid_choice_stays(self, _mock):
+    def test_confirm_invalid_choice_stays(self, handler):
         """Invalid input at confirm_addresses → stays on same step."""
-        state = self.handler.new_session("t1", "chat1")
-        state, reply, done = self.handler.handle_text(state, _FULL_LANDING_MSG)
+        state = handler.new_session("t1", "chat1")
+        state, reply, done = handler.handle_text(state, _FULL_LANDING_MSG)
         assert state.step == "confirm_addresses"
 
-        state, reply, done = self.handler.handle_text(state, "hello")
+        state, reply, done = handler.handle_text(state, "hello")
         assert state.step == "confirm_addresses"
         assert not done
 
-    @patch("app.core.handlers.moving_bot_handler.get_operator_config",
-           return_value={})
-    def test_confirm_yes_full_flow_with_date_skip(self, _mock):
+    def test_confirm_yes_full_flow_with_date_skip(self, handler):
         """User says '1' → goes through addresses → floor_to skips date → time_slot."""
-        state = self.handler.new_session("t1", "chat1")
-        state, reply, done = self.handler.handle_text(state, _FULL_LANDING_MSG)
+        state = handler.new_session("t1", "chat1")
+        state, reply, done = handler.handle_text(state, _FULL_LANDING_MSG)
         assert state.step == "confirm_addresses"
         assert state.data.custom.get("landing_date_parsed") is True
 
         # Confirm yes → pickup_count
-        state, reply, done = self.handler.handle_text(state, "1")
+        state, reply, done = handler.handle_text(state, "1")
         assert state.step == "pickup_count"
 
         # 1 pickup
-        state, reply, done = self.handler.handle_text(state, "1")
+        state, reply, done = handler.handle_text(state, "1")
         assert state.step == "addr_from"
 
         # Full address
-        state, reply, done = self.handler.handle_text(state, "Хайфа, Герцль 10")
+        state, reply, done = handler.handle_text(state, "Хайфа, Герцль 10")
         assert state.step == "floor_from"
 
-        state, reply, done = self.handler.handle_text(state, "3 этаж, без лифта")
+        state, reply, done = handler.handle_text(state, "3 этаж, без лифта")
         assert state.step == "addr_to"
 
-        state, reply, done = self.handler.handle_text(state, "Тель-Авив, Дизенгоф 50")
+        state, reply, done = handler.handle_text(state, "Тель-Авив, Дизенгоф 50")
         assert state.step == "floor_to"
 
         # After floor_to with parsed date → skip date → time_slot
-        state, reply, done = self.handler.handle_text(state, "5 этаж, лифт есть")
+        state, reply, done = handler.handle_text(state, "5 этаж, лифт есть")
         assert state.step == "time_slot"
 
-    @patch("app.core.handlers.moving_bot_handler.get_operator_config",
-           return_value={})
-    def test_confirm_no_then_time_slot_continues(self, _mock):
+    def test_confirm_no_then_time_slot_continues(self, handler):
         """After skipping addresses, time_slot → photo_menu works normally."""
-        state = self.handler.new_session("t1", "chat1")
-        state, reply, done = self.handler.handle_text(state, _FULL_LANDING_MSG)
+        state = handler.new_session("t1", "chat1")
+        state, reply, done = handler.handle_text(state, _FULL_LANDING_MSG)
         assert state.step == "confirm_addresses"
 
-        state, reply, done = self.handler.handle_text(state, "2")
+        state, reply, done = handler.handle_text(state, "2")
         assert state.step == "time_slot"
 
         # Choose morning
-        state, reply, done = self.handler.handle_text(state, "1")
+        state, reply, done = handler.handle_text(state, "1")
         assert state.step == "photo_menu"
 
-    @patch("app.core.handlers.moving_bot_handler.get_operator_config",
-           return_value={})
-    def test_landing_without_addresses_skips_confirm(self, _mock):
+    def test_landing_without_addresses_skips_confirm(self, handler):
         """Landing with details but no addresses → no confirm step, straight to pickup_count."""
         msg = (
             "Здравствуйте! Хочу узнать стоимость переезда.\n"
             "Детали: 2 комнаты, диван и стол"
         )
-        state = self.handler.new_session("t1", "chat1")
-        state, reply, done = self.handler.handle_text(state, msg)
+        state = handler.new_session("t1", "chat1")
+        state, reply, done = handler.handle_text(state, msg)
         # No addresses → no confirm_addresses → pickup_count
         assert state.step == "pickup_count"
 
-    @patch("app.core.handlers.moving_bot_handler.get_operator_config",
-           return_value={})
-    def test_landing_one_address_only_skips_confirm(self, _mock):
+    def test_landing_one_address_only_skips_confirm(self, handler):
         """Landing with only addr_from (no addr_to) → no confirm step."""
         msg = (
             "Здравствуйте! Хочу узнать стоимость переезда.\n"
             "Откуда: Хайфа\n"
             "Детали: 2 комнаты, диван и стол"
         )
-        state = self.handler.new_session("t1", "chat1")
-        state, reply, done = self.handler.handle_text(state, msg)
+        state = handler.new_session("t1", "chat1")
+        state, reply, done = handler.handle_text(state, msg)
         assert state.step == "pickup_count"
 
 
@@ -4936,21 +5109,20 @@ class TestLandingConfirmAddresses:
 # ===================================================================
 
 
+_LOGGER_PATCH = "app.core.handlers.moving_bot_handler.logger"
+
+
 class TestEstimateStructuredLogging:
     """Verify structured logging on estimate computation."""
 
-    def setup_method(self):
-        self.handler = MovingBotHandler()
-
-    def test_estimate_emits_log(self):
+    def test_estimate_emits_log(self, handler):
         """_transition_to_estimate emits a structured log message."""
-        import logging
-        state = self.handler.new_session("t1", "chat1")
+        state = handler.new_session("t1", "chat1")
         state.data.custom["volume_category"] = "small"
         state.step = "extras"
 
-        with patch("app.core.handlers.moving_bot_handler.logger") as mock_logger:
-            state, reply, done = self.handler.handle_text(state, "4")
+        with patch(_LOGGER_PATCH) as mock_logger:
+            state, reply, done = handler.handle_text(state, "4")
             assert state.step == "estimate"
             mock_logger.info.assert_called_once()
             call_args = mock_logger.info.call_args
@@ -4975,54 +5147,28 @@ class TestEstimateStructuredLogging:
 class TestSofaSpaceVariantAliases:
     """Verify '5 местный диван' (space, not hyphen) maps correctly."""
 
-    def test_5_mestny_space(self):
-        """'5 местный диван' → sofa_5seat x1."""
-        items = extract_items("5 местный диван")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("sofa_5seat") == 1
-        assert "sofa_large_3_seat" not in found
-
-    def test_4_mestny_space(self):
-        """'4 местный диван' → sofa_4seat x1."""
-        items = extract_items("4 местный диван")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("sofa_4seat") == 1
-        assert "sofa_large_3_seat" not in found
-
-    def test_3_mestny_space(self):
-        """'3 местный диван' → sofa_3seat x1."""
-        items = extract_items("3 местный диван")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("sofa_large_3_seat") == 1
-
-    def test_2_mestny_space(self):
-        """'2 местный диван' → sofa_2seat x1."""
-        items = extract_items("2 местный диван")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("sofa_small_2_seat") == 1
-        assert "sofa_large_3_seat" not in found
+    @pytest.mark.parametrize("text,key,absent", [
+        ("5 местный диван", "sofa_5seat", "sofa_large_3_seat"),
+        ("4 местный диван", "sofa_4seat", "sofa_large_3_seat"),
+        ("3 местный диван", "sofa_large_3_seat", None),
+        ("2 местный диван", "sofa_small_2_seat", "sofa_large_3_seat"),
+        ("5-seater sofa", "sofa_5seat", None),
+    ])
+    def test_sofa_alias(self, text, key, absent):
+        """Seat-count sofa aliases map to their own key, qty 1."""
+        found = extract_items(text, as_dict=True)
+        assert found.get(key) == 1
+        assert absent not in found
 
     def test_plain_divan_no_regression(self):
         """Plain 'диван' still maps to sofa_3seat x1 (no regression)."""
-        items = extract_items("диван")
-        found = {i["key"]: i["qty"] for i in items}
+        found = extract_items("диван", as_dict=True)
         assert found.get("sofa_large_3_seat") == 1
 
-    def test_attr_suffix_mestny(self):
-        """_ATTR_SUFFIXES matches '5 местный' so bare 5 is not qty."""
-        assert _ATTR_SUFFIXES.search("5 местный")
-        assert _ATTR_SUFFIXES.search("5-местный")
-
-    def test_5_seater_sofa(self):
-        """'5-seater sofa' → sofa_5seat x1."""
-        items = extract_items("5-seater sofa")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("sofa_5seat") == 1
-
-    def test_attr_suffix_seater(self):
-        """_ATTR_SUFFIXES matches '5-seater' so bare 5 is not qty."""
-        assert _ATTR_SUFFIXES.search("5-seater")
-        assert _ATTR_SUFFIXES.search("5 seater")
+    @pytest.mark.parametrize("text", ["5 местный", "5-местный", "5-seater", "5 seater"])
+    def test_attr_suffix(self, text):
+        """_ATTR_SUFFIXES matches seat counts so the bare 5 is not qty."""
+        assert _ATTR_SUFFIXES.search(text)
 
 
 # ===================================================================
@@ -5033,102 +5179,115 @@ class TestSofaSpaceVariantAliases:
 class TestChildrenBedAliases:
     """Verify 'детская кровать' maps to bed_children (separate item)."""
 
-    def test_detskaya_krovat(self):
-        """'детская кровать' → bed_children x1."""
-        items = extract_items("детская кровать")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("bed_children") == 1
-        assert "bed_double" not in found
-
-    def test_detskaya_krovatka(self):
-        """'детская кроватка' → bed_children x1."""
-        items = extract_items("детская кроватка")
-        found = {i["key"]: i["qty"] for i in items}
+    @pytest.mark.parametrize("text", [
+        "детская кровать", "детская кроватка", "kids bed", "מיטת ילדים",
+    ])
+    def test_children_bed_alias(self, text):
+        """Children's bed aliases → bed_children x1, never bed_double."""
+        found = extract_items(text, as_dict=True)
         assert found.get("bed_children") == 1
         assert "bed_double" not in found
 
     def test_detskaya_and_plain_separate(self):
         """'детская кровать и кровать' → bed_children x1 + bed_double x1."""
-        items = extract_items("детская кровать и кровать")
-        found = {i["key"]: i["qty"] for i in items}
+        found = extract_items("детская кровать и кровать", as_dict=True)
         assert found.get("bed_children") == 1
         assert found.get("bed_double") == 1
 
-    def test_kids_bed_english(self):
-        """'kids bed' → bed_children x1."""
-        items = extract_items("kids bed")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("bed_children") == 1
-
-    def test_children_bed_hebrew(self):
-        """'מיטת ילדים' → bed_children x1."""
-        items = extract_items("מיטת ילדים")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("bed_children") == 1
-
 
 # ===================================================================
-# Fix: Mattress item (new in catalog)
+# New catalog items: mattress, vanity_table, shoe_cabinet, armchair,
+# dresser, nightstand, carpet, mirror, oven
 # ===================================================================
 
-
-class TestMattressItem:
-    """Verify mattress is in catalog and recognised."""
-
-    def test_matras(self):
-        """'матрас' → mattress x1."""
-        items = extract_items("матрас")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("mattress") == 1
-
-    def test_matras_double_s(self):
-        """'матрасс' (common misspelling) → mattress x1."""
-        items = extract_items("матрасс")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("mattress") == 1
-
-    def test_matrats(self):
-        """'матрац' (alternative form) → mattress x1."""
-        items = extract_items("матрац")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("mattress") == 1
-
-    def test_2_matrasy(self):
-        """'2 матрасы' → mattress x2."""
-        items = extract_items("2 матрасы")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("mattress") == 2
-
-    def test_mattress_in_catalog(self):
-        """Mattress price range is (60, 120)."""
-        assert "mattress" in ITEM_CATALOG
-        lo, hi = ITEM_CATALOG["mattress"]
-        assert lo == 60
-        assert hi == 120
-
-    def test_mattress_not_heavy(self):
-        """Mattress is NOT a heavy item."""
-        heavy_keys = set(VOLUME_FROM_ITEMS_CONFIG.get("heavy_keys", []))
-        assert "mattress" not in heavy_keys
-
-    def test_mattress_label(self):
-        """Mattress has labels in all 3 languages."""
-        assert "mattress" in ITEM_LABELS
-        assert ITEM_LABELS["mattress"]["ru"] == "Матрас"
-        assert ITEM_LABELS["mattress"]["en"] == "Mattress"
-        assert ITEM_LABELS["mattress"]["he"] == "מזרן"
-
-    def test_mattress_english(self):
-        """'mattress' (English) → mattress x1."""
-        items = extract_items("mattress")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("mattress") == 1
-
-    def test_mattress_hebrew(self):
-        """'מזרן' (Hebrew) → mattress x1."""
-        items = extract_items("מזרן")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("mattress") == 1
+# (text, key, qty) — each text is a single fragment, so extraction must
+# yield exactly this one item (specific phrases beat generic words).
+_NEW_ITEM_ALIAS_CASES = [
+    ("матрас", "mattress", 1),
+    ("матрасс", "mattress", 1),  # common misspelling
+    ("матрац", "mattress", 1),   # alternative form
+    ("2 матрасы", "mattress", 2),
+    ("mattress", "mattress", 1),
+    ("מזרן", "mattress", 1),
+    ("будуар", "vanity_table", 1),
+    ("будуар со стулом", "vanity_table", 1),
+    ("женский стол с зеркалом", "vanity_table", 1),
+    ("туалетный столик", "vanity_table", 1),
+    ("трюмо", "vanity_table", 1),
+    ("vanity table", "vanity_table", 1),
+    ("שולחן איפור", "vanity_table", 1),
+    ("обувница", "shoe_cabinet", 1),
+    ("шкаф для обуви", "shoe_cabinet", 1),   # not wardrobe
+    ("комод для обуви", "shoe_cabinet", 1),  # not dresser
+    ("полка для обуви", "shoe_cabinet", 1),  # not shelving_unit
+    ("тумба для обуви", "shoe_cabinet", 1),  # not nightstand
+    ("shoe cabinet", "shoe_cabinet", 1),
+    ("ארון נעליים", "shoe_cabinet", 1),
+    ("полка", "shelving_unit", 1),
+    ("шкаф", "wardrobe_3_doors", 1),
+    ("кресло", "armchair", 1),
+    ("кресла", "armchair", 1),
+    ("2 кресла", "armchair", 2),
+    ("armchair", "armchair", 1),
+    ("комод", "dresser", 1),  # not shoe_cabinet
+    ("dresser", "dresser", 1),
+    ("тумбочка", "nightstand", 1),
+    ("тумбочки", "nightstand", 1),
+    ("2 тумбочки", "nightstand", 2),
+    ("тумба", "nightstand", 1),
+    ("ковёр", "carpet", 1),
+    ("ковер", "carpet", 1),
+    ("ковры", "carpet", 1),
+    ("6 ковров", "carpet", 6),
+    ("carpet", "carpet", 1),
+    ("зеркало", "mirror", 1),
+    ("зеркала", "mirror", 1),
+    ("mirror", "mirror", 1),
+    ("духовка", "oven", 1),
+    ("духовой шкаф", "oven", 1),  # not wardrobe
+    ("печь", "oven", 1),
+    ("oven", "oven", 1),
+]
+
+# (key, price range, heavy, labels)
+_NEW_ITEM_CATALOG_CASES = [
+    ("mattress", (60, 120), False, {"ru": "Матрас", "en": "Mattress", "he": "מזרן"}),
+    ("vanity_table", (70, 150), False,
+     {"ru": "Будуар", "en": "Vanity table", "he": "שולחן איפור"}),
+    ("shoe_cabinet", (60, 120), False,
+     {"ru": "Обувница", "en": "Shoe cabinet", "he": "ארון נעליים"}),
+    ("armchair", (70, 100), False, {"ru": "Кресло", "en": "Armchair"}),
+    ("dresser", (70, 140), True, {"ru": "Комод"}),
+    ("nightstand", (60, 80), False, {"ru": "Тумбочка"}),
+    ("carpet", (30, 50), False, {"ru": "Ковёр"}),
+    ("mirror", (40, 80), False, {"ru": "Зеркало"}),
+    ("oven", (70, 90), True, {"ru": "Духовка"}),
+]
+
+
+class TestNewCatalogItems:
+    """Verify the newer catalog items are priced, labelled and recognised."""
+
+    @pytest.mark.parametrize("text, key, qty", _NEW_ITEM_ALIAS_CASES)
+    def test_alias_recognised(self, text, key, qty):
+        assert extract_items(text, as_dict=True) == {key: qty}
+
+    @pytest.mark.parametrize(
+        "key, price_range, heavy, labels", _NEW_ITEM_CATALOG_CASES,
+        ids=[case[0] for case in _NEW_ITEM_CATALOG_CASES],
+    )
+    def test_catalog_entry(self, key, price_range, heavy, labels):
+        assert ITEM_CATALOG[key] == price_range
+        assert (key in HEAVY_ITEM_KEYS) is heavy
+        for lang, label in labels.items():
+            assert ITEM_LABELS[key][lang] == label
+
+    def test_edit_distance_neighbours_stay_distinct(self):
+        """Spelling variants are explicit aliases, not fuzzy matches:
+        'стол'/'стул' differ by one letter but are different items."""
+        assert extract_items("стол, стул", as_dict=True) == {
+            "dining_table": 1, "chair": 1,
+        }
 
 
 # ===================================================================
@@ -5142,8 +5301,7 @@ class TestCombinedItemExtractionFixes:
     def test_combined_5_mestny_detskaya_matras(self):
         """'5 местный диван, детская кровать, 2 матрасы, кровать' →
         sofa_5seat x1, bed_children x1, mattress x2, bed_double x1."""
-        items = extract_items("5 местный диван, детская кровать, 2 матрасы, кровать")
-        found = {i["key"]: i["qty"] for i in items}
+        found = extract_items("5 местный диван, детская кровать, 2 матрасы, кровать", as_dict=True)
         assert found.get("sofa_5seat") == 1, f"Expected sofa_5seat=1, got {found}"
         assert found.get("bed_children") == 1, f"Expected bed_children=1, got {found}"
         assert found.get("mattress") == 2, f"Expected mattress=2, got {found}"
@@ -5154,8 +5312,7 @@ class TestCombinedItemExtractionFixes:
     def test_original_bug_report(self):
         """The original report: '5 местный диван, детская кровать, кровать, матрас'.
         Should NOT be sofas x5 + bed x2 + no mattress."""
-        items = extract_items("5 местный диван, детская кровать, кровать, матрас")
-        found = {i["key"]: i["qty"] for i in items}
+        found = extract_items("5 местный диван, детская кровать, кровать, матрас", as_dict=True)
         assert found.get("sofa_5seat") == 1
         assert found.get("bed_children") == 1
         assert found.get("bed_double") == 1
@@ -5170,14 +5327,15 @@ class TestCombinedItemExtractionFixes:
 
 
 class TestEstimateSuppression:
-    """Verify estimate is suppressed when parsing quality is low."""
+    """Verify estimate is suppressed when parsing quality is low.
 
-    def setup_method(self):
-        self.handler = MovingBotHandler()
+    The first test drives the extras → estimate step through handle_text;
+    the rest call _transition_to_estimate directly.
+    """
 
-    def test_estimate_suppressed_when_no_items(self):
+    def test_estimate_suppressed_when_no_items(self, handler):
         """Long cargo_raw with 0 extracted items → estimate suppressed."""
-        state = self.handler.new_session("t1", "chat1")
+        state = handler.new_session("t1", "chat1")
         # Simulate: user wrote lots of unrecognised text
         state.data.custom["cargo_raw"] = "у нас много всякого барахла и разных штук которые нужно перевезти в другой город"
         state.data.custom["cargo_items"] = []
@@ -5185,7 +5343,7 @@ class TestEstimateSuppression:
         state.step = "extras"
 
         # Go through extras → estimate
-        state, reply, done = self.handler.handle_text(state, "4")  # none extras
+        state, reply, done = handler.handle_text(state, "4")  # none extras
         assert state.step == "estimate"
         assert state.data.custom.get("estimate_suppressed") is True
         assert "estimate_min" not in state.data.custom
@@ -5193,43 +5351,40 @@ class TestEstimateSuppression:
         # Reply should be the no-price message
         assert "менеджер" in reply.lower() or "manager" in reply.lower() or "מנהל" in reply
 
-    def test_estimate_shown_when_items_extracted(self):
+    def test_estimate_shown_when_items_extracted(self, handler, sample_items):
         """Cargo with recognised items → normal estimate (not suppressed)."""
-        state = self.handler.new_session("t1", "chat1")
+        state = handler.new_session("t1", "chat1")
         state.data.custom["cargo_raw"] = "диван, холодильник, 5 коробок"
-        state.data.custom["cargo_items"] = extract_items("диван, холодильник, 5 коробок")
+        state.data.custom["cargo_items"] = sample_items["sofa+fridge+5boxes"]
         state.data.custom["volume_category"] = "large"
-        state.step = "extras"
 
-        state, reply, done = self.handler.handle_text(state, "4")  # none extras
+        state, reply, done = handler._transition_to_estimate(state, "ru")
         assert state.step == "estimate"
         assert state.data.custom.get("estimate_suppressed") is not True
         assert "estimate_min" in state.data.custom
         assert "estimate_max" in state.data.custom
 
-    def test_estimate_shown_when_short_raw(self):
+    def test_estimate_shown_when_short_raw(self, handler):
         """Short cargo_raw (≤30 chars) → normal estimate even with 0 items."""
-        state = self.handler.new_session("t1", "chat1")
+        state = handler.new_session("t1", "chat1")
         state.data.custom["cargo_raw"] = "всякое барахло"  # 14 chars
         state.data.custom["cargo_items"] = []
         state.data.custom["volume_category"] = "small"
-        state.step = "extras"
 
-        state, reply, done = self.handler.handle_text(state, "4")
+        state, reply, done = handler._transition_to_estimate(state, "ru")
         assert state.step == "estimate"
         # Not suppressed because cargo_raw ≤ 30 chars (and has volume_category)
         assert state.data.custom.get("estimate_suppressed") is not True
         assert "estimate_min" in state.data.custom
 
-    def test_estimate_shown_when_volume_exists(self):
+    def test_estimate_shown_when_volume_exists(self, handler):
         """Long raw but volume_category set → estimate shown (rooms detection worked)."""
-        state = self.handler.new_session("t1", "chat1")
+        state = handler.new_session("t1", "chat1")
         state.data.custom["cargo_raw"] = "переезд из трёхкомнатной квартиры, много всего разного"
         state.data.custom["cargo_items"] = []
         state.data.custom["volume_category"] = "large"  # inferred from rooms
-        state.step = "extras"
 
-        state, reply, done = self.handler.handle_text(state, "4")
+        state, reply, done = handler._transition_to_estimate(state, "ru")
         assert state.step == "estimate"
         assert state.data.custom.get("estimate_suppressed") is not True
         assert "estimate_min" in state.data.custom
@@ -5244,8 +5399,6 @@ class TestCrewViewEstimateSuppression:
     """Verify crew message omits estimate when suppressed."""
 
     def test_crew_view_no_estimate_when_suppressed(self):
-        from app.core.dispatch.crew_view import format_crew_message
-
         payload = {
             "data": {
                 "floor_from": "3",
@@ -5272,8 +5425,6 @@ class TestCrewViewEstimateSuppression:
         assert "#42" in msg
 
     def test_crew_view_shows_estimate_normally(self):
-        from app.core.dispatch.crew_view import format_crew_message
-
         payload = {
             "data": {
                 "floor_from": "3",
@@ -5298,156 +5449,6 @@ class TestCrewViewEstimateSuppression:
         assert "#43" in msg
 
 
-# ===================================================================
-# New catalog items: vanity_table, shoe_cabinet
-# ===================================================================
-
-
-class TestVanityTableItem:
-    """Verify vanity_table is in catalog and recognised."""
-
-    def test_buduar(self):
-        """'будуар' → vanity_table x1."""
-        items = extract_items("будуар")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("vanity_table") == 1
-
-    def test_buduar_so_stulom(self):
-        """'будуар со стулом' → vanity_table x1."""
-        items = extract_items("будуар со стулом")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("vanity_table") == 1
-
-    def test_zhenskiy_stol(self):
-        """'женский стол с зеркалом' → vanity_table x1."""
-        items = extract_items("женский стол с зеркалом")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("vanity_table") == 1
-
-    def test_tualetny_stolik(self):
-        """'туалетный столик' → vanity_table x1."""
-        items = extract_items("туалетный столик")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("vanity_table") == 1
-
-    def test_tryumo(self):
-        """'трюмо' → vanity_table x1."""
-        items = extract_items("трюмо")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("vanity_table") == 1
-
-    def test_vanity_table_in_catalog(self):
-        """Vanity table price range is (100, 180)."""
-        assert "vanity_table" in ITEM_CATALOG
-        lo, hi = ITEM_CATALOG["vanity_table"]
-        assert lo == 70
-        assert hi == 150
-
-    def test_vanity_table_not_heavy(self):
-        """Vanity table is NOT a heavy item."""
-        heavy_keys = set(VOLUME_FROM_ITEMS_CONFIG.get("heavy_keys", []))
-        assert "vanity_table" not in heavy_keys
-
-    def test_vanity_table_label(self):
-        """Vanity table has labels in all 3 languages."""
-        assert "vanity_table" in ITEM_LABELS
-        assert ITEM_LABELS["vanity_table"]["ru"] == "Будуар"
-        assert ITEM_LABELS["vanity_table"]["en"] == "Vanity table"
-        assert ITEM_LABELS["vanity_table"]["he"] == "שולחן איפור"
-
-    def test_vanity_table_english(self):
-        """'vanity table' → vanity_table x1."""
-        items = extract_items("vanity table")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("vanity_table") == 1
-
-    def test_vanity_table_hebrew(self):
-        """'שולחן איפור' → vanity_table x1."""
-        items = extract_items("שולחן איפור")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("vanity_table") == 1
-
-
-class TestShoeCabinetItem:
-    """Verify shoe_cabinet is in catalog and recognised."""
-
-    def test_obuvnitsa(self):
-        """'обувница' → shoe_cabinet x1."""
-        items = extract_items("обувница")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("shoe_cabinet") == 1
-
-    def test_shkaf_dlya_obuvi(self):
-        """'шкаф для обуви' → shoe_cabinet x1 (not wardrobe)."""
-        items = extract_items("шкаф для обуви")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("shoe_cabinet") == 1
-        assert "wardrobe_2_doors" not in found
-        assert "wardrobe_3_doors" not in found
-
-    def test_komod_dlya_obuvi(self):
-        """'комод для обуви' → shoe_cabinet x1."""
-        items = extract_items("комод для обуви")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("shoe_cabinet") == 1
-
-    def test_polka_dlya_obuvi(self):
-        """'полка для обуви' → shoe_cabinet x1 (not shelving_unit)."""
-        items = extract_items("полка для обуви")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("shoe_cabinet") == 1
-        assert "shelving_unit" not in found
-
-    def test_tumba_dlya_obuvi(self):
-        """'тумба для обуви' → shoe_cabinet x1."""
-        items = extract_items("тумба для обуви")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("shoe_cabinet") == 1
-
-    def test_shoe_cabinet_in_catalog(self):
-        """Shoe cabinet price range is (60, 120)."""
-        assert "shoe_cabinet" in ITEM_CATALOG
-        lo, hi = ITEM_CATALOG["shoe_cabinet"]
-        assert lo == 60
-        assert hi == 120
-
-    def test_shoe_cabinet_not_heavy(self):
-        """Shoe cabinet is NOT a heavy item."""
-        heavy_keys = set(VOLUME_FROM_ITEMS_CONFIG.get("heavy_keys", []))
-        assert "shoe_cabinet" not in heavy_keys
-
-    def test_shoe_cabinet_label(self):
-        """Shoe cabinet has labels in all 3 languages."""
-        assert "shoe_cabinet" in ITEM_LABELS
-        assert ITEM_LABELS["shoe_cabinet"]["ru"] == "Обувница"
-        assert ITEM_LABELS["shoe_cabinet"]["en"] == "Shoe cabinet"
-        assert ITEM_LABELS["shoe_cabinet"]["he"] == "ארון נעליים"
-
-    def test_shoe_cabinet_english(self):
-        """'shoe cabinet' → shoe_cabinet x1."""
-        items = extract_items("shoe cabinet")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("shoe_cabinet") == 1
-
-    def test_shoe_cabinet_hebrew(self):
-        """'ארון נעליים' → shoe_cabinet x1."""
-        items = extract_items("ארון נעליים")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("shoe_cabinet") == 1
-
-    def test_plain_polka_still_shelving(self):
-        """'полка' alone still matches shelving_unit (no regression)."""
-        items = extract_items("полка")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("shelving_unit") == 1
-
-    def test_plain_shkaf_still_wardrobe(self):
-        """'шкаф' alone still matches wardrobe_3_doors (default)."""
-        items = extract_items("шкаф")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("wardrobe_3_doors") == 1
-
-
 # ===================================================================
 # Estimate display toggle (ESTIMATE_DISPLAY_ENABLED setting)
 # ===================================================================
@@ -5457,20 +5458,16 @@ class TestEstimateDisplayToggle:
     """Verify estimate_display_enabled=False hides price from user/crew
     but operator data (estimate_min/max) is still stored."""
 
-    def setup_method(self):
-        self.handler = MovingBotHandler()
-
-    def test_user_sees_no_price_when_disabled(self):
+    def test_user_sees_no_price_when_disabled(self, handler, sample_items, monkeypatch):
         """When estimate_display_enabled=False, user gets estimate_no_price text."""
-        state = self.handler.new_session("t1", "chat1")
+        state = handler.new_session("t1", "chat1")
         state.data.custom["cargo_raw"] = "диван, холодильник"
-        state.data.custom["cargo_items"] = extract_items("диван, холодильник")
+        state.data.custom["cargo_items"] = sample_items["sofa+fridge"]
         state.data.custom["volume_category"] = "large"
         state.step = "extras"
 
-        with patch("app.core.handlers.moving_bot_handler._app_settings") as mock_s:
-            mock_s.estimate_display_enabled = False
-            state, reply, done = self.handler.handle_text(state, "4")
+        monkeypatch.setattr("app.config.settings.estimate_display_enabled", False)
+        state, reply, done = handler.handle_text(state, "4")
 
         assert state.step == "estimate"
         # Estimate data IS stored (for operator)
@@ -5480,17 +5477,15 @@ class TestEstimateDisplayToggle:
         # But user sees no-price message
         assert "₪" not in reply
 
-    def test_user_sees_price_when_enabled(self):
+    def test_user_sees_price_when_enabled(self, handler, sample_items, monkeypatch):
         """When estimate_display_enabled=True (default), user sees price."""
-        state = self.handler.new_session("t1", "chat1")
+        state = handler.new_session("t1", "chat1")
         state.data.custom["cargo_raw"] = "диван, холодильник"
-        state.data.custom["cargo_items"] = extract_items("диван, холодильник")
+        state.data.custom["cargo_items"] = sample_items["sofa+fridge"]
         state.data.custom["volume_category"] = "large"
-        state.step = "extras"
 
-        with patch("app.core.handlers.moving_bot_handler._app_settings") as mock_s:
-            mock_s.estimate_display_enabled = True
-            state, reply, done = self.handler.handle_text(state, "4")
+        monkeypatch.setattr("app.config.settings.estimate_display_enabled", True)
+        state, reply, done = handler._transition_to_estimate(state, "ru")
 
         assert state.step == "estimate"
         assert "estimate_min" in state.data.custom
@@ -5499,8 +5494,6 @@ class TestEstimateDisplayToggle:
 
     def test_crew_no_estimate_when_display_disabled(self):
         """Crew message omits estimate when estimate_display_disabled flag is set."""
-        from app.core.dispatch.crew_view import format_crew_message
-
         payload = {
             "data": {
                 "floor_from": "3",
@@ -5528,8 +5521,6 @@ class TestEstimateDisplayToggle:
 
     def test_crew_shows_estimate_normally(self):
         """Default: crew sees estimate when display is not disabled."""
-        from app.core.dispatch.crew_view import format_crew_message
-
         payload = {
             "data": {
                 "floor_from": "3",
@@ -5554,209 +5545,6 @@ class TestEstimateDisplayToggle:
         assert "#51" in msg
 
 
-# ===================================================================
-# New catalog items: armchair, dresser, nightstand, carpet, mirror, oven
-# ===================================================================
-
-
-class TestArmchairItem:
-    """Verify armchair is in catalog and recognised."""
-
-    def test_kreslo(self):
-        items = extract_items("кресло")
-        assert {i["key"]: i["qty"] for i in items}.get("armchair") == 1
-
-    def test_kresla(self):
-        items = extract_items("кресла")
-        assert {i["key"]: i["qty"] for i in items}.get("armchair") == 1
-
-    def test_2_kresla(self):
-        items = extract_items("2 кресла")
-        assert {i["key"]: i["qty"] for i in items}.get("armchair") == 2
-
-    def test_armchair_catalog(self):
-        assert "armchair" in ITEM_CATALOG
-        assert ITEM_CATALOG["armchair"] == (70, 100)
-
-    def test_armchair_not_heavy(self):
-        heavy = set(VOLUME_FROM_ITEMS_CONFIG.get("heavy_keys", []))
-        assert "armchair" not in heavy
-
-    def test_armchair_label(self):
-        assert ITEM_LABELS["armchair"]["ru"] == "Кресло"
-        assert ITEM_LABELS["armchair"]["en"] == "Armchair"
-
-    def test_armchair_english(self):
-        items = extract_items("armchair")
-        assert {i["key"]: i["qty"] for i in items}.get("armchair") == 1
-
-
-class TestDresserItem:
-    """Verify dresser (комод) is in catalog and recognised."""
-
-    def test_komod(self):
-        items = extract_items("комод")
-        assert {i["key"]: i["qty"] for i in items}.get("dresser") == 1
-
-    def test_komod_not_shoe_cabinet(self):
-        """Plain 'комод' → dresser, NOT shoe_cabinet."""
-        items = extract_items("комод")
-        found = {i["key"]: i["qty"] for i in items}
-        assert "shoe_cabinet" not in found
-
-    def test_komod_dlya_obuvi_still_shoe(self):
-        """'комод для обуви' → shoe_cabinet (no regression)."""
-        items = extract_items("комод для обуви")
-        assert {i["key"]: i["qty"] for i in items}.get("shoe_cabinet") == 1
-
-    def test_dresser_catalog(self):
-        assert "dresser" in ITEM_CATALOG
-        assert ITEM_CATALOG["dresser"] == (70, 140)
-
-    def test_dresser_is_heavy(self):
-        heavy = set(VOLUME_FROM_ITEMS_CONFIG.get("heavy_keys", []))
-        assert "dresser" in heavy
-
-    def test_dresser_label(self):
-        assert ITEM_LABELS["dresser"]["ru"] == "Комод"
-
-    def test_dresser_english(self):
-        items = extract_items("dresser")
-        assert {i["key"]: i["qty"] for i in items}.get("dresser") == 1
-
-
-class TestNightstandItem:
-    """Verify nightstand (тумбочка) is in catalog and recognised."""
-
-    def test_tumbochka(self):
-        items = extract_items("тумбочка")
-        assert {i["key"]: i["qty"] for i in items}.get("nightstand") == 1
-
-    def test_tumbochki(self):
-        items = extract_items("тумбочки")
-        assert {i["key"]: i["qty"] for i in items}.get("nightstand") == 1
-
-    def test_2_tumbochki(self):
-        items = extract_items("2 тумбочки")
-        assert {i["key"]: i["qty"] for i in items}.get("nightstand") == 2
-
-    def test_tumba(self):
-        items = extract_items("тумба")
-        assert {i["key"]: i["qty"] for i in items}.get("nightstand") == 1
-
-    def test_tumba_dlya_obuvi_still_shoe(self):
-        """'тумба для обуви' → shoe_cabinet (no regression)."""
-        items = extract_items("тумба для обуви")
-        assert {i["key"]: i["qty"] for i in items}.get("shoe_cabinet") == 1
-
-    def test_nightstand_catalog(self):
-        assert "nightstand" in ITEM_CATALOG
-        assert ITEM_CATALOG["nightstand"] == (60, 80)
-
-    def test_nightstand_not_heavy(self):
-        heavy = set(VOLUME_FROM_ITEMS_CONFIG.get("heavy_keys", []))
-        assert "nightstand" not in heavy
-
-    def test_nightstand_label(self):
-        assert ITEM_LABELS["nightstand"]["ru"] == "Тумбочка"
-
-
-class TestCarpetItem:
-    """Verify carpet (ковёр) is in catalog and recognised."""
-
-    def test_kover_yo(self):
-        items = extract_items("ковёр")
-        assert {i["key"]: i["qty"] for i in items}.get("carpet") == 1
-
-    def test_kover_e(self):
-        items = extract_items("ковер")
-        assert {i["key"]: i["qty"] for i in items}.get("carpet") == 1
-
-    def test_kovry(self):
-        items = extract_items("ковры")
-        assert {i["key"]: i["qty"] for i in items}.get("carpet") == 1
-
-    def test_6_kovrov(self):
-        items = extract_items("6 ковров")
-        assert {i["key"]: i["qty"] for i in items}.get("carpet") == 6
-
-    def test_carpet_catalog(self):
-        assert "carpet" in ITEM_CATALOG
-        assert ITEM_CATALOG["carpet"] == (30, 50)
-
-    def test_carpet_not_heavy(self):
-        heavy = set(VOLUME_FROM_ITEMS_CONFIG.get("heavy_keys", []))
-        assert "carpet" not in heavy
-
-    def test_carpet_label(self):
-        assert ITEM_LABELS["carpet"]["ru"] == "Ковёр"
-
-    def test_carpet_english(self):
-        items = extract_items("carpet")
-        assert {i["key"]: i["qty"] for i in items}.get("carpet") == 1
-
-
-class TestMirrorItem:
-    """Verify mirror (зеркало) is in catalog and recognised."""
-
-    def test_zerkalo(self):
-        items = extract_items("зеркало")
-        assert {i["key"]: i["qty"] for i in items}.get("mirror") == 1
-
-    def test_zerkala(self):
-        items = extract_items("зеркала")
-        assert {i["key"]: i["qty"] for i in items}.get("mirror") == 1
-
-    def test_mirror_catalog(self):
-        assert "mirror" in ITEM_CATALOG
-        assert ITEM_CATALOG["mirror"] == (40, 80)
-
-    def test_mirror_not_heavy(self):
-        heavy = set(VOLUME_FROM_ITEMS_CONFIG.get("heavy_keys", []))
-        assert "mirror" not in heavy
-
-    def test_mirror_label(self):
-        assert ITEM_LABELS["mirror"]["ru"] == "Зеркало"
-
-    def test_mirror_english(self):
-        items = extract_items("mirror")
-        assert {i["key"]: i["qty"] for i in items}.get("mirror") == 1
-
-
-class TestOvenItem:
-    """Verify oven (духовка) is in catalog and recognised."""
-
-    def test_duhovka(self):
-        items = extract_items("духовка")
-        assert {i["key"]: i["qty"] for i in items}.get("oven") == 1
-
-    def test_duhovoy_shkaf(self):
-        items = extract_items("духовой шкаф")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("oven") == 1
-        assert "wardrobe_2_doors" not in found
-        assert "wardrobe_3_doors" not in found
-
-    def test_pech(self):
-        items = extract_items("печь")
-        assert {i["key"]: i["qty"] for i in items}.get("oven") == 1
-
-    def test_oven_catalog(self):
-        assert "oven" in ITEM_CATALOG
-        assert ITEM_CATALOG["oven"] == (70, 90)
-
-    def test_oven_is_heavy(self):
-        heavy = set(VOLUME_FROM_ITEMS_CONFIG.get("heavy_keys", []))
-        assert "oven" in heavy
-
-    def test_oven_label(self):
-        assert ITEM_LABELS["oven"]["ru"] == "Духовка"
-
-    def test_oven_english(self):
-        items = extract_items("oven")
-        assert {i["key"]: i["qty"] for i in items}.get("oven") == 1
-
-
 # ===================================================================
 # Fix: bed_double plural alias ("кровати" → bed_double)
 # ===================================================================
@@ -5766,26 +5554,21 @@ class TestBedPluralFix:
     """Verify 'кровати' and 'кроватей' map to bed_double."""
 
     def test_krovati(self):
-        items = extract_items("кровати")
-        assert {i["key"]: i["qty"] for i in items}.get("bed_double") == 1
+        assert extract_items("кровати", as_dict=True).get("bed_double") == 1
 
     def test_2_krovati(self):
-        items = extract_items("2 кровати")
-        assert {i["key"]: i["qty"] for i in items}.get("bed_double") == 2
+        assert extract_items("2 кровати", as_dict=True).get("bed_double") == 2
 
     def test_krovatey(self):
-        items = extract_items("кроватей")
-        assert {i["key"]: i["qty"] for i in items}.get("bed_double") == 1
+        assert extract_items("кроватей", as_dict=True).get("bed_double") == 1
 
     def test_detskie_krovatki(self):
         """'детские кроватки' → bed_children."""
-        items = extract_items("детские кроватки")
-        assert {i["key"]: i["qty"] for i in items}.get("bed_children") == 1
+        assert extract_items("детские кроватки", as_dict=True).get("bed_children") == 1
 
     def test_krovat_singular_no_regression(self):
         """'кровать' still → bed_double (no regression)."""
-        items = extract_items("кровать")
-        assert {i["key"]: i["qty"] for i in items}.get("bed_double") == 1
+        assert extract_items("кровать", as_dict=True).get("bed_double") == 1
 
 
 # ===================================================================
@@ -5802,8 +5585,7 @@ class TestFullCargoScenario:
                 "газовая плита, шкаф, комод, зеркало, 2 тумбочки, "
                 "диван, большой шкаф, 2 тумбочки, диван, 6 ковров, "
                 "2 кровати, 2 матраса")
-        items = extract_items(text)
-        found = {i["key"]: i["qty"] for i in items}
+        found = extract_items(text, as_dict=True)
         assert len(found) == 17
         assert found["armchair"] == 2
         assert found["dining_table"] == 1
@@ -5825,424 +5607,103 @@ class TestFullCargoScenario:
 
 
 # ===================================================================
-# Catalog Restructuring v3.0: Fridge split
-# ===================================================================
-
-
-class TestFridgeSplit:
-    """Verify fridge_single_door, fridge_double_door, fridge_side_by_side."""
-
-    def test_plain_holodilnik(self):
-        """'холодильник' → fridge_single_door (default)."""
-        items = extract_items("холодильник")
-        assert {i["key"]: i["qty"] for i in items}.get("fridge_single_door") == 1
-
-    def test_bolshoy_holodilnik(self):
-        """'большой холодильник' → fridge_double_door."""
-        items = extract_items("большой холодильник")
-        assert {i["key"]: i["qty"] for i in items}.get("fridge_double_door") == 1
-
-    def test_dvuhdverny(self):
-        """'двухдверный холодильник' → fridge_double_door."""
-        items = extract_items("двухдверный холодильник")
-        assert {i["key"]: i["qty"] for i in items}.get("fridge_double_door") == 1
-
-    def test_side_by_side(self):
-        """'side by side' → fridge_side_by_side."""
-        items = extract_items("side by side")
-        assert {i["key"]: i["qty"] for i in items}.get("fridge_side_by_side") == 1
-
-    def test_said_bay_said(self):
-        """'сайд бай сайд' → fridge_side_by_side."""
-        items = extract_items("сайд бай сайд")
-        assert {i["key"]: i["qty"] for i in items}.get("fridge_side_by_side") == 1
-
-    def test_fridge_single_door_price(self):
-        assert ITEM_CATALOG["fridge_single_door"] == (120, 170)
-
-    def test_fridge_double_door_price(self):
-        assert ITEM_CATALOG["fridge_double_door"] == (180, 250)
-
-    def test_fridge_side_by_side_price(self):
-        assert ITEM_CATALOG["fridge_side_by_side"] == (220, 340)
-
-    def test_all_fridges_heavy(self):
-        heavy = set(VOLUME_FROM_ITEMS_CONFIG.get("heavy_keys", []))
-        assert "fridge_single_door" in heavy
-        assert "fridge_double_door" in heavy
-        assert "fridge_side_by_side" in heavy
-
-    def test_fridge_labels(self):
-        assert ITEM_LABELS["fridge_single_door"]["ru"] == "Холодильник"
-        assert ITEM_LABELS["fridge_double_door"]["en"] == "Double-door fridge"
-        assert ITEM_LABELS["fridge_side_by_side"]["en"] == "Side-by-side fridge"
-
-
-# ===================================================================
-# Catalog Restructuring v3.0: Sofa corner
+# Catalog Restructuring v3.0: split and added items
 # ===================================================================
 
-
-class TestSofaCorner:
-    """Verify sofa_corner extraction."""
-
-    def test_uglovoy_divan(self):
-        """'угловой диван' → sofa_corner."""
-        items = extract_items("угловой диван")
-        assert {i["key"]: i["qty"] for i in items}.get("sofa_corner") == 1
-
-    def test_g_obrazny(self):
-        """'г-образный диван' → sofa_corner."""
-        items = extract_items("г-образный диван")
-        assert {i["key"]: i["qty"] for i in items}.get("sofa_corner") == 1
-
-    def test_corner_sofa_en(self):
-        """'corner sofa' → sofa_corner."""
-        items = extract_items("corner sofa")
-        assert {i["key"]: i["qty"] for i in items}.get("sofa_corner") == 1
-
-    def test_sofa_corner_price(self):
-        assert ITEM_CATALOG["sofa_corner"] == (180, 270)
-
-    def test_sofa_corner_is_heavy(self):
-        heavy = set(VOLUME_FROM_ITEMS_CONFIG.get("heavy_keys", []))
-        assert "sofa_corner" in heavy
-
-    def test_sofa_corner_label(self):
-        assert ITEM_LABELS["sofa_corner"]["ru"] == "Угловой диван"
-        assert ITEM_LABELS["sofa_corner"]["he"] == "ספה פינתית"
-
-
-# ===================================================================
-# Catalog Restructuring v3.0: Wardrobe 4-doors
-# ===================================================================
-
-
-class TestWardrobe4Doors:
-    """Verify wardrobe_4_doors extraction."""
-
-    def test_bolshoy_shkaf(self):
-        """'большой шкаф' → wardrobe_4_doors."""
-        items = extract_items("большой шкаф")
-        assert {i["key"]: i["qty"] for i in items}.get("wardrobe_4_doors") == 1
-
-    def test_shkaf_kupe(self):
-        """'шкаф-купе' → wardrobe_4_doors."""
-        items = extract_items("шкаф-купе")
-        assert {i["key"]: i["qty"] for i in items}.get("wardrobe_4_doors") == 1
-
-    def test_shkaf_4_dveri(self):
-        """'шкаф 4 двери' → wardrobe_4_doors, qty=1."""
-        items = extract_items("шкаф 4 двери")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("wardrobe_4_doors") == 1
-
-    def test_large_wardrobe_en(self):
-        """'large wardrobe' → wardrobe_4_doors."""
-        items = extract_items("large wardrobe")
-        assert {i["key"]: i["qty"] for i in items}.get("wardrobe_4_doors") == 1
-
-    def test_wardrobe_4_doors_price(self):
-        assert ITEM_CATALOG["wardrobe_4_doors"] == (220, 340)
-
-    def test_wardrobe_4_doors_is_heavy(self):
-        heavy = set(VOLUME_FROM_ITEMS_CONFIG.get("heavy_keys", []))
-        assert "wardrobe_4_doors" in heavy
-
-    def test_wardrobe_4_doors_label(self):
-        assert ITEM_LABELS["wardrobe_4_doors"]["ru"] == "Шкаф (4-двер.)"
-
-
-# ===================================================================
-# Catalog Restructuring v3.0: Bed with storage
-# ===================================================================
-
-
-class TestBedWithStorage:
-    """Verify bed_with_storage extraction."""
-
-    def test_krovat_s_yaschkami(self):
-        """'кровать с ящиками' → bed_with_storage."""
-        items = extract_items("кровать с ящиками")
-        assert {i["key"]: i["qty"] for i in items}.get("bed_with_storage") == 1
-
-    def test_krovat_s_podyomnym(self):
-        """'кровать с подъёмным механизмом' → bed_with_storage."""
-        items = extract_items("кровать с подъёмным механизмом")
-        assert {i["key"]: i["qty"] for i in items}.get("bed_with_storage") == 1
-
-    def test_storage_bed_en(self):
-        """'storage bed' → bed_with_storage."""
-        items = extract_items("storage bed")
-        assert {i["key"]: i["qty"] for i in items}.get("bed_with_storage") == 1
-
-    def test_bed_with_storage_price(self):
-        assert ITEM_CATALOG["bed_with_storage"] == (150, 220)
-
-    def test_bed_with_storage_is_heavy(self):
-        heavy = set(VOLUME_FROM_ITEMS_CONFIG.get("heavy_keys", []))
-        assert "bed_with_storage" in heavy
-
-    def test_bed_with_storage_label(self):
-        assert ITEM_LABELS["bed_with_storage"]["ru"] == "Кровать с ящиками"
-
-
-# ===================================================================
-# Catalog Restructuring v3.0: Exercise split (treadmill + home_gym)
-# ===================================================================
-
-
-class TestExerciseSplit:
-    """Verify treadmill and home_gym extraction."""
-
-    def test_begovaya_dorozhka(self):
-        """'беговая дорожка' → treadmill."""
-        items = extract_items("беговая дорожка")
-        assert {i["key"]: i["qty"] for i in items}.get("treadmill") == 1
-
-    def test_treadmill_en(self):
-        """'treadmill' → treadmill."""
-        items = extract_items("treadmill")
-        assert {i["key"]: i["qty"] for i in items}.get("treadmill") == 1
-
-    def test_trenazher(self):
-        """'тренажер' → home_gym."""
-        items = extract_items("тренажер")
-        assert {i["key"]: i["qty"] for i in items}.get("home_gym") == 1
-
-    def test_home_gym_en(self):
-        """'home gym' → home_gym."""
-        items = extract_items("home gym")
-        assert {i["key"]: i["qty"] for i in items}.get("home_gym") == 1
-
-    def test_treadmill_price(self):
-        assert ITEM_CATALOG["treadmill"] == (70, 140)
-
-    def test_home_gym_price(self):
-        assert ITEM_CATALOG["home_gym"] == (120, 240)
-
-    def test_both_are_heavy(self):
-        heavy = set(VOLUME_FROM_ITEMS_CONFIG.get("heavy_keys", []))
-        assert "treadmill" in heavy
-        assert "home_gym" in heavy
-
-
-# ===================================================================
-# Catalog Restructuring v3.0: New heavy items
-# ===================================================================
-
-
-class TestNewHeavyItems:
-    """Verify piano_upright, safe_small, safe_large, marble_table."""
-
-    def test_pianino(self):
-        items = extract_items("пианино")
-        assert {i["key"]: i["qty"] for i in items}.get("piano_upright") == 1
-
-    def test_royal(self):
-        items = extract_items("рояль")
-        assert {i["key"]: i["qty"] for i in items}.get("piano_upright") == 1
-
-    def test_piano_price(self):
-        assert ITEM_CATALOG["piano_upright"] == (370, 640)
-
-    def test_seyf(self):
-        items = extract_items("сейф")
-        assert {i["key"]: i["qty"] for i in items}.get("safe_small") == 1
-
-    def test_bolshoy_seyf(self):
-        items = extract_items("большой сейф")
-        assert {i["key"]: i["qty"] for i in items}.get("safe_large") == 1
-
-    def test_safe_small_price(self):
-        assert ITEM_CATALOG["safe_small"] == (120, 240)
-
-    def test_safe_large_price(self):
-        assert ITEM_CATALOG["safe_large"] == (220, 440)
-
-    def test_mramorny_stol(self):
-        items = extract_items("мраморный стол")
-        assert {i["key"]: i["qty"] for i in items}.get("marble_table") == 1
-
-    def test_marble_table_price(self):
-        assert ITEM_CATALOG["marble_table"] == (150, 270)
-
-    def test_all_are_heavy(self):
-        heavy = set(VOLUME_FROM_ITEMS_CONFIG.get("heavy_keys", []))
-        assert "piano_upright" in heavy
-        assert "safe_small" in heavy
-        assert "safe_large" in heavy
-        assert "marble_table" in heavy
-
-    def test_heavy_labels(self):
-        assert ITEM_LABELS["piano_upright"]["ru"] == "Пианино"
-        assert ITEM_LABELS["safe_small"]["ru"] == "Сейф"
-        assert ITEM_LABELS["safe_large"]["ru"] == "Сейф большой"
-        assert ITEM_LABELS["marble_table"]["ru"] == "Мраморный стол"
-
-
-# ===================================================================
-# Catalog Restructuring v3.0: Aquarium
-# ===================================================================
-
-
-class TestAquariumItem:
-    """Verify aquarium_large extraction."""
-
-    def test_akvarium(self):
-        items = extract_items("аквариум")
-        assert {i["key"]: i["qty"] for i in items}.get("aquarium_large") == 1
-
-    def test_aquarium_en(self):
-        items = extract_items("aquarium")
-        assert {i["key"]: i["qty"] for i in items}.get("aquarium_large") == 1
-
-    def test_aquarium_price(self):
-        assert ITEM_CATALOG["aquarium_large"] == (120, 240)
-
-    def test_aquarium_is_heavy(self):
-        heavy = set(VOLUME_FROM_ITEMS_CONFIG.get("heavy_keys", []))
-        assert "aquarium_large" in heavy
-
-    def test_aquarium_label(self):
-        assert ITEM_LABELS["aquarium_large"]["ru"] == "Аквариум"
-
-
-# ===================================================================
-# Catalog Restructuring v3.0: Kitchen items
-# ===================================================================
-
-
-class TestKitchenItems:
-    """Verify dishwasher, microwave, coffee_machine, kettle, mixer, juicer, kitchenware."""
-
-    def test_posudomoyka(self):
-        items = extract_items("посудомойка")
-        assert {i["key"]: i["qty"] for i in items}.get("dishwasher") == 1
-
-    def test_posudomoechnaya_mashina(self):
-        items = extract_items("посудомоечная машина")
-        assert {i["key"]: i["qty"] for i in items}.get("dishwasher") == 1
-
-    def test_dishwasher_price(self):
-        assert ITEM_CATALOG["dishwasher"] == (100, 140)
-
-    def test_dishwasher_is_heavy(self):
-        heavy = set(VOLUME_FROM_ITEMS_CONFIG.get("heavy_keys", []))
-        assert "dishwasher" in heavy
-
-    def test_mikrovolnovka(self):
-        items = extract_items("микроволновка")
-        assert {i["key"]: i["qty"] for i in items}.get("microwave") == 1
-
-    def test_svch(self):
-        items = extract_items("свч")
-        assert {i["key"]: i["qty"] for i in items}.get("microwave") == 1
-
-    def test_microwave_price(self):
-        assert ITEM_CATALOG["microwave"] == (30, 60)
-
-    def test_kofemashina(self):
-        items = extract_items("кофемашина")
-        assert {i["key"]: i["qty"] for i in items}.get("coffee_machine") == 1
-
-    def test_coffee_machine_price(self):
-        assert ITEM_CATALOG["coffee_machine"] == (30, 60)
-
-    def test_chaynik(self):
-        items = extract_items("чайник")
-        assert {i["key"]: i["qty"] for i in items}.get("kettle") == 1
-
-    def test_kettle_price(self):
-        assert ITEM_CATALOG["kettle"] == (10, 20)
-
-    def test_mikser(self):
-        items = extract_items("миксер")
-        assert {i["key"]: i["qty"] for i in items}.get("mixer") == 1
-
-    def test_blender(self):
-        items = extract_items("блендер")
-        assert {i["key"]: i["qty"] for i in items}.get("mixer") == 1
-
-    def test_mixer_price(self):
-        assert ITEM_CATALOG["mixer"] == (15, 30)
-
-    def test_sokovyzhimalka(self):
-        items = extract_items("соковыжималка")
-        assert {i["key"]: i["qty"] for i in items}.get("juicer") == 1
-
-    def test_juicer_price(self):
-        assert ITEM_CATALOG["juicer"] == (20, 40)
-
-    def test_posuda(self):
-        items = extract_items("посуда")
-        assert {i["key"]: i["qty"] for i in items}.get("kitchenware") == 1
-
-    def test_kastryuli(self):
-        items = extract_items("кастрюли")
-        assert {i["key"]: i["qty"] for i in items}.get("kitchenware") == 1
-
-    def test_kitchenware_price(self):
-        assert ITEM_CATALOG["kitchenware"] == (40, 80)
-
-    def test_kitchen_not_heavy(self):
-        """Microwave, coffee machine, kettle, mixer, juicer, kitchenware are NOT heavy."""
-        heavy = set(VOLUME_FROM_ITEMS_CONFIG.get("heavy_keys", []))
-        assert "microwave" not in heavy
-        assert "coffee_machine" not in heavy
-        assert "kettle" not in heavy
-        assert "mixer" not in heavy
-        assert "juicer" not in heavy
-        assert "kitchenware" not in heavy
-
-    def test_kitchen_labels(self):
-        assert ITEM_LABELS["dishwasher"]["ru"] == "Посудомойка"
-        assert ITEM_LABELS["microwave"]["ru"] == "Микроволновка"
-        assert ITEM_LABELS["coffee_machine"]["ru"] == "Кофемашина"
-        assert ITEM_LABELS["kettle"]["ru"] == "Чайник"
-        assert ITEM_LABELS["mixer"]["ru"] == "Миксер"
-        assert ITEM_LABELS["juicer"]["ru"] == "Соковыжималка"
-        assert ITEM_LABELS["kitchenware"]["ru"] == "Посуда/утварь"
-
-
-# ===================================================================
-# Catalog Restructuring v3.0: TV stand
-# ===================================================================
-
-
-class TestTvStand:
-    """Verify tv_stand extraction."""
-
-    def test_tumba_pod_televizor(self):
-        """'тумба под телевизор' → tv_stand (not tv_monitor)."""
-        items = extract_items("тумба под телевизор")
-        found = {i["key"]: i["qty"] for i in items}
-        assert found.get("tv_stand") == 1
-        assert "tv_monitor" not in found
-
-    def test_podstavka_pod_televizor(self):
-        items = extract_items("подставка под телевизор")
-        assert {i["key"]: i["qty"] for i in items}.get("tv_stand") == 1
-
-    def test_tv_stand_en(self):
-        items = extract_items("tv stand")
-        assert {i["key"]: i["qty"] for i in items}.get("tv_stand") == 1
-
-    def test_tv_stand_price(self):
-        assert ITEM_CATALOG["tv_stand"] == (60, 120)
-
-    def test_tv_stand_not_heavy(self):
-        heavy = set(VOLUME_FROM_ITEMS_CONFIG.get("heavy_keys", []))
-        assert "tv_stand" not in heavy
-
-    def test_tv_stand_label(self):
-        assert ITEM_LABELS["tv_stand"]["ru"] == "Тумба под ТВ"
-        assert ITEM_LABELS["tv_stand"]["en"] == "TV stand"
-
-    def test_televizor_still_tv_monitor(self):
-        """'телевизор' still maps to tv_monitor (no regression)."""
-        items = extract_items("телевизор")
-        assert {i["key"]: i["qty"] for i in items}.get("tv_monitor") == 1
+_V3_ITEM_ALIAS_CASES = [
+    # Fridge split
+    ("холодильник", "fridge_single_door"),  # default
+    ("большой холодильник", "fridge_double_door"),
+    ("двухдверный холодильник", "fridge_double_door"),
+    ("side by side", "fridge_side_by_side"),
+    ("сайд бай сайд", "fridge_side_by_side"),
+    # Sofa corner
+    ("угловой диван", "sofa_corner"),
+    ("г-образный диван", "sofa_corner"),
+    ("corner sofa", "sofa_corner"),
+    # Wardrobe 4-doors
+    ("большой шкаф", "wardrobe_4_doors"),
+    ("шкаф-купе", "wardrobe_4_doors"),
+    ("шкаф 4 двери", "wardrobe_4_doors"),  # "4" is an attribute, not qty
+    ("large wardrobe", "wardrobe_4_doors"),
+    # Bed with storage
+    ("кровать с ящиками", "bed_with_storage"),
+    ("кровать с подъёмным механизмом", "bed_with_storage"),
+    ("storage bed", "bed_with_storage"),
+    # Exercise split
+    ("беговая дорожка", "treadmill"),
+    ("treadmill", "treadmill"),
+    ("тренажер", "home_gym"),
+    ("home gym", "home_gym"),
+    # Heavy items
+    ("пианино", "piano_upright"),
+    ("рояль", "piano_upright"),
+    ("сейф", "safe_small"),
+    ("большой сейф", "safe_large"),
+    ("мраморный стол", "marble_table"),
+    ("аквариум", "aquarium_large"),
+    ("aquarium", "aquarium_large"),
+    # Kitchen
+    ("посудомойка", "dishwasher"),
+    ("посудомоечная машина", "dishwasher"),
+    ("микроволновка", "microwave"),
+    ("свч", "microwave"),
+    ("кофемашина", "coffee_machine"),
+    ("чайник", "kettle"),
+    ("миксер", "mixer"),
+    ("блендер", "mixer"),
+    ("соковыжималка", "juicer"),
+    ("посуда", "kitchenware"),
+    ("кастрюли", "kitchenware"),
+    # TV stand
+    ("тумба под телевизор", "tv_stand"),  # not tv_monitor
+    ("подставка под телевизор", "tv_stand"),
+    ("tv stand", "tv_stand"),
+    ("телевизор", "tv_monitor"),  # no regression
+]
+
+# (key, price range, heavy, labels)
+_V3_ITEM_CATALOG_CASES = [
+    ("fridge_single_door", (120, 170), True, {"ru": "Холодильник"}),
+    ("fridge_double_door", (180, 250), True, {"en": "Double-door fridge"}),
+    ("fridge_side_by_side", (220, 340), True, {"en": "Side-by-side fridge"}),
+    ("sofa_corner", (180, 270), True, {"ru": "Угловой диван", "he": "ספה פינתית"}),
+    ("wardrobe_4_doors", (220, 340), True, {"ru": "Шкаф (4-двер.)"}),
+    ("bed_with_storage", (150, 220), True, {"ru": "Кровать с ящиками"}),
+    ("treadmill", (70, 140), True, {}),
+    ("home_gym", (120, 240), True, {}),
+    ("piano_upright", (370, 640), True, {"ru": "Пианино"}),
+    ("safe_small", (120, 240), True, {"ru": "Сейф"}),
+    ("safe_large", (220, 440), True, {"ru": "Сейф большой"}),
+    ("marble_table", (150, 270), True, {"ru": "Мраморный стол"}),
+    ("aquarium_large", (120, 240), True, {"ru": "Аквариум"}),
+    ("dishwasher", (100, 140), True, {"ru": "Посудомойка"}),
+    ("microwave", (30, 60), False, {"ru": "Микроволновка"}),
+    ("coffee_machine", (30, 60), False, {"ru": "Кофемашина"}),
+    ("kettle", (10, 20), False, {"ru": "Чайник"}),
+    ("mixer", (15, 30), False, {"ru": "Миксер"}),
+    ("juicer", (20, 40), False, {"ru": "Соковыжималка"}),
+    ("kitchenware", (40, 80), False, {"ru": "Посуда/утварь"}),
+    ("tv_stand", (60, 120), False, {"ru": "Тумба под ТВ", "en": "TV stand"}),
+]
+
+
+class TestCatalogV3Items:
+    """Verify the v3.0 split/added items are recognised, priced and labelled."""
+
+    @pytest.mark.parametrize("text, key", _V3_ITEM_ALIAS_CASES)
+    def test_alias_recognised(self, text, key):
+        assert extract_items(text, as_dict=True) == {key: 1}
+
+    @pytest.mark.parametrize(
+        "key, price_range, heavy, labels", _V3_ITEM_CATALOG_CASES,
+        ids=[case[0] for case in _V3_ITEM_CATALOG_CASES],
+    )
+    def test_catalog_entry(self, key, price_range, heavy, labels):
+        assert ITEM_CATALOG[key] == price_range
+        assert (key in HEAVY_ITEM_KEYS) is heavy
+        for lang, label in labels.items():
+            assert ITEM_LABELS[key][lang] == label
 
 
 # ===================================================================
@@ -6310,51 +5771,42 @@ class TestDimensionSanitization:
 
     def test_extract_sofa_with_dimensions_latin(self):
         """'Диван 230x150x66 см' → sofa qty=1, NOT qty=230."""
-        items = extract_items("Диван 230x150x66 см")
-        found = {i["key"]: i["qty"] for i in items}
+        found = extract_items("Диван 230x150x66 см", as_dict=True)
         assert found.get("sofa_large_3_seat") == 1
 
     def test_extract_sofa_with_dimensions_cyrillic(self):
         """'Диван 230х150х66 см' (Cyrillic х) → sofa qty=1."""
-        items = extract_items("Диван 230х150х66 см")
-        found = {i["key"]: i["qty"] for i in items}
+        found = extract_items("Диван 230х150х66 см", as_dict=True)
         assert found.get("sofa_large_3_seat") == 1
 
     def test_extract_wardrobe_with_dimensions(self):
         """'Шкаф 200x90x50 см' → wardrobe qty=1."""
-        items = extract_items("Шкаф 200x90x50 см")
-        found = {i["key"]: i["qty"] for i in items}
+        found = extract_items("Шкаф 200x90x50 см", as_dict=True)
         assert found.get("wardrobe_3_doors") == 1
 
     def test_extract_multiple_items_with_dimensions(self):
         """Multiple items with dimensions — all extract correctly."""
-        text = "Диван 230x150x66 см, 2 кресла, стол 120x80 см"
-        items = extract_items(text)
-        found = {i["key"]: i["qty"] for i in items}
+        found = extract_items("Диван 230x150x66 см, 2 кресла, стол 120x80 см", as_dict=True)
         assert found.get("sofa_large_3_seat") == 1
         assert found.get("armchair") == 2
         assert found.get("dining_table") == 1
 
     def test_qty_prefix_still_works_with_dimensions(self):
         """'2 шкафа 200x90x50 см' → wardrobe qty=2."""
-        items = extract_items("2 шкафа 200x90x50 см")
-        found = {i["key"]: i["qty"] for i in items}
+        found = extract_items("2 шкафа 200x90x50 см", as_dict=True)
         assert found.get("wardrobe_3_doors") == 2
 
     def test_explicit_qty_x_still_works(self):
         """'5x шкаф' (explicit qty) still works after sanitization."""
-        items = extract_items("5x шкаф")
-        found = {i["key"]: i["qty"] for i in items}
+        found = extract_items("5x шкаф", as_dict=True)
         assert found.get("wardrobe_3_doors") == 5
 
     def test_dimension_with_multiplication_sign(self):
         """'Стол 120×80×75 см' (× sign) → table qty=1."""
-        items = extract_items("Стол 120×80×75 см")
-        found = {i["key"]: i["qty"] for i in items}
+        found = extract_items("Стол 120×80×75 см", as_dict=True)
         assert found.get("dining_table") == 1
 
     def test_no_regression_on_single_dimension(self):
         """'Шкаф 200см' (single dimension, no x) is handled by _ATTR_SUFFIXES."""
-        items = extract_items("Шкаф 200см")
-        found = {i["key"]: i["qty"] for i in items}
+        found = extract_items("Шкаф 200см", as_dict=True)
         assert found.get("wardrobe_3_doors") == 1
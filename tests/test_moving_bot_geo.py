@@ -60,6 +60,17 @@ class TestHaversineKm:
         d2 = haversine_km(32.080, 34.780, 32.794, 34.989)
         assert abs(d1 - d2) < 0.001
 
+    def test_from_haifa_matches_generic(self):
+        from app.core.bots.moving_bot_v1.geo import _haversine_from_haifa
+        for lat, lon in [(32.080, 34.780), (32.700, 35.300), (29.557, 34.952)]:
+            assert _haversine_from_haifa(lat, lon) == pytest.approx(
+                haversine_km(HAIFA_CENTER_LAT, HAIFA_CENTER_LON, lat, lon), abs=1e-9,
+            )
+
+    def test_antipodal_points(self):
+        """Half the Earth's circumference; no domain error at a == 1."""
+        assert haversine_km(0.0, 0.0, 0.0, 180.0) == pytest.approx(20015.09, abs=0.01)
+
 
 # ============================================================================
 # TestClassifyPoint
@@ -114,6 +125,7 @@ class TestClassifyPoint:
         assert isinstance(cls, RegionClassification)
         with pytest.raises(AttributeError):
             cls.inside_metro = False  # frozen
+        assert not hasattr(cls, "__dict__")  # slotted
 
     def test_distance_km_is_rounded(self):
         cls = classify_point(32.800, 35.000)
@@ -193,6 +205,16 @@ class TestClassifyGeoPoints:
         factor, info = classify_geo_points(geo)
         assert set(info.keys()) == {"pickup_1", "pickup_2", "delivery"}
 
+    def test_matches_classify_point(self):
+        geo = {
+            "pickup_1": {"lat": 32.833, "lon": 35.085},
+            "pickup_2": {"lat": 32.700, "lon": 35.300},
+            "delivery": {"lat": 32.080, "lon": 34.780},
+        }
+        _, info = classify_geo_points(geo)
+        for key, pt in geo.items():
+            assert info[key] == classify_point(pt["lat"], pt["lon"])
+
 
 # ============================================================================
 # Phase 14: Text-based route classification
@@ -364,6 +386,16 @@ class TestClassifyRoute:
         assert cls.from_locality is None
         assert cls.to_locality is None
 
+    def test_region_pair_table_matches_rules(self):
+        """Precomputed bands agree with the rules for every dataset region."""
+        from app.core.bots.moving_bot_geo import _REGION_PAIR_BANDS, _region_pair_band
+        from app.core.bots.moving_bot_localities import LOCALITIES
+        regions = {loc.region for loc in LOCALITIES}
+        for a in regions:
+            for b in regions:
+                band = _REGION_PAIR_BANDS.get((a, b), RouteBand.INTER_REGION_SHORT)
+                assert band == _region_pair_band(a, b), (a, b)
+
     # --- result structure ---
 
     def test_result_has_region_codes(self):
@@ -6,6 +6,17 @@ from unittest.mock import patch, AsyncMock, MagicMock
 
 import pytest
 
+from app.infra.logging_config import mask_coordinates
+from app.infra.notification_service import (
+    _format_extras,
+    format_lead_message,
+    _format_time_window,
+    _mask_phone,
+    _MediaDelivery,
+    notify_operator,
+    _send_twilio_message,
+)
+
 
 # ============================================================================
 # _format_extras
@@ -13,31 +24,25 @@ import pytest
 
 class TestFormatExtras:
     def test_none_returns_net(self):
-        from app.infra.notification_service import _format_extras
         assert _format_extras(None) == "нет"
 
     def test_empty_list(self):
-        from app.infra.notification_service import _format_extras
         # Empty list should return "нет"
         assert _format_extras([]) == "нет"
 
     def test_single_known_extra(self):
-        from app.infra.notification_service import _format_extras
         assert _format_extras(["loaders"]) == "грузчики"
 
     def test_multiple_known_extras(self):
-        from app.infra.notification_service import _format_extras
         result = _format_extras(["loaders", "assembly"])
         assert "грузчики" in result
         assert "сборка/разборка" in result
 
     def test_unknown_extra_passthrough(self):
-        from app.infra.notification_service import _format_extras
         result = _format_extras(["custom_service"])
         assert result == "custom_service"
 
     def test_none_value_filtered(self):
-        from app.infra.notification_service import _format_extras
         # "none" should be filtered out
         result = _format_extras(["none"])
         assert result == ""  # Only "none" was filtered
@@ -49,58 +54,48 @@ class TestFormatExtras:
 
 class TestFormatTimeWindow:
     def test_today(self):
-        from app.infra.notification_service import _format_time_window
         result = _format_time_window("today")
         assert "сегодня" in result
         # Should contain date in DD/MM/YYYY format
         assert "/" in result
 
     def test_tomorrow(self):
-        from app.infra.notification_service import _format_time_window
         result = _format_time_window("tomorrow")
         assert result == "завтра"
 
     def test_soon(self):
-        from app.infra.notification_service import _format_time_window
         result = _format_time_window("soon")
         assert result == "в ближайшие дни"
 
     def test_unknown_passthrough(self):
-        from app.infra.notification_service import _format_time_window
         result = _format_time_window("next_week")
         assert result == "next_week"
 
     def test_none_returns_default(self):
-        from app.infra.notification_service import _format_time_window
         result = _format_time_window(None)
         assert result == "не указано"
 
     # Phase 2: new time slot values
     def test_morning(self):
-        from app.infra.notification_service import _format_time_window
         result = _format_time_window("morning")
         assert "утро" in result
         assert "08:00" in result
 
     def test_afternoon(self):
-        from app.infra.notification_service import _format_time_window
         result = _format_time_window("afternoon")
         assert "день" in result
         assert "12:00" in result
 
     def test_evening(self):
-        from app.infra.notification_service import _format_time_window
         result = _format_time_window("evening")
         assert "вечер" in result
         assert "16:00" in result
 
     def test_flexible(self):
-        from app.infra.notification_service import _format_time_window
         result = _format_time_window("flexible")
         assert "не определено" in result
 
     def test_exact_time_format(self):
-        from app.infra.notification_service import _format_time_window
         result = _format_time_window("exact:14:30")
         assert "14:30" in result
         assert "точное время" in result
@@ -112,7 +107,6 @@ class TestFormatTimeWindow:
 
 class TestFormatLeadMessage:
     def test_basic_payload(self):
-        from app.infra.notification_service import format_lead_message
         payload = {
             "cargo_description": "Диван",
             "addresses": "ул. Ленина 5 → пр. Мира 10",
@@ -125,7 +119,6 @@ class TestFormatLeadMessage:
         assert "+79991234567" in result
 
     def test_payload_with_sender_name(self):
-        from app.infra.notification_service import format_lead_message
         payload = {
             "cargo_description": "Стол",
             "custom": {"sender_name": "Ivan Petrov (@ivan)"},
@@ -136,14 +129,12 @@ class TestFormatLeadMessage:
         assert "12345" not in result
 
     def test_payload_with_whatsapp_chat_id(self):
-        from app.infra.notification_service import format_lead_message
         payload = {"cargo_description": "Кресло"}
         result = format_lead_message("whatsapp:+79990001122", payload)
         assert "+79990001122" in result
         assert "whatsapp:" not in result
 
     def test_payload_with_addr_from_to(self):
-        from app.infra.notification_service import format_lead_message
         payload = {
             "cargo_description": "Шкаф",
             "addr_from": "ул. Мира 1",
@@ -158,7 +149,6 @@ class TestFormatLeadMessage:
         assert "этаж: 5" in result
 
     def test_payload_with_photos(self):
-        from app.infra.notification_service import format_lead_message
         payload = {
             "cargo_description": "Коробки",
             "photo_count": 3,
@@ -167,7 +157,6 @@ class TestFormatLeadMessage:
         assert "3 шт" in result
 
     def test_payload_with_details(self):
-        from app.infra.notification_service import format_lead_message
         payload = {
             "cargo_description": "Вещи",
             "details_free": "Осторожно, хрупкое",
@@ -176,7 +165,6 @@ class TestFormatLeadMessage:
         assert "Осторожно, хрупкое" in result
 
     def test_minimal_payload(self):
-        from app.infra.notification_service import format_lead_message
         payload = {}
         result = format_lead_message("+79990001122", payload)
         # Should have defaults
@@ -184,7 +172,6 @@ class TestFormatLeadMessage:
         assert "Новая заявка" in result
 
     def test_nested_data_key(self):
-        from app.infra.notification_service import format_lead_message
         payload = {
             "data": {
                 "cargo_description": "Пианино",
@@ -197,7 +184,6 @@ class TestFormatLeadMessage:
 
     def test_payload_with_move_date(self):
         """Phase 2: move_date from custom dict is included in date line."""
-        from app.infra.notification_service import format_lead_message
         payload = {
             "cargo_description": "Стол",
             "time_window": "morning",
@@ -209,7 +195,6 @@ class TestFormatLeadMessage:
 
     def test_payload_with_exact_time(self):
         """Phase 2: exact:HH:MM format in time_window."""
-        from app.infra.notification_service import format_lead_message
         payload = {
             "cargo_description": "Коробки",
             "time_window": "exact:14:30",
@@ -223,7 +208,6 @@ class TestFormatLeadMessage:
     # Phase 3: pricing estimate in notification
     def test_payload_with_estimate(self):
         """Phase 3: estimate range shown in notification."""
-        from app.infra.notification_service import format_lead_message
         payload = {
             "cargo_description": "Шкаф и диван",
             "time_window": "morning",
@@ -241,7 +225,6 @@ class TestFormatLeadMessage:
 
     def test_payload_without_estimate(self):
         """Phase 3: no estimate → no estimate line."""
-        from app.infra.notification_service import format_lead_message
         payload = {
             "cargo_description": "Коробки",
             "custom": {},
@@ -251,7 +234,6 @@ class TestFormatLeadMessage:
 
     def test_debug_estimate_enabled(self):
         """When operator_estimate_debug=True and breakdown exists, append debug section."""
-        from app.infra.notification_service import format_lead_message
         from unittest.mock import patch, MagicMock
         mock_settings = MagicMock()
         mock_settings.operator_estimate_debug = True
@@ -290,7 +272,6 @@ class TestFormatLeadMessage:
 
     def test_debug_estimate_disabled(self):
         """When operator_estimate_debug=False, no debug section even with breakdown."""
-        from app.infra.notification_service import format_lead_message
         from unittest.mock import patch, MagicMock
         mock_settings = MagicMock()
         mock_settings.operator_estimate_debug = False
@@ -322,7 +303,6 @@ class TestFormatLeadMessage:
 
     def test_debug_estimate_with_complexity(self):
         """When complexity is active, debug shows triggers and guards."""
-        from app.infra.notification_service import format_lead_message
         from unittest.mock import patch, MagicMock
         mock_settings = MagicMock()
         mock_settings.operator_estimate_debug = True
@@ -356,7 +336,6 @@ class TestFormatLeadMessage:
 
     def test_debug_estimate_no_breakdown_in_custom(self):
         """If estimate_breakdown is missing, no debug section even when enabled."""
-        from app.infra.notification_service import format_lead_message
         from unittest.mock import patch, MagicMock
         mock_settings = MagicMock()
         mock_settings.operator_estimate_debug = True
@@ -378,22 +357,18 @@ class TestFormatLeadMessage:
 
 class TestMaskPhone:
     def test_normal_phone(self):
-        from app.infra.notification_service import _mask_phone
         result = _mask_phone("+79991234567")
         assert result.startswith("+799")
         assert result.endswith("4567")
         assert "***" in result
 
     def test_short_phone(self):
-        from app.infra.notification_service import _mask_phone
         assert _mask_phone("12345") == "***"
 
     def test_empty_phone(self):
-        from app.infra.notification_service import _mask_phone
         assert _mask_phone("") == "***"
 
     def test_whatsapp_prefix(self):
-        from app.infra.notification_service import _mask_phone
         result = _mask_phone("whatsapp:+79991234567")
         assert "whatsapp" not in result
         assert "***" in result
@@ -403,18 +378,15 @@ class TestMaskCoordinates:
     """Test GPS coordinate masking for logs."""
 
     def test_masks_precision(self):
-        from app.infra.logging_config import mask_coordinates
         result = mask_coordinates(32.794, 34.989)
         assert result == "32.8**, 35.0**"
 
     def test_does_not_expose_full_coords(self):
-        from app.infra.logging_config import mask_coordinates
         result = mask_coordinates(32.81144, 34.99792)
         assert "32.811" not in result
         assert "34.997" not in result
 
     def test_negative_coords(self):
-        from app.infra.logging_config import mask_coordinates
         result = mask_coordinates(-33.8688, 151.2093)
         assert result == "-33.9**, 151.2**"
 
@@ -429,7 +401,6 @@ class TestNotifyOperatorTenantAware:
     @pytest.mark.asyncio
     async def test_notify_operator_passes_tenant_id(self, monkeypatch):
         """tenant_id flows through to get_notification_channel."""
-        from app.infra.notification_service import notify_operator
 
         monkeypatch.setattr("app.config.settings.operator_notifications_enabled", True)
         monkeypatch.setattr("app.config.settings.operator_notification_channel", "whatsapp")
@@ -440,7 +411,6 @@ class TestNotifyOperatorTenantAware:
         mock_channel.name = "whatsapp"
         mock_channel.send = AsyncMock(return_value=True)
 
-        from app.infra.notification_service import _MediaDelivery
         empty_delivery = _MediaDelivery(inline_photo_urls=[], link_lines=[])
 
         with patch(
@@ -465,7 +435,6 @@ class TestNotifyOperatorTenantAware:
     @pytest.mark.asyncio
     async def test_notify_operator_tenant_disabled(self, monkeypatch):
         """Tenant with operator_notifications_enabled=False → skipped."""
-        from app.infra.notification_service import notify_operator
         from app.infra.tenant_registry import TenantContext, reset_cache
         import app.infra.tenant_registry as reg
 
@@ -493,7 +462,6 @@ class TestNotifyOperatorTenantAware:
     @pytest.mark.asyncio
     async def test_notify_operator_fallback_global(self, monkeypatch):
         """No tenant config → uses settings.* (global fallback)."""
-        from app.infra.notification_service import notify_operator
 
         monkeypatch.setattr("app.config.settings.operator_notifications_enabled", True)
         monkeypatch.setattr("app.config.settings.operator_notification_channel", "whatsapp")
@@ -504,7 +472,6 @@ class TestNotifyOperatorTenantAware:
         mock_channel.name = "whatsapp"
         mock_channel.send = AsyncMock(return_value=True)
 
-        from app.infra.notification_service import _MediaDelivery
         empty_delivery = _MediaDelivery(inline_photo_urls=[], link_lines=[])
 
         with patch(
@@ -535,7 +502,6 @@ class TestMultiPickupNotification:
 
     def test_single_pickup_unchanged(self):
         """Single pickup (no pickups in custom or len<=1) → old format."""
-        from app.infra.notification_service import format_lead_message
         payload = {
             "cargo_description": "Диван",
             "addr_from": "Хайфа, Герцль 10",
@@ -555,7 +521,6 @@ class TestMultiPickupNotification:
 
     def test_two_pickups_multiline(self):
         """2 pickups → multi-line format with numbered pickups."""
-        from app.infra.notification_service import format_lead_message
         payload = {
             "cargo_description": "Шкаф",
             "addr_from": "Хайфа, Герцль 10",
@@ -580,7 +545,6 @@ class TestMultiPickupNotification:
 
     def test_three_pickups_multiline(self):
         """3 pickups → multi-line format."""
-        from app.infra.notification_service import format_lead_message
         payload = {
             "cargo_description": "Коробки",
             "addr_from": "Хайфа, Герцль 10",
@@ -604,7 +568,6 @@ class TestMultiPickupNotification:
 
     def test_no_pickups_in_custom_uses_old_format(self):
         """No pickups key in custom → old format (backward compat)."""
-        from app.infra.notification_service import format_lead_message
         payload = {
             "cargo_description": "Стол",
             "addr_from": "ул. Мира 1",
@@ -618,7 +581,6 @@ class TestMultiPickupNotification:
 
     def test_multi_pickup_with_estimate(self):
         """Multi-pickup + estimate both show in notification."""
-        from app.infra.notification_service import format_lead_message
         payload = {
             "cargo_description": "Диван",
             "addr_from": "Хайфа, Герцль 10",
@@ -649,7 +611,6 @@ class TestGeoPointNotification:
     """Test notification formatting with geo points."""
 
     def test_geo_points_shown_as_map_links(self):
-        from app.infra.notification_service import format_lead_message
         payload = {
             "cargo_description": "Диван",
             "addr_from": "📍 32.79400, 34.98900",
@@ -670,7 +631,6 @@ class TestGeoPointNotification:
         assert "34.989" in result
 
     def test_no_geo_points_no_section(self):
-        from app.infra.notification_service import format_lead_message
         payload = {
             "cargo_description": "Стол",
             "addr_from": "Хайфа, Герцль 10",
@@ -683,7 +643,6 @@ class TestGeoPointNotification:
 
     def test_mixed_geo_and_text(self):
         """One pickup with geo, delivery with text → only pickup geo shown."""
-        from app.infra.notification_service import format_lead_message
         payload = {
             "cargo_description": "Шкаф",
             "addr_from": "📍 32.79400, 34.98900",
@@ -704,7 +663,6 @@ class TestGeoPointNotification:
 
     def test_multiple_geo_points(self):
         """Multiple geo points: pickup + delivery."""
-        from app.infra.notification_service import format_lead_message
         payload = {
             "cargo_description": "Коробки",
             "addr_from": "📍 32.79400, 34.98900",
@@ -731,7 +689,6 @@ class TestGeoWithAddress:
 
     def test_geo_with_address_shows_address_and_link(self):
         """Geocoded address appears above map link."""
-        from app.infra.notification_service import format_lead_message
         payload = {
             "cargo_description": "Диван",
             "addr_from": "📍 Herzl 10, Haifa",
@@ -753,7 +710,6 @@ class TestGeoWithAddress:
 
     def test_geo_with_name_shows_name_and_link(self):
         """Name from adapter (e.g. Telegram venue) shown above map link."""
-        from app.infra.notification_service import format_lead_message
         payload = {
             "cargo_description": "Стол",
             "addr_from": "📍 Haifa Port",
@@ -774,7 +730,6 @@ class TestGeoWithAddress:
 
     def test_geo_without_address_shows_link_only(self):
         """No address/name → only map link (backward compat)."""
-        from app.infra.notification_service import format_lead_message
         payload = {
             "cargo_description": "Коробки",
             "addr_from": "📍 32.79400, 34.98900",
@@ -796,7 +751,6 @@ class TestGeoWithAddress:
 
     def test_mixed_geo_with_and_without_address(self):
         """Pickup has address, delivery doesn't → mixed display."""
-        from app.infra.notification_service import format_lead_message
         payload = {
             "cargo_description": "Шкаф",
             "addr_from": "📍 Herzl 10, Haifa",
@@ -827,7 +781,6 @@ class TestRegionNotification:
 
     def test_inside_metro_label(self):
         """All inside metro -> shows metro label."""
-        from app.infra.notification_service import format_lead_message
         payload = {
             "cargo_description": "Диван",
             "custom": {
@@ -843,7 +796,6 @@ class TestRegionNotification:
 
     def test_outside_metro_warning(self):
         """Any outside metro -> shows warning."""
-        from app.infra.notification_service import format_lead_message
         payload = {
             "cargo_description": "Шкаф",
             "custom": {
@@ -858,7 +810,6 @@ class TestRegionNotification:
 
     def test_no_region_info_no_line(self):
         """No region_classifications -> no region line at all."""
-        from app.infra.notification_service import format_lead_message
         payload = {"cargo_description": "Стол", "custom": {}}
         result = format_lead_message("+79990001122", payload)
         assert "Зона" not in result
@@ -1143,6 +1094,31 @@ class TestGetNotificationChannelFactory:
         assert isinstance(ch, WhatsAppChannel)
         assert ch._provider == "twilio"
 
+    def test_factory_reuses_channel_for_same_config(self, monkeypatch):
+        from app.infra.notification_channels import get_notification_channel
+        from app.infra.tenant_registry import TenantContext, reset_cache
+        import app.infra.tenant_registry as reg
+
+        monkeypatch.setattr("app.config.settings.operator_notifications_enabled", True)
+        monkeypatch.setattr("app.config.settings.operator_notification_channel", "whatsapp")
+        monkeypatch.setattr("app.config.settings.operator_whatsapp", "+972501234567")
+        monkeypatch.setattr("app.config.settings.operator_whatsapp_provider", "twilio")
+
+        first = get_notification_channel(tenant_id=None)
+        assert get_notification_channel(tenant_id=None) is first
+
+        # A tenant override still resolves to its own channel
+        reg._cache = {
+            "meta_tenant": TenantContext(
+                "meta_tenant", "Meta Op", True,
+                config={"operator_whatsapp_provider": "meta"},
+            ),
+        }
+        ch = get_notification_channel(tenant_id="meta_tenant")
+        assert ch is not first
+        assert ch._provider == "meta"
+        reset_cache()
+
 
 # ============================================================================
 # Phase 4: Operational Hardening — Meta retry & error classification
@@ -1274,7 +1250,6 @@ class TestTwilioTemplateFallback:
     @pytest.mark.asyncio
     async def test_63016_triggers_template_fallback(self, monkeypatch):
         """Error 63016 → falls back to content template with content_sid."""
-        from app.infra.notification_service import _send_twilio_message
 
         monkeypatch.setattr("app.config.settings.twilio_phone_number", "whatsapp:+15551234567")
         monkeypatch.setattr("app.config.settings.tenant_id", "test_t")
@@ -1315,7 +1290,6 @@ class TestTwilioTemplateFallback:
     @pytest.mark.asyncio
     async def test_63016_no_template_sid_returns_true(self, monkeypatch):
         """Error 63016 + no TWILIO_CONTENT_SID → returns True (stops retries)."""
-        from app.infra.notification_service import _send_twilio_message
 
         monkeypatch.setattr("app.config.settings.twilio_phone_number", "whatsapp:+15551234567")
         monkeypatch.setattr("app.config.settings.tenant_id", "test_t")
@@ -1339,7 +1313,6 @@ class TestTwilioTemplateFallback:
     @pytest.mark.asyncio
     async def test_63016_photo_only_skipped(self, monkeypatch):
         """Error 63016 on photo-only message → skip template, return True."""
-        from app.infra.notification_service import _send_twilio_message
 
         monkeypatch.setattr("app.config.settings.twilio_phone_number", "whatsapp:+15551234567")
         monkeypatch.setattr("app.config.settings.tenant_id", "test_t")
@@ -1363,7 +1336,6 @@ class TestTwilioTemplateFallback:
     @pytest.mark.asyncio
     async def test_63016_template_also_fails(self, monkeypatch):
         """Error 63016 → template fallback also fails → returns False."""
-        from app.infra.notification_service import _send_twilio_message
 
         monkeypatch.setattr("app.config.settings.twilio_phone_number", "whatsapp:+15551234567")
         monkeypatch.setattr("app.config.settings.tenant_id", "test_t")
@@ -1392,7 +1364,6 @@ class TestTwilioTemplateFallback:
     @pytest.mark.asyncio
     async def test_non_63016_unchanged(self, monkeypatch):
         """Non-63016 errors still follow existing retry path (return False)."""
-        from app.infra.notification_service import _send_twilio_message
 
         monkeypatch.setattr("app.config.settings.twilio_phone_number", "whatsapp:+15551234567")
         monkeypatch.setattr("app.config.settings.tenant_id", "test_t")
@@ -1414,7 +1385,6 @@ class TestTwilioTemplateFallback:
     @pytest.mark.asyncio
     async def test_template_vars_populated(self, monkeypatch):
         """notify_operator() populates template_vars in notification metadata."""
-        from app.infra.notification_service import notify_operator
 
         monkeypatch.setattr("app.config.settings.operator_notifications_enabled", True)
         monkeypatch.setattr("app.config.settings.operator_notification_channel", "whatsapp")
@@ -1445,7 +1415,6 @@ class TestTwilioTemplateFallback:
             }
         }
 
-        from app.infra.notification_service import _MediaDelivery
         empty_delivery = _MediaDelivery(inline_photo_urls=[], link_lines=[])
 
         with patch("app.infra.notification_channels.get_notification_channel", return_value=mock_channel):
@@ -1473,28 +1442,24 @@ class TestVideoNotificationDisplay:
     """format_lead_message() must distinguish photos from videos."""
 
     def test_photo_only_display(self):
-        from app.infra.notification_service import format_lead_message
         payload = {"photo_count": 3}
         result = format_lead_message("+79990001122", payload)
         assert "📷 Фото: 3 шт." in result
         assert "Видео" not in result
 
     def test_video_only_display(self):
-        from app.infra.notification_service import format_lead_message
         payload = {"photo_count": 0, "video_count": 2}
         result = format_lead_message("+79990001122", payload)
         assert "🎥 Видео: 2 шт." in result
         assert "📷 Фото" not in result
 
     def test_photo_and_video_display(self):
-        from app.infra.notification_service import format_lead_message
         payload = {"photo_count": 1, "video_count": 1}
         result = format_lead_message("+79990001122", payload)
         assert "📷 Фото: 1 шт." in result
         assert "🎥 Видео: 1 шт." in result
 
     def test_no_media_no_line(self):
-        from app.infra.notification_service import format_lead_message
         payload = {"photo_count": 0}
         result = format_lead_message("+79990001122", payload)
         assert "Фото" not in result
@@ -1505,13 +1470,11 @@ class TestMediaDeliveryAccurateCounts:
     """_MediaDelivery carries accurate photo_count and video_count."""
 
     def test_delivery_default_counts(self):
-        from app.infra.notification_service import _MediaDelivery
         d = _MediaDelivery(inline_photo_urls=[], link_lines=[])
         assert d.photo_count == 0
         assert d.video_count == 0
 
     def test_delivery_with_counts(self):
-        from app.infra.notification_service import _MediaDelivery
         d = _MediaDelivery(
             inline_photo_urls=["url1"],
             link_lines=["  🎥 Видео: url2"],
@@ -1528,7 +1491,6 @@ class TestNotifyOperatorAlwaysFetchesMedia:
     @pytest.mark.asyncio
     async def test_video_only_media_fetched(self, monkeypatch):
         """Even with photo_count=0, _get_media_for_lead is called and video links appear."""
-        from app.infra.notification_service import notify_operator, _MediaDelivery
 
         monkeypatch.setattr("app.config.settings.operator_notifications_enabled", True)
         monkeypatch.setattr("app.config.settings.operator_notification_channel", "whatsapp")
@@ -1579,7 +1541,6 @@ class TestNotifyOperatorAlwaysFetchesMedia:
     @pytest.mark.asyncio
     async def test_photo_and_video_counts_injected(self, monkeypatch):
         """notify_operator injects accurate photo/video counts from delivery into payload."""
-        from app.infra.notification_service import notify_operator, _MediaDelivery
 
         monkeypatch.setattr("app.config.settings.operator_notifications_enabled", True)
         monkeypatch.setattr("app.config.settings.operator_notification_channel", "whatsapp")
@@ -1294,6 +1294,19 @@ class TestFormatCrewMessage:
         assert "תאריך:" in result
         assert "נפח:" in result
 
+    def test_catalog_item_labels_localized(self, monkeypatch):
+        """Catalog keys use ITEM_LABELS; unknown keys fall back to the key."""
+        monkeypatch.setattr("app.config.settings.operator_lead_target_lang", "ru")
+        from app.core.bots.moving_bot_pricing import ITEM_LABELS
+        from app.infra.notification_service import format_crew_message
+        payload = self._base_payload(**{"custom.cargo_items": [
+            {"key": "armchair", "qty": 2},
+            {"key": "sofa", "qty": 1},
+        ]})
+        result = format_crew_message("lead-abc123", payload)
+
+        assert f"{ITEM_LABELS['armchair']['ru']} ×2, Sofa" in result
+
 
 class TestCrewMessageMultiPickup:
     """EPIC D3: Multi-pickup route and floors rendering in crew message."""